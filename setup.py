@@ -70,6 +70,15 @@ setup(
     long_description=open('README.md').read(),
     long_description_content_type='text/markdown',
     extras_require={
+        'http2': [
+            'httpx[http2]'
+        ],
+        'prometheus': [
+            'prometheus_client'
+        ],
+        'opentelemetry': [
+            'opentelemetry-api'
+        ],
         'test': [
             'coverage',
             'coveralls',
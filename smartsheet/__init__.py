@@ -33,5 +33,13 @@ except ImportError:
 
 from .smartsheet import (AbstractUserCalcBackoff, Smartsheet,  # NOQA
                          fresh_operation)
+from .audit import SharingAudit  # NOQA
+from .pool import SmartsheetPool  # NOQA
+from .metrics import AbstractMetricsHook  # NOQA
+from .profiler import Profiler  # NOQA
+from .hedging import HedgingPolicy  # NOQA
+from .ratelimit import RateLimiter, SqliteRateLimitStore  # NOQA
+from .retry import CircuitBreaker, RetryBudget, RetryPolicy  # NOQA
+from .scheduler import PriorityClass, RequestScheduler  # NOQA
 
 from . import models
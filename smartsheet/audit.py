@@ -0,0 +1,238 @@
+# pylint: disable=C0111,R0902,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import collections
+import csv
+import json
+import logging
+import os.path
+
+from .exceptions import ApiError
+from .models import Error
+from .models.enums import AccessLevel
+from .util import bounded_map
+
+AUDITED_TYPES = ("sheet", "report", "sight", "workspace")
+
+ShareRecord = collections.namedtuple(
+    "ShareRecord",
+    [
+        "object_type",
+        "object_id",
+        "principal_type",
+        "principal_id",
+        "email",
+        "access_level",
+        "scope",
+    ],
+)
+ShareRecord.__doc__ = """One share of an audited object.
+
+`principal_type` is USER or GROUP and `principal_id` the user or group id,
+`scope` is ITEM for a direct share or WORKSPACE for one inherited from the
+workspace holding the object."""
+
+
+def _rank(access_level):
+    return AccessLevel[access_level].value
+
+
+def _name(enumerated):
+    return None if enumerated.value is None else enumerated.value.name
+
+
+def _object_key(obj):
+    if hasattr(obj, "parent_id"):
+        return obj.type, obj.id
+    return tuple(obj)
+
+
+class SharingAudit:
+
+    """Collect the shares of many sheets, reports, sights and workspaces
+    into one table and index it by object and by principal.
+
+    Shares are fetched `max_workers` objects at a time; rate limit errors
+    are retried by the client as for any other request. With a
+    `checkpoint` file, every audited object is appended to it as soon as its
+    shares are fetched and objects already in the file are skipped, so an
+    interrupted audit resumes where it stopped.
+    """
+
+    def __init__(
+        self,
+        smartsheet_obj,
+        max_workers=8,
+        include_workspace_shares=True,
+        checkpoint=None,
+    ):
+        """
+        Args:
+            smartsheet_obj (smartsheet.Smartsheet): Client making the requests.
+            max_workers (int): The number of objects audited concurrently.
+            include_workspace_shares (bool): Also record the shares objects
+                inherit from their workspace.
+            checkpoint (str): Path of a JSON lines file recording progress.
+        """
+        self._base = smartsheet_obj
+        self._log = logging.getLogger(__name__)
+        self._max_workers = max_workers
+        self._include_workspace_shares = include_workspace_shares
+        self._checkpoint = checkpoint
+        self.records = []
+        self.errors = []
+        self._done = set()
+        self._by_object = collections.defaultdict(list)
+        self._by_principal = collections.defaultdict(list)
+        if checkpoint is not None and os.path.exists(checkpoint):
+            with open(checkpoint, encoding="utf-8") as file:
+                for line in file:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._add(
+                            entry["type"],
+                            entry["id"],
+                            [ShareRecord(*record) for record in entry["shares"]],
+                        )
+
+    def run(self, objects):
+        """Audit the given objects.
+
+        Args:
+            objects: (type, id) pairs, or IndexEntry from `Home.crawl`.
+                Objects whose type is not in `AUDITED_TYPES` are skipped.
+
+        Returns:
+            SharingAudit: self, for chaining queries.
+        """
+        keys = (
+            key
+            for key in map(_object_key, objects)
+            if key[0] in AUDITED_TYPES and key not in self._done
+        )
+        checkpoint = None
+        if self._checkpoint is not None:
+            checkpoint = open(self._checkpoint, "a", encoding="utf-8")
+        try:
+            for obj_type, obj_id, shares in bounded_map(
+                self._fetch, keys, self._max_workers
+            ):
+                if isinstance(shares, Error):
+                    self._log.warning(
+                        "Cannot audit %s %s: %s",
+                        obj_type,
+                        obj_id,
+                        shares.result.message,
+                    )
+                    self.errors.append(((obj_type, obj_id), shares))
+                    continue
+                self._add(obj_type, obj_id, shares)
+                if checkpoint is not None:
+                    checkpoint.write(
+                        json.dumps({"type": obj_type, "id": obj_id, "shares": shares})
+                        + "\n"
+                    )
+                    checkpoint.flush()
+        finally:
+            if checkpoint is not None:
+                checkpoint.close()
+        return self
+
+    def who_can(self, object_type, object_id, access_level="VIEWER"):
+        """Shares granting at least `access_level` on an object.
+
+        Returns:
+            list[ShareRecord]
+        """
+        minimum = _rank(access_level)
+        return [
+            record
+            for record in self._by_object.get((object_type, object_id), [])
+            if _rank(record.access_level) >= minimum
+        ]
+
+    def what_can(self, principal_id, access_level="VIEWER"):
+        """Shares granting a user or group at least `access_level`.
+
+        Access granted to a user through the groups they belong to is listed
+        under the group's id.
+
+        Args:
+            principal_id: User id, group id or email address.
+
+        Returns:
+            list[ShareRecord]
+        """
+        if isinstance(principal_id, str):
+            principal_id = principal_id.lower()
+        minimum = _rank(access_level)
+        return [
+            record
+            for record in self._by_principal.get(principal_id, [])
+            if _rank(record.access_level) >= minimum
+        ]
+
+    def to_csv(self, file):
+        """Write the share table as CSV to a file object."""
+        writer = csv.writer(file)
+        writer.writerow(ShareRecord._fields)
+        writer.writerows(self.records)
+
+    def _fetch(self, key):
+        obj_type, obj_id = key
+        api = getattr(self._base, obj_type.capitalize() + "s")
+        try:
+            if obj_type == "workspace":
+                result = api.list_shares(obj_id, include_all=True)
+            else:
+                result = api.list_shares(
+                    obj_id,
+                    include_all=True,
+                    include_workspace_shares=self._include_workspace_shares,
+                )
+        except ApiError as ex:
+            result = ex.error
+        if isinstance(result, Error):
+            return obj_type, obj_id, result
+        return (
+            obj_type,
+            obj_id,
+            [self._record(obj_type, obj_id, share) for share in result.data],
+        )
+
+    @staticmethod
+    def _record(obj_type, obj_id, share):
+        return ShareRecord(
+            obj_type,
+            obj_id,
+            _name(share.type),
+            share.group_id if share.group_id is not None else share.user_id,
+            share.email,
+            _name(share.access_level),
+            _name(share.scope),
+        )
+
+    def _add(self, obj_type, obj_id, records):
+        self._done.add((obj_type, obj_id))
+        self.records.extend(records)
+        self._by_object[(obj_type, obj_id)].extend(records)
+        for record in records:
+            self._by_principal[record.principal_id].append(record)
+            if record.email:
+                self._by_principal[record.email.lower()].append(record)
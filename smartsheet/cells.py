@@ -20,6 +20,11 @@ from __future__ import absolute_import
 import logging
 
 from . import fresh_operation
+from .columnar import CellHistoryEntry, CellHistoryTable
+from .exceptions import ApiError
+from .models import Error
+from .smartsheet import error_as_exception
+from .util import bounded_map
 
 
 class Cells:
@@ -88,6 +93,90 @@ class Cells:
 
         return response
 
+    def iter_cell_history(
+        self, sheet_id, row_ids, column_ids, include=None, max_workers=8, errors=None
+    ):
+        """Get the modification history of many Cells.
+
+        The history of every combination of `row_ids` and `column_ids` is
+        fetched, `max_workers` cells at a time, and yielded cell by cell in
+        that order as flat CellHistoryEntry tuples (row_id, column_id, value,
+        modified_at, modified_by), which can be written straight to a CSV
+        file. Errors are raised as exceptions, unless `errors` is given.
+
+        Args:
+            sheet_id (int): Sheet ID
+            row_ids (list[int]): Row IDs
+            column_ids (list[int]): Column IDs
+            include (str): Valid includes for CellHistory are:
+                columnType, format, objectValue
+            max_workers (int): The number of cells fetched concurrently.
+            errors (list): Cells that fail to load, such as those of a
+                deleted row, are logged, skipped and appended to this list
+                as ((row_id, column_id), Error).
+
+        Returns:
+            generator of CellHistoryEntry
+        """
+        column_ids = list(column_ids)
+        cells = (
+            (row_id, column_id) for row_id in row_ids for column_id in column_ids
+        )
+
+        def fetch(cell):
+            try:
+                response = self.get_cell_history(
+                    sheet_id, cell[0], cell[1], include=include, include_all=True
+                )
+            except ApiError as ex:
+                if errors is None:
+                    raise
+                response = ex.error
+            if isinstance(response, Error):
+                if errors is None:
+                    raise error_as_exception(response)
+                return cell, response
+            return cell, response.data
+
+        for (row_id, column_id), history in bounded_map(fetch, cells, max_workers):
+            if isinstance(history, Error):
+                self._log.warning(
+                    "Cannot get history of cell %s/%s: %s",
+                    row_id,
+                    column_id,
+                    history.result.message,
+                )
+                errors.append(((row_id, column_id), history))
+                continue
+            for item in history:
+                modified_by = item.modified_by
+                yield CellHistoryEntry(
+                    row_id,
+                    column_id,
+                    item.value,
+                    item.modified_at,
+                    None if modified_by is None else modified_by.email,
+                )
+
+    def get_cell_histories(
+        self, sheet_id, row_ids, column_ids, include=None, max_workers=8
+    ):
+        """Get the modification history of many Cells as columns.
+
+        Same as `iter_cell_history`, collected into a CellHistoryTable.
+        Cells that fail to load are listed in the table's `errors` instead
+        of aborting the others.
+
+        Returns:
+            CellHistoryTable
+        """
+        table = CellHistoryTable()
+        for entry in self.iter_cell_history(
+            sheet_id, row_ids, column_ids, include, max_workers, errors=table.errors
+        ):
+            table.append(entry)
+        return table
+
     def add_image_to_cell(
         self,
         sheet_id,
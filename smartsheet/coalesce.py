@@ -0,0 +1,161 @@
+# pylint: disable=C0111,R0902,R0903,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import logging
+import threading
+import time
+
+import six
+
+from .exceptions import DeadlineExceededError
+from .models import Error
+
+# get_row flags get_sheet accepts with the same meaning, 'columns' is
+# served from the columns of the sheet
+COALESCED_INCLUDES = frozenset(
+    (
+        "attachments",
+        "columnType",
+        "columns",
+        "discussions",
+        "filters",
+        "format",
+        "objectValue",
+        "rowPermalink",
+    )
+)
+
+
+def _flags(include):
+    if include is None:
+        return ()
+    if isinstance(include, six.string_types):
+        include = include.split(",")
+    return tuple(sorted(flag.strip() for flag in include if flag.strip()))
+
+
+class _Batch:
+    def __init__(self):
+        self.row_ids = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+        self.rows = None
+        self.result = None
+        self.exception = None
+
+
+class RowCoalescer:
+
+    """Merge concurrent `Sheets.get_row` calls into one `get_sheet` request.
+
+    The first call for a sheet opens a batch and waits `window` seconds, or
+    until `max_rows` rows are requested, for other calls for the same sheet
+    and options to join it. One `get_sheet(row_ids=...)` then fetches every
+    row of the batch and each caller gets its own row back. Rows missing
+    from the sheet are fetched with `get_row`, so their callers get the same
+    error as without coalescing; an error fetching the sheet is returned to
+    (or raised in) every caller of the batch. Callers asking for the same
+    row share the same Row object.
+    """
+
+    def __init__(self, smartsheet_obj, window=0.01, max_rows=100):
+        """
+        Args:
+            smartsheet_obj (smartsheet.Smartsheet): Client making the requests.
+            window (float): Seconds a batch waits for more rows.
+            max_rows (int): The number of rows fetched per request.
+        """
+        self._base = smartsheet_obj
+        self._log = logging.getLogger(__name__)
+        self._window = window
+        self._max_rows = max_rows
+        self._open = {}
+        self._lock = threading.Lock()
+
+    def accepts(self, include):
+        """Whether a get_row call with these include flags can be merged."""
+        return set(_flags(include)) <= COALESCED_INCLUDES
+
+    def get_row(self, sheet_id, row_id, include=None, exclude=None, level=None):
+        """Get a Row, sharing the request with concurrent calls.
+
+        Returns:
+            Row
+        """
+        key = (sheet_id, _flags(include), _flags(exclude), level)
+        with self._lock:
+            batch = self._open.get(key)
+            leader = batch is None
+            if leader:
+                batch = self._open[key] = _Batch()
+            batch.row_ids.append(row_id)
+            if len(batch.row_ids) >= self._max_rows:
+                del self._open[key]
+                batch.full.set()
+
+        if leader:
+            batch.full.wait(self._window)
+            with self._lock:
+                if self._open.get(key) is batch:
+                    del self._open[key]
+            self._fetch(key, batch)
+        else:
+            # the batch may outlive the deadline of this caller
+            deadline = self._base._call_deadline(time.time())  # pylint: disable=W0212
+            timeout = None if deadline is None else max(deadline - time.time(), 0)
+            if not batch.done.wait(timeout):
+                raise DeadlineExceededError("get_row", deadline)
+
+        if batch.exception is not None:
+            raise batch.exception
+        if batch.rows is None:
+            return batch.result
+        row = batch.rows.get(row_id)
+        if row is None:
+            return self._base.Sheets.get_row(
+                sheet_id, row_id, include, exclude, level, coalesce=False
+            )
+        return row
+
+    def _fetch(self, key, batch):
+        sheet_id, flags, exclude, level = key
+        include = [flag for flag in flags if flag != "columns"]
+        row_ids = list(dict.fromkeys(batch.row_ids))
+        self._log.debug("Fetching %d rows of sheet %s", len(row_ids), sheet_id)
+        try:
+            sheet = self._base.Sheets.get_sheet(
+                sheet_id,
+                include=include or None,
+                exclude=list(exclude) or None,
+                row_ids=row_ids,
+                level=level,
+            )
+            if isinstance(sheet, Error):
+                batch.result = sheet
+            else:
+                batch.rows = {}
+                for row in sheet.rows:
+                    row.sheet_id = sheet_id
+                    if "columns" in flags:
+                        row.columns = sheet.columns
+                    batch.rows[row.id] = row
+        except Exception as ex:  # pylint: disable=broad-except
+            batch.exception = ex
+        finally:
+            batch.done.set()
@@ -0,0 +1,354 @@
+# pylint: disable=C0111,R0903,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import collections
+import math
+from array import array
+from datetime import date, datetime, timezone
+
+import six
+
+from .models.enums import ColumnType
+from .types import parse_timestamp
+
+_EPOCH_DATE = date(1970, 1, 1).toordinal()
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+DTYPES = ("object", "float64", "int64", "bool", "date", "datetime")
+
+# array.array typecode and null fill value by dtype
+_ARRAY_TYPES = {
+    "float64": ("d", math.nan),
+    "int64": ("q", 0),
+    "bool": ("b", 0),
+    "date": ("q", 0),
+    "datetime": ("q", 0),
+}
+
+_NUMPY_TYPES = {
+    "float64": "float64",
+    "int64": "int64",
+    "bool": "bool",
+    "date": "datetime64[D]",
+    "datetime": "datetime64[ms]",
+}
+
+_DEFAULT_DTYPES = {
+    ColumnType.CHECKBOX: "bool",
+    ColumnType.DATE: "date",
+    ColumnType.DATETIME: "datetime",
+    ColumnType.ABSTRACT_DATETIME: "datetime",
+}
+
+
+class ColumnValues:
+    """The values of one column, in row order.
+
+    Attributes:
+        column: The Column (or ReportColumn) the values belong to.
+        dtype (str): One of `DTYPES`.
+        values: `array.array` (a list for 'object'), or a NumPy array. Dates
+            are days and datetimes milliseconds since the Unix epoch, nulls
+            are NaN for 'float64' and 0 for other numeric dtypes.
+        mask: Same length as `values`, true where the cell is empty or its
+            value could not be converted to `dtype`.
+        row_ids: Id of the row of each value.
+    """
+
+    def __init__(self, column, dtype, values, mask, row_ids):
+        self.column = column
+        self.dtype = dtype
+        self.values = values
+        self.mask = mask
+        self.row_ids = row_ids
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        """Iterate the values, yielding None for nulls."""
+        for value, null in zip(self.values, self.mask):
+            yield None if null else value
+
+
+CellHistoryEntry = collections.namedtuple(
+    "CellHistoryEntry", ["row_id", "column_id", "value", "modified_at", "modified_by"]
+)
+CellHistoryEntry.__doc__ = """One past value of a cell, `modified_by` is the
+email of the user who set it."""
+
+
+class CellHistoryTable:
+    """Cell history entries stored column by column.
+
+    Attributes:
+        row_ids: `array.array` of row ids.
+        column_ids: `array.array` of column ids.
+        values (list): Cell values.
+        modified_at (list[datetime]): When each value was set.
+        modified_by (list[str]): Email of the user who set each value.
+        errors (list[tuple]): ((row_id, column_id), Error) of the cells
+            whose history could not be fetched.
+    """
+
+    def __init__(self, entries=()):
+        self.errors = []
+        self.row_ids = array("q")
+        self.column_ids = array("q")
+        self.values = []
+        self.modified_at = []
+        self.modified_by = []
+        for entry in entries:
+            self.append(entry)
+
+    def append(self, entry):
+        self.row_ids.append(entry.row_id)
+        self.column_ids.append(entry.column_id)
+        self.values.append(entry.value)
+        self.modified_at.append(entry.modified_at)
+        self.modified_by.append(entry.modified_by)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        """Iterate the entries as CellHistoryEntry tuples."""
+        for fields in zip(
+            self.row_ids,
+            self.column_ids,
+            self.values,
+            self.modified_at,
+            self.modified_by,
+        ):
+            yield CellHistoryEntry(*fields)
+
+
+def _to_float(value):
+    if isinstance(value, (six.integer_types, float)):
+        return float(value)
+    return float(value.replace(",", ""))
+
+
+def _to_int(value):
+    if isinstance(value, (six.integer_types, bool)):
+        return int(value)
+    return int(_to_float(value))
+
+
+def _to_bool(value):
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, six.string_types):
+        return int(value.lower() == "true")
+    return int(bool(value))
+
+
+def _to_date(value):
+    return parse_timestamp(value).toordinal() - _EPOCH_DATE
+
+
+def _to_datetime(value):
+    timestamp = parse_timestamp(value)
+    if timestamp.tzinfo is None:
+        # abstract datetimes carry no offset, treat them as UTC
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int((timestamp - _EPOCH).total_seconds() * 1000)
+
+
+_CONVERTERS = {
+    "float64": _to_float,
+    "int64": _to_int,
+    "bool": _to_bool,
+    "date": _to_date,
+    "datetime": _to_datetime,
+}
+
+
+def _default_dtype(column, raw_values):
+    dtype = _DEFAULT_DTYPES.get(column.type.value)
+    if dtype is not None:
+        return dtype
+    if column.type.value == ColumnType.TEXT_NUMBER and all(
+        isinstance(value, (six.integer_types, float)) and not isinstance(value, bool)
+        for value in raw_values
+        if value is not None
+    ):
+        return "float64"
+    return "object"
+
+
+def _to_numpy(numpy, values, dtype):
+    if dtype == "object":
+        return numpy.array(values, dtype=object)
+    source = {"d": "float64", "q": "int64", "b": "int8"}[values.typecode]
+    return numpy.frombuffer(values, dtype=source).astype(_NUMPY_TYPES[dtype])
+
+
+def column_values(
+    columns,
+    rows,
+    column_id,
+    dtype=None,
+    as_numpy=False,
+    column_key="id",
+    cell_key="column_id",
+):
+    """Extract the values of one column from a list of rows.
+
+    Args:
+        columns (list[Column]): Columns of the sheet or report.
+        rows (list[Row]): Rows to extract the values from.
+        column_id (int): Id of the column.
+        dtype (str): One of `DTYPES`. By default checkbox columns are 'bool',
+            date columns 'date', datetime columns 'datetime', text/number
+            columns holding only numbers 'float64' and others 'object'.
+        as_numpy (bool): Return NumPy arrays instead of `array.array`.
+        column_key (str): Column attribute holding `column_id`.
+        cell_key (str): Cell attribute holding `column_id`.
+
+    Returns:
+        ColumnValues
+    """
+    if dtype is not None and dtype not in DTYPES:
+        raise ValueError(f"dtype must be one of {DTYPES}")
+
+    position, column = None, None
+    for idx, candidate in enumerate(columns):
+        if getattr(candidate, column_key) == column_id:
+            position, column = idx, candidate
+            break
+    if column is None:
+        raise ValueError(f"Column {column_id} not found")
+
+    raw_values = []
+    row_ids = array("q")
+    for row in rows:
+        cells = row.cells
+        # cells come back in column order, only search when they do not
+        cell = cells[position] if position < len(cells) else None
+        if cell is None or getattr(cell, cell_key) != column_id:
+            cell = next(
+                (item for item in cells if getattr(item, cell_key) == column_id), None
+            )
+        raw_values.append(None if cell is None else cell.value)
+        row_ids.append(row.id or 0)
+
+    if dtype is None:
+        dtype = _default_dtype(column, raw_values)
+
+    mask = array("b", [0]) * len(raw_values)
+    if dtype == "object":
+        values = raw_values
+        for idx, value in enumerate(raw_values):
+            if value is None:
+                mask[idx] = 1
+    else:
+        typecode, fill = _ARRAY_TYPES[dtype]
+        convert = _CONVERTERS[dtype]
+        values = array(typecode, [fill]) * len(raw_values)
+        for idx, value in enumerate(raw_values):
+            if value is None or value == "":
+                mask[idx] = 1
+                continue
+            try:
+                values[idx] = convert(value)
+            except (ValueError, TypeError, OverflowError):
+                mask[idx] = 1
+
+    if as_numpy:
+        try:
+            import numpy
+        except ImportError as ex:
+            raise ImportError(
+                "as_numpy requires the numpy package, install it with: pip install numpy"
+            ) from ex
+        values = _to_numpy(numpy, values, dtype)
+        mask = _to_numpy(numpy, mask, "bool")
+        row_ids = _to_numpy(numpy, row_ids, "int64")
+
+    return ColumnValues(column, dtype, values, mask, row_ids)
+
+
+def csv_columns(rows, dtypes=None, as_numpy=False):
+    """Fill typed column buffers from CSV rows, one row at a time.
+
+    Args:
+        rows: Iterable of rows as lists of strings, the first one holding
+            the column titles.
+        dtypes (dict): One of `DTYPES` by column title, 'object' (the
+            strings as read) by default. Empty cells and values that cannot
+            be converted are masked.
+        as_numpy (bool): Return NumPy arrays instead of `array.array`.
+
+    Returns:
+        dict: ColumnValues by column title, in column order. Their `column`
+        is the title and their `row_ids` None, exports holding no row ids.
+    """
+    dtypes = dtypes or {}
+    rows = iter(rows)
+    header = next(rows, [])
+    for title, dtype in six.iteritems(dtypes):
+        if dtype not in DTYPES:
+            raise ValueError(f"dtype must be one of {DTYPES}")
+        if title not in header:
+            raise ValueError(f"Column {title!r} not found")
+
+    buffers = []
+    for title in header:
+        dtype = dtypes.get(title, "object")
+        if dtype == "object":
+            values = []
+        else:
+            values = array(_ARRAY_TYPES[dtype][0])
+        buffers.append((dtype, values, array("b")))
+
+    for row in rows:
+        for idx, (dtype, values, mask) in enumerate(buffers):
+            value = row[idx] if idx < len(row) else ""
+            if dtype == "object":
+                values.append(value)
+                mask.append(int(value == ""))
+                continue
+            fill = _ARRAY_TYPES[dtype][1]
+            if value == "":
+                values.append(fill)
+                mask.append(1)
+                continue
+            try:
+                values.append(_CONVERTERS[dtype](value))
+                mask.append(0)
+            except (ValueError, TypeError, OverflowError):
+                values.append(fill)
+                mask.append(1)
+
+    if as_numpy:
+        try:
+            import numpy
+        except ImportError as ex:
+            raise ImportError(
+                "as_numpy requires the numpy package, install it with: pip install numpy"
+            ) from ex
+
+    columns = {}
+    for title, (dtype, values, mask) in zip(header, buffers):
+        if as_numpy:
+            values = _to_numpy(numpy, values, dtype)
+            mask = _to_numpy(numpy, mask, "bool")
+        columns[title] = ColumnValues(title, dtype, values, mask, None)
+    return columns
@@ -0,0 +1,144 @@
+# pylint: disable=C0111,R0902,R0903,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .exceptions import ApiError
+from .models import Error
+from .smartsheet import error_as_exception
+
+ITEM_TYPES = ("workspace", "folder", "sheet", "report", "sight", "template")
+
+# container attribute holding the items of each type
+_CHILDREN = (
+    ("workspace", "workspaces"),
+    ("folder", "folders"),
+    ("sheet", "sheets"),
+    ("report", "reports"),
+    ("sight", "sights"),
+    ("template", "templates"),
+)
+
+IndexEntry = collections.namedtuple(
+    "IndexEntry", ["id", "type", "name", "path", "parent_id", "parent_type", "depth"]
+)
+IndexEntry.__doc__ = """An object found by the Crawler.
+
+`path` is the names of its containers and its own, joined by '/'. Objects
+at the root of Home have no parent and a depth of 0."""
+
+
+class Crawler:
+
+    """Walk Home, Workspaces and Folders breadth first, yielding an
+    IndexEntry for every object found.
+
+    Containers are fetched in breadth-first order by a pool of worker
+    threads and each object is yielded once, as soon as its container is loaded.
+    Containers that fail to load are logged and listed in `errors` instead
+    of interrupting the crawl; only a failure to list Home is raised.
+    """
+
+    def __init__(self, smartsheet_obj, max_workers=8, max_depth=None, types=None):
+        """
+        Args:
+            smartsheet_obj (smartsheet.Smartsheet): Client making the requests.
+            max_workers (int): The number of containers fetched concurrently.
+            max_depth (int): Do not open containers deeper than this, 0 only
+                lists the root of Home.
+            types (list[str]): Only yield objects of these `ITEM_TYPES`.
+                Containers are walked whatever their type.
+        """
+        if types is not None and not set(types) <= set(ITEM_TYPES):
+            raise ValueError(f"types must be among {ITEM_TYPES}")
+        self._base = smartsheet_obj
+        self._log = logging.getLogger(__name__)
+        self._max_workers = max_workers
+        self._max_depth = max_depth
+        self._types = None if types is None else frozenset(types)
+        self.errors = []
+
+    def __iter__(self):
+        seen = set()
+        queue = collections.deque([None])
+        pending = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            try:
+                while queue or pending:
+                    while queue and len(pending) < self._max_workers:
+                        entry = queue.popleft()
+                        pending[executor.submit(self._load, entry)] = entry
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        parent = pending.pop(future)
+                        container = future.result()
+                        if isinstance(container, Error):
+                            if parent is None:
+                                raise error_as_exception(container)
+                            self._log.warning(
+                                "Skipping %s %s: %s",
+                                parent.type,
+                                parent.id,
+                                container.result.message,
+                            )
+                            self.errors.append((parent, container))
+                            continue
+                        for entry in self._children(container, parent):
+                            key = (entry.type, entry.id)
+                            if key in seen:
+                                continue
+                            seen.add(key)
+                            if entry.type in ("workspace", "folder") and (
+                                self._max_depth is None
+                                or entry.depth < self._max_depth
+                            ):
+                                queue.append(entry)
+                            if self._types is None or entry.type in self._types:
+                                yield entry
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _load(self, entry):
+        try:
+            if entry is None:
+                return self._base.Home.list_all_contents()
+            if entry.type == "workspace":
+                return self._base.Workspaces.get_workspace(entry.id)
+            return self._base.Folders.get_folder(entry.id)
+        except ApiError as ex:
+            return ex.error
+
+    @staticmethod
+    def _children(container, parent):
+        depth = 0 if parent is None else parent.depth + 1
+        for item_type, attribute in _CHILDREN:
+            for item in getattr(container, attribute, None) or []:
+                name = item.name or ""
+                yield IndexEntry(
+                    item.id,
+                    item_type,
+                    name,
+                    name if parent is None else parent.path + "/" + name,
+                    None if parent is None else parent.id,
+                    None if parent is None else parent.type,
+                    depth,
+                )
@@ -0,0 +1,140 @@
+# pylint: disable=C0111
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import codecs
+import csv
+import io
+
+import six
+
+from .models import Error
+from .models.column import Column
+from .smartsheet import error_as_exception
+
+
+def table_rows(data, header=None):
+    """Split tabular data into a header and an iterator of rows.
+
+    Args:
+        data: An iterable of row sequences, a dict of column sequences by
+            title or a pandas DataFrame.
+        header (list[str]): Column titles, taken from `data` by default
+            when it is a dict or a DataFrame. For those, it selects and
+            orders the columns of `data` by title.
+
+    Returns:
+        tuple: (header or None, iterator of row sequences)
+
+    Raises:
+        ValueError: A title of `header` is not a column of `data`.
+    """
+    if hasattr(data, "itertuples") and hasattr(data, "columns"):
+        if header is None:
+            header = [str(column) for column in data.columns]
+        else:
+            columns = {str(column): column for column in data.columns}
+            data = data[[columns[title] for title in _check_titles(header, columns)]]
+        return header, data.itertuples(index=False, name=None)
+    if isinstance(data, dict):
+        if header is None:
+            header = list(data)
+        return header, six.moves.zip(
+            *(data[title] for title in _check_titles(header, data))
+        )
+    return header, iter(data)
+
+
+def _check_titles(header, columns):
+    missing = [title for title in header if title not in columns]
+    if missing:
+        raise ValueError(f"Columns {missing!r} not found in data")
+    return header
+
+
+def iter_csv(rows, header=None, chunk_size=65536):
+    """Encode rows as CSV, yielding UTF-8 chunks of about `chunk_size`
+    bytes, so that only one chunk is held in memory at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header is not None:
+        writer.writerow(header)
+    for row in rows:
+        writer.writerow(["" if value is None else value for value in row])
+        if buffer.tell() >= chunk_size:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_lines(chunks, encoding="utf-8-sig"):
+    """Decode byte chunks into lines, keeping their line endings."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        lines = pending.split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def iter_csv_rows(chunks, encoding="utf-8-sig"):
+    """Parse CSV from byte chunks, yielding each row as a list of strings
+    as soon as its last chunk arrives."""
+    return csv.reader(iter_lines(chunks, encoding))
+
+
+def fix_column_types(smartsheet_obj, sheet_id, column_types):
+    """Change the type of imported columns, which import as text/number.
+
+    Args:
+        smartsheet_obj (smartsheet.Smartsheet): Client making the requests.
+        sheet_id (int): Sheet ID
+        column_types (dict): Column type names, or Column objects holding
+            the type and its options, by column title.
+
+    Returns:
+        list[Column]: The updated columns.
+    """
+
+    def check(result):
+        if isinstance(result, Error):
+            raise error_as_exception(result)
+        return result
+
+    columns = check(smartsheet_obj.Sheets.get_columns(sheet_id, include_all=True))
+    updated = []
+    for column in columns.data:
+        change = column_types.get(column.title)
+        if change is None:
+            continue
+        if isinstance(change, six.string_types):
+            change = Column({"type": change})
+        if str(change.type) == str(column.type):
+            continue
+        result = check(
+            smartsheet_obj.Sheets.update_column(sheet_id, column.id, change)
+        )
+        updated.append(result.result)
+    return updated
@@ -0,0 +1,216 @@
+# pylint: disable=C0111,R0902,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+import time
+
+import six
+
+from .models import Error
+from .smartsheet import error_as_exception
+from .util import bounded_map
+
+
+def _check(result):
+    if isinstance(result, Error):
+        raise error_as_exception(result)
+    return result
+
+
+def _key(value):
+    return value.lower() if isinstance(value, six.string_types) else value
+
+
+class _Snapshot:
+    """Indexes built by one warm-up, replaced as a whole on refresh."""
+
+    def __init__(self):
+        self.users_by_id = {}
+        self.users_by_email = {}
+        self.groups_by_id = {}
+        self.groups_by_name = {}
+        self.members = {}
+        self.groups_of = collections.defaultdict(set)
+        self.contacts_by_email = {}
+        self.loaded_at = time.monotonic()
+
+
+class Directory:
+
+    """Users, groups and contacts of the organization, cached in memory.
+
+    The directory is loaded on first use with concurrent page fetches and
+    reloaded on the first lookup after `ttl` seconds. Lookups are then
+    dictionary reads: users by id or email (alternate emails included), groups
+    by id or name with their member ids, and contacts by email. Emails and
+    group names are matched case insensitively.
+    """
+
+    def __init__(
+        self,
+        smartsheet_obj,
+        ttl=3600,
+        max_workers=8,
+        page_size=100,
+        alternate_emails=True,
+        contacts=False,
+    ):
+        """
+        Args:
+            smartsheet_obj (smartsheet.Smartsheet): Client making the requests.
+            ttl (float): Seconds before the directory is reloaded.
+            max_workers (int): The number of requests made concurrently.
+            page_size (int): The number of users, groups or contacts fetched
+                per request.
+            alternate_emails (bool): Index users by their alternate emails,
+                which takes one request per user.
+            contacts (bool): Also load the personal contacts of the user.
+        """
+        self._base = smartsheet_obj
+        self._log = logging.getLogger(__name__)
+        self._ttl = ttl
+        self._max_workers = max_workers
+        self._page_size = page_size
+        self._alternate_emails = alternate_emails
+        self._contacts = contacts
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """Load the directory now instead of on first lookup."""
+        snapshot = self._load()
+        with self._lock:
+            self._snapshot = snapshot
+
+    def invalidate(self):
+        """Reload the directory on next lookup."""
+        with self._lock:
+            self._snapshot = None
+
+    def user(self, id_or_email):
+        """The User with this id or email, None if unknown."""
+        snapshot = self._current()
+        if isinstance(id_or_email, six.string_types):
+            return snapshot.users_by_email.get(id_or_email.lower())
+        return snapshot.users_by_id.get(id_or_email)
+
+    def user_id(self, email):
+        """Id of the User with this email, None if unknown."""
+        user = self.user(email)
+        return None if user is None else user.id
+
+    def group(self, id_or_name):
+        """The Group with this id or name, None if unknown."""
+        snapshot = self._current()
+        if isinstance(id_or_name, six.string_types):
+            return snapshot.groups_by_name.get(id_or_name.lower())
+        return snapshot.groups_by_id.get(id_or_name)
+
+    def members(self, id_or_name):
+        """Ids of the users in a group, as a frozenset."""
+        group = self.group(id_or_name)
+        if group is None:
+            return frozenset()
+        return self._current().members.get(group.id, frozenset())
+
+    def groups_of(self, id_or_email):
+        """Ids of the groups a user belongs to, as a frozenset."""
+        snapshot = self._current()
+        user = self.user(id_or_email)
+        user_id = id_or_email if user is None else user.id
+        return frozenset(snapshot.groups_of.get(user_id, ()))
+
+    def contact(self, email):
+        """The Contact with this email, None if unknown or not loaded."""
+        return self._current().contacts_by_email.get(_key(email))
+
+    def _current(self):
+        snapshot = self._snapshot
+        if not self._stale(snapshot):
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if self._stale(snapshot):
+                snapshot = self._snapshot = self._load()
+            return snapshot
+
+    def _stale(self, snapshot):
+        return snapshot is None or time.monotonic() - snapshot.loaded_at >= self._ttl
+
+    def _load(self):
+        self._log.debug("Loading directory")
+        snapshot = _Snapshot()
+        users = self._fetch_all(self._base.Users.list_users)
+        groups = self._fetch_all(self._base.Groups.list_groups)
+
+        for user in users:
+            snapshot.users_by_id[user.id] = user
+            if user.email:
+                snapshot.users_by_email[user.email.lower()] = user
+        if self._alternate_emails:
+            for user, emails in zip(
+                users,
+                bounded_map(self._list_alternate_emails, users, self._max_workers),
+            ):
+                for email in emails:
+                    snapshot.users_by_email.setdefault(email.lower(), user)
+
+        # members are only returned by get_group
+        for group in bounded_map(
+            lambda group: _check(self._base.Groups.get_group(group.id)),
+            groups,
+            self._max_workers,
+        ):
+            snapshot.groups_by_id[group.id] = group
+            if group.name:
+                snapshot.groups_by_name[group.name.lower()] = group
+            member_ids = frozenset(member.id for member in group.members)
+            snapshot.members[group.id] = member_ids
+            for member_id in member_ids:
+                snapshot.groups_of[member_id].add(group.id)
+
+        if self._contacts:
+            for contact in self._fetch_all(self._base.Contacts.list_contacts):
+                if contact.email:
+                    snapshot.contacts_by_email[contact.email.lower()] = contact
+
+        snapshot.loaded_at = time.monotonic()
+        return snapshot
+
+    def _fetch_all(self, list_func):
+        """Every item of a paged list, the pages after the first fetched
+        concurrently."""
+        first = _check(list_func(page_size=self._page_size, page=1))
+        items = list(first.data)
+        pages = range(2, (first.total_pages or 1) + 1)
+        for result in bounded_map(
+            lambda page: _check(list_func(page_size=self._page_size, page=page)),
+            pages,
+            self._max_workers,
+        ):
+            items.extend(result.data)
+        return items
+
+    def _list_alternate_emails(self, user):
+        if user.alternate_emails:
+            return [item.email for item in user.alternate_emails if item.email]
+        result = _check(self._base.Users.list_alternate_emails(user.id))
+        return [item.email for item in result.data if item.email]
@@ -78,6 +78,29 @@ class UnexpectedRequestError(SmartsheetException):
         return f"UnexpectedRequestError({self.request!r}, {self.response!r})"
 
 
+class DeadlineExceededError(SmartsheetException):
+    """The call could not complete before its deadline."""
+
+    def __init__(self, operation_id, deadline):
+        super().__init__(operation_id, deadline)
+        self.operation_id = operation_id
+        self.deadline = deadline
+
+    def __repr__(self):
+        return f"DeadlineExceededError({self.operation_id!r}, {self.deadline!r})"
+
+
+class CircuitOpenError(SmartsheetException):
+    """The circuit breaker is open, the request was not sent."""
+
+    def __init__(self, retry_after):
+        super().__init__(retry_after)
+        self.retry_after = retry_after
+
+    def __repr__(self):
+        return f"CircuitOpenError({self.retry_after!r})"
+
+
 class SystemMaintenanceError(ApiError):
     """Smartsheet.com is currently offline for system maintenance. ..."""
 
@@ -0,0 +1,194 @@
+# pylint: disable=C0111,R0902,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import collections
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .retry import RetryBudget, is_idempotent
+
+
+class LatencyHistory:
+    """Recent response latencies by operation id."""
+
+    def __init__(self, size=200):
+        self._size = size
+        self._samples = {}
+        self._lock = threading.Lock()
+
+    def record(self, operation_id, seconds):
+        with self._lock:
+            samples = self._samples.get(operation_id)
+            if samples is None:
+                samples = self._samples[operation_id] = collections.deque(
+                    maxlen=self._size
+                )
+            samples.append(seconds)
+
+    def count(self, operation_id):
+        with self._lock:
+            return len(self._samples.get(operation_id, ()))
+
+    def percentile(self, operation_id, fraction):
+        """The latency `fraction` of the recent samples are below, None
+        without samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(operation_id, ()))
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(fraction * len(samples)))]
+
+
+class HedgingPolicy:
+    """Send a second copy of slow GET requests and use the first response.
+
+    When a response has not arrived after the `percentile` latency of the
+    operation, measured over its recent requests, the same request is sent
+    again on another pooled connection and whichever response comes first
+    is returned; the other is discarded. Hedges are drawn from a budget
+    earning `budget_ratio` hedges per request, so they add at most that
+    share of extra load. Only idempotent GET requests that are not streamed
+    are hedged, once enough latencies of their operation are known.
+
+    A policy may be shared between clients, which then also share their
+    latency history.
+    """
+
+    def __init__(
+        self,
+        percentile=0.95,
+        min_delay=0.05,
+        min_samples=20,
+        budget_ratio=0.05,
+        max_budget=10,
+        operations=None,
+        history_size=200,
+        max_workers=32,
+        max_requests=256,
+    ):
+        """
+        Args:
+            percentile (float): Latency percentile, between 0 and 1, after
+                which a request is hedged.
+            min_delay (float): Shortest wait in seconds before hedging.
+            min_samples (int): Latencies of an operation needed before its
+                requests are hedged.
+            budget_ratio (float): Hedges earned per request.
+            max_budget (int): Hedges that can be banked, also the initial
+                balance.
+            operations (list[str]): Only hedge these operation ids, such as
+                'get_sheet' or 'get_row'. Every GET operation by default.
+            history_size (int): Latencies kept per operation.
+            max_workers (int): Hedges in flight at once. Original
+                requests do not wait for these workers.
+            max_requests (int): Threads, reused between requests, sending
+                the original requests that may be hedged.
+        """
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._min_samples = min_samples
+        self._operations = None if operations is None else frozenset(operations)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="smartsheet-hedge"
+        )
+        self._requests = ThreadPoolExecutor(
+            max_workers=max_requests, thread_name_prefix="smartsheet-request"
+        )
+        self._log = logging.getLogger(__name__)
+        self.budget = RetryBudget(budget_ratio, max_budget)
+        self.history = LatencyHistory(history_size)
+
+    def applies(self, prepped_request, operation, stream):
+        return (
+            not stream
+            and prepped_request.method == "GET"
+            and prepped_request.body is None
+            and is_idempotent(prepped_request, operation)
+            and (self._operations is None or operation["id"] in self._operations)
+        )
+
+    def delay(self, operation_id):
+        """Seconds to wait before hedging, None while the history is short."""
+        if self.history.count(operation_id) < self._min_samples:
+            return None
+        return max(
+            self._min_delay, self.history.percentile(operation_id, self._percentile)
+        )
+
+    def send(self, send, prepped_request, operation):
+        """Call `send(prepped_request)`, hedging it when it is slow.
+
+        Returns:
+            tuple: (response, hedged)
+        """
+        operation_id = operation["id"]
+        delay = self.delay(operation_id)
+        self.budget.record_success()
+
+        def timed_send(request):
+            start = time.monotonic()
+            response = send(request)
+            self.history.record(operation_id, time.monotonic() - start)
+            return response
+
+        if delay is None:
+            return timed_send(prepped_request), False
+
+        # requests are redacted for logging once answered, and the original
+        # may be answered after this call returned and the caller restored
+        # its token for a retry, so neither send gets the caller's request
+        hedge_request = prepped_request.copy()
+        primary_request = prepped_request.copy()
+        started = threading.Event()
+
+        def send_primary():
+            started.set()
+            return timed_send(primary_request)
+
+        # a send in progress cannot be abandoned, so the original request
+        # runs on another thread for a faster hedge to win, apart from the
+        # hedges of other requests
+        primary = self._requests.submit(send_primary)
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+        if done or not self.budget.try_acquire():
+            return primary.result(), False
+
+        self._log.debug("Hedging %s after %.3f seconds", operation_id, delay)
+        hedge = self._executor.submit(send, hedge_request)
+        pending = {primary, hedge}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                    continue
+                for other in pending:
+                    other.add_done_callback(_close_response)
+                return future.result(), True
+        raise error
+
+
+def _close_response(future):
+    """Release the connection of a discarded response."""
+    if future.exception() is None:
+        future.result().close()
@@ -20,6 +20,7 @@ from __future__ import absolute_import
 import logging
 
 from . import fresh_operation
+from .crawler import Crawler
 from .models.folder import Folder
 from .models.sheet import Sheet
 
@@ -145,6 +146,26 @@ class Home:
 
         return response
 
+    def crawl(self, max_workers=8, max_depth=None, types=None):
+        """Walk Home and every Workspace and Folder below it, breadth first.
+
+        Containers are fetched concurrently and each object is yielded
+        once, as an IndexEntry (id, type, name, path, parent_id,
+        parent_type, depth), so the index can be streamed to a database
+        while the crawl goes on.
+
+        Args:
+            max_workers (int): The number of containers fetched concurrently.
+            max_depth (int): Do not open containers deeper than this, 0 only
+                lists the root of Home.
+            types (list[str]): Only yield objects of these types: workspace,
+                folder, sheet, report, sight, template.
+
+        Returns:
+            Crawler
+        """
+        return Crawler(self._base, max_workers, max_depth, types)
+
     def list_folders(self, page_size=None, page=None, include_all=None):
         """Gets a list of top-level child Folders within the user's Sheets
         folder.
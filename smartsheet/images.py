@@ -52,6 +52,8 @@ class Images:
         _op["method"] = "POST"
         _op["path"] = "/imageurls"
         _op["json"] = list_of_images
+        # only reads, safe to repeat
+        _op["idempotent"] = True
 
         expected = "ImageUrlMap"
 
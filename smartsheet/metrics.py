@@ -0,0 +1,185 @@
+# pylint: disable=C0111,R0902,R0903,W0613
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+TIMING_PHASES = ("prepare", "ttfb", "transfer", "json_decode", "hydration", "total")
+
+
+class RequestMetrics:
+    """Measurements of one API operation, from request preparation to the
+    returned model.
+
+    Timings are in seconds. `ttfb` covers connection setup and the wait for
+    the response headers, `transfer` the download of the body; both are
+    summed over every attempt when the operation is retried. `exception` is
+    the type name of the exception the operation raised, if any.
+    """
+
+    def __init__(self, operation_id, method=None, path=None):
+        self.operation_id = operation_id
+        self.method = method
+        self.path = path
+        self.status_code = None
+        self.error_code = None
+        self.exception = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.attempts = 0
+        self.hedges = 0
+        self.retry_wait = 0.0
+        self.rate_limit_wait = 0.0
+        self.queue_wait = 0.0
+        self.timings = dict.fromkeys(TIMING_PHASES, 0.0)
+        self.start_time = time.time()
+        self.end_time = None
+
+    @property
+    def retries(self):
+        return max(0, self.attempts - 1)
+
+    def add_timing(self, phase, seconds):
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    def finish(self):
+        self.end_time = time.time()
+        self.timings["total"] = self.end_time - self.start_time
+
+
+class AbstractMetricsHook:
+    """Receives RequestMetrics for every operation made by a client.
+
+    Register instances with `Smartsheet.add_metrics_hook`. Hooks are called
+    on the thread making the request and must be thread safe; exceptions
+    they raise are logged and otherwise ignored.
+    """
+
+    def on_request_start(self, metrics):
+        """Called once the operation's request has been prepared."""
+
+    def on_request_end(self, metrics):
+        """Called once the operation's result has been built, or once it
+        failed with an exception."""
+
+
+class PrometheusMetricsHook(AbstractMetricsHook):
+    """Export request metrics as Prometheus counters and histograms.
+
+    Requires the `prometheus_client` package.
+    """
+
+    def __init__(self, registry=None, namespace="smartsheet"):
+        from prometheus_client import REGISTRY, Counter, Histogram
+
+        registry = registry or REGISTRY
+        self._requests = Counter(
+            "requests_total",
+            "Smartsheet API operations",
+            ["operation", "status_code"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._retries = Counter(
+            "retries_total",
+            "Smartsheet API retries",
+            ["operation"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._rate_limit_wait = Counter(
+            "rate_limit_wait_seconds_total",
+            "Time spent backing off after rate limit errors",
+            ["operation"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._duration = Histogram(
+            "request_phase_seconds",
+            "Smartsheet API operation time by phase",
+            ["operation", "phase"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._bytes = Histogram(
+            "payload_bytes",
+            "Smartsheet API payload sizes",
+            ["operation", "direction"],
+            namespace=namespace,
+            registry=registry,
+            buckets=(2**10, 2**13, 2**16, 2**19, 2**22, 2**25, float("inf")),
+        )
+
+    def on_request_end(self, metrics):
+        operation = metrics.operation_id
+        status = metrics.status_code or metrics.exception
+        self._requests.labels(operation, str(status)).inc()
+        self._retries.labels(operation).inc(metrics.retries)
+        self._rate_limit_wait.labels(operation).inc(metrics.rate_limit_wait)
+        for phase, seconds in metrics.timings.items():
+            self._duration.labels(operation, phase).observe(seconds)
+        self._bytes.labels(operation, "request").observe(metrics.request_bytes)
+        self._bytes.labels(operation, "response").observe(metrics.response_bytes)
+
+
+class OpenTelemetryHook(AbstractMetricsHook):
+    """Record each operation as an OpenTelemetry client span.
+
+    Requires the `opentelemetry-api` package.
+    """
+
+    def __init__(self, tracer=None):
+        from opentelemetry import trace
+
+        self._trace = trace
+        self._tracer = tracer or trace.get_tracer(__name__)
+        self._spans = {}
+        self._lock = threading.Lock()
+
+    def on_request_start(self, metrics):
+        span = self._tracer.start_span(
+            "smartsheet." + metrics.operation_id,
+            kind=self._trace.SpanKind.CLIENT,
+            start_time=int(metrics.start_time * 1e9),
+        )
+        with self._lock:
+            self._spans[id(metrics)] = span
+
+    def on_request_end(self, metrics):
+        with self._lock:
+            span = self._spans.pop(id(metrics), None)
+        if span is None:
+            return
+        span.set_attribute("smartsheet.operation", metrics.operation_id)
+        span.set_attribute("http.method", metrics.method or "")
+        span.set_attribute("http.status_code", metrics.status_code or 0)
+        span.set_attribute("smartsheet.retries", metrics.retries)
+        span.set_attribute("smartsheet.hedges", metrics.hedges)
+        span.set_attribute("smartsheet.rate_limit_wait", metrics.rate_limit_wait)
+        span.set_attribute("smartsheet.request_bytes", metrics.request_bytes)
+        span.set_attribute("smartsheet.response_bytes", metrics.response_bytes)
+        for phase, seconds in metrics.timings.items():
+            span.set_attribute("smartsheet.timing." + phase, seconds)
+        if metrics.error_code is not None:
+            span.set_attribute("smartsheet.error_code", metrics.error_code)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        if metrics.exception is not None:
+            span.set_attribute("smartsheet.exception", metrics.exception)
+            span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end(end_time=int(metrics.end_time * 1e9))
@@ -19,8 +19,7 @@ from __future__ import absolute_import
 
 from datetime import datetime
 
-from dateutil.parser import parse
-
+from ..types import parse_timestamp
 from ..util import deserialize
 from .object_value import ObjectValue, six
 
@@ -52,5 +51,5 @@ class DateObjectValue(ObjectValue):
             self._value = value
         else:
             if isinstance(value, six.string_types):
-                value = parse(value).date()
+                value = parse_timestamp(value).date()
                 self._value = value
@@ -92,9 +92,55 @@ class DownloadedFile:
     def save_to_file(self, chunksize=2**16):
         download_path = os.path.join(self.download_directory, self.filename)
         with open(download_path, "wb") as dlfile:
-            with contextlib.closing(self.resp):
-                for chunk in self.resp.iter_content(chunksize):
-                    dlfile.write(chunk)
+            self.save_to(dlfile, chunksize)
+
+    def iter_content(self, chunksize=2**16):
+        """Yield the body as it is received, closing the response at the end."""
+        with contextlib.closing(self.resp):
+            for chunk in self.resp.iter_content(chunksize):
+                yield chunk
+
+    def save_to(self, sink, chunksize=2**16):
+        """Write the body to a sink as it is received.
+
+        Args:
+            sink: Any object with a `write(bytes)` method, such as a file, a
+                gzip.GzipFile or an object storage upload stream. It is left
+                open.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        written = 0
+        for chunk in self.iter_content(chunksize):
+            sink.write(chunk)
+            written += len(chunk)
+        return written
+
+    def iter_rows(self, encoding="utf-8-sig", chunksize=2**16):
+        """Parse a CSV export as it is received, yielding each row as a list
+        of strings, the column titles first."""
+        from ..csvio import iter_csv_rows
+
+        return iter_csv_rows(self.iter_content(chunksize), encoding)
+
+    def columns(self, dtypes=None, as_numpy=False, encoding="utf-8-sig"):
+        """Parse a CSV export as it is received into typed column buffers.
+
+        Args:
+            dtypes (dict): One of `columnar.DTYPES` by column title.
+            as_numpy (bool): Return NumPy arrays instead of `array.array`.
+
+        Returns:
+            dict: ColumnValues by column title.
+        """
+        from ..columnar import csv_columns
+
+        return csv_columns(self.iter_rows(encoding), dtypes, as_numpy)
+
+    def close(self):
+        """Release the connection without reading the rest of the body."""
+        self.resp.close()
 
     def to_dict(self):
         return serialize(self)
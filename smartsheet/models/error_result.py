@@ -36,6 +36,7 @@ class ErrorResult:
         self._name = String()
         self._recommendation = String()
         self._ref_id = String()
+        self._retry_after = Number()
         self._should_retry = Boolean()
         self._status_code = Number()
 
@@ -91,6 +92,14 @@ class ErrorResult:
     def ref_id(self, value):
         self._ref_id.value = value
 
+    @property
+    def retry_after(self):
+        return self._retry_after.value
+
+    @retry_after.setter
+    def retry_after(self, value):
+        self._retry_after.value = value
+
     @property
     def should_retry(self):
         return self._should_retry.value
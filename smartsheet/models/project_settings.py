@@ -19,9 +19,7 @@ from __future__ import absolute_import
 
 from datetime import date
 
-from dateutil.parser import parse
-
-from ..types import Number, TypedList, json, six
+from ..types import Number, TypedList, json, parse_timestamp, six
 from ..util import deserialize, serialize
 
 
@@ -61,11 +59,11 @@ class ProjectSettings:
             self._non_working_days.purge()
             for item in value:
                 if isinstance(item, six.string_types):
-                    item = parse(item).date()
+                    item = parse_timestamp(item).date()
                 if isinstance(item, date):
                     self._non_working_days.extend([item])
         elif isinstance(value, six.string_types):
-            value = parse(value).date()
+            value = parse_timestamp(value).date()
             self._non_working_days.purge()
             self._non_working_days.append(value)
         else:
@@ -17,6 +17,7 @@
 
 from __future__ import absolute_import
 
+from ..columnar import column_values
 from ..types import TypedList, TypedObject, json
 from ..util import deserialize, serialize
 from .report_column import ReportColumn
@@ -80,6 +81,28 @@ class Report(Sheet):
     def source_sheets(self, value):
         self._source_sheets.load(value)
 
+    def column_values(self, column_id, dtype=None, as_numpy=False):
+        """Extract the values of one report column of every row at once.
+
+        Args:
+            column_id (int): Virtual column ID
+            dtype (str): One of 'object', 'float64', 'int64', 'bool', 'date'
+                or 'datetime'. By default derived from the column type.
+            as_numpy (bool): Return NumPy arrays instead of `array.array`.
+
+        Returns:
+            ColumnValues
+        """
+        return column_values(
+            self.columns,
+            self.rows,
+            column_id,
+            dtype,
+            as_numpy,
+            column_key="virtual_id",
+            cell_key="virtual_column_id",
+        )
+
     def to_dict(self):
         return serialize(self)
 
@@ -17,6 +17,7 @@
 
 from __future__ import absolute_import
 
+from ..columnar import column_values
 from ..types import (Boolean, EnumeratedList, EnumeratedValue, Number, String,
                      Timestamp, TypedList, TypedObject, json)
 from ..util import deserialize, serialize
@@ -382,6 +383,20 @@ class Sheet:
     def get_row(self, row_id, include=None, exclude=None):
         return self._base.Sheets.get_row(self.id, row_id, include, exclude)
 
+    def column_values(self, column_id, dtype=None, as_numpy=False):
+        """Extract the values of one column of every row at once.
+
+        Args:
+            column_id (int): Column ID
+            dtype (str): One of 'object', 'float64', 'int64', 'bool', 'date'
+                or 'datetime'. By default derived from the column type.
+            as_numpy (bool): Return NumPy arrays instead of `array.array`.
+
+        Returns:
+            ColumnValues
+        """
+        return column_values(self.columns, self.rows, column_id, dtype, as_numpy)
+
     def get_version(self):
         return self._base.Sheets.get_sheet_version(self.id)
 
@@ -0,0 +1,222 @@
+# pylint: disable=C0111,R0902,R0903,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import importlib
+import logging
+import threading
+import time
+
+from . import models
+from .models import Error
+
+
+class _Member:
+    """A client of the pool with its request budget."""
+
+    def __init__(self, client, rate, capacity):
+        self.client = client
+        self.rate = float(rate)
+        self.capacity = float(rate if capacity is None else capacity)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.in_flight = 0
+        self.requests = 0
+        self.rate_limited = 0
+
+    def refill(self, now):
+        if now > self.updated:
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+
+    def next_token(self, now):
+        """Seconds until the budget has a token."""
+        return max(0.0, self.updated - now) + max(0.0, 1.0 - self.tokens) / self.rate
+
+
+class SmartsheetPool:
+
+    """Spread requests over several clients, such as one per access token
+    or assumed user, to add up their rate limits.
+
+    The pool exposes the same API classes as a client (`pool.Sheets`,
+    `pool.Reports`, ...). Each request is routed to the eligible client
+    with a request left in its budget and the fewest requests in flight;
+    when every budget is spent, it waits for the client whose budget
+    refills first.
+    Budgets refill at `rate` requests per second per client and a client
+    rate limited by the API gets no request until its budget refills.
+
+    Models returned keep the client that fetched them for their convenience
+    methods.
+    """
+
+    models = models
+
+    def __init__(self, clients, rate=5.0, capacity=None, eligible=None):
+        """
+        Args:
+            clients (list[Smartsheet]): Clients to route requests to.
+            rate (float or list[float]): Requests per second allowed to each
+                client, or to every client in order. The API allows 300
+                requests per minute per access token.
+            capacity (float): Requests a client may receive in a burst,
+                `rate` by default.
+            eligible: Function called with a client and an operation dict,
+                returning whether the client may make the request. All
+                clients are eligible by default.
+        """
+        clients = list(clients)
+        if not clients:
+            raise ValueError("SmartsheetPool needs at least one client")
+        rates = rate if isinstance(rate, (list, tuple)) else [rate] * len(clients)
+        if len(rates) != len(clients):
+            raise ValueError("rate must hold one value per client")
+        self._members = [
+            _Member(client, client_rate, capacity)
+            for client, client_rate in zip(clients, rates)
+        ]
+        self._eligible = eligible
+        self._lock = threading.Lock()
+        self._log = logging.getLogger(__name__)
+        self.row_coalescer = None
+
+    @property
+    def clients(self):
+        return [member.client for member in self._members]
+
+    @property
+    def raise_exceptions(self):
+        return self._members[0].client.raise_exceptions
+
+    def errors_as_exceptions(self, preference=True):
+        """Set `Smartsheet.errors_as_exceptions` on every client."""
+        for member in self._members:
+            member.client.errors_as_exceptions(preference)
+
+    def stats(self):
+        """Requests routed to each client so far.
+
+        Returns:
+            list[dict]: `requests`, `in_flight`, `rate_limited` and the
+            `tokens` left in the budget, one dict per client in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            stats = []
+            for member in self._members:
+                member.refill(now)
+                stats.append(
+                    {
+                        "requests": member.requests,
+                        "in_flight": member.in_flight,
+                        "rate_limited": member.rate_limited,
+                        "tokens": member.tokens,
+                    }
+                )
+            return stats
+
+    def prepare_request(self, _op):
+        """Choose the client making the operation and prepare its request
+        with it."""
+        member, wait = self._choose(_op)
+        if wait:
+            self._log.debug("Pool budgets spent, waiting %.2f seconds", wait)
+            time.sleep(wait)
+        _op["pool_member"] = member
+        try:
+            return member.client.prepare_request(_op)
+        except Exception:
+            self._done(member, None)
+            raise
+
+    def request(self, prepped_request, expected, operation):
+        """Make the request with the client that prepared it."""
+        member = operation.pop("pool_member")
+        result = None
+        try:
+            result = member.client.request(prepped_request, expected, operation)
+            return result
+        except Exception as ex:  # pylint: disable=broad-except
+            result = getattr(ex, "error", None)
+            raise
+        finally:
+            self._done(member, result)
+
+    def _choose(self, operation):
+        with self._lock:
+            now = time.monotonic()
+            members = [
+                member
+                for member in self._members
+                if self._eligible is None or self._eligible(member.client, operation)
+            ]
+            if not members:
+                raise ValueError(f"No client of the pool may make {operation['id']}")
+            for member in members:
+                member.refill(now)
+            with_budget = [member for member in members if member.tokens >= 1.0]
+            wait = 0.0
+            if with_budget:
+                # ties go to the most whole requests left, then the fewest sent
+                member = min(
+                    with_budget,
+                    key=lambda member: (
+                        member.in_flight,
+                        -int(member.tokens),
+                        member.requests,
+                    ),
+                )
+            else:
+                # the next token is reserved by taking it now
+                member = min(members, key=lambda member: member.next_token(now))
+                wait = member.next_token(now)
+            member.tokens -= 1.0
+            member.in_flight += 1
+            member.requests += 1
+            return member, wait
+
+    def _done(self, member, result):
+        with self._lock:
+            member.in_flight -= 1
+            if isinstance(result, Error) and result.result.code == 4003:
+                # the API knows better than the budget, let it refill
+                member.rate_limited += 1
+                member.tokens = min(member.tokens, 0.0)
+
+    def __getattr__(self, name):
+        """
+        Handle sub-class instantiation.
+
+        Args:
+            name (str): Name of smartsheet to instantiate.
+
+        Returns:
+            Instance of named class.
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            class_ = getattr(
+                importlib.import_module(__package__ + "." + name.lower()), name
+            )
+        except (ImportError, AttributeError) as ex:
+            raise AttributeError(name) from ex
+        return class_(self)
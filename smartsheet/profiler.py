@@ -0,0 +1,150 @@
+# pylint: disable=C0111
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import contextlib
+import csv
+import functools
+import sys
+import threading
+import time
+
+from .metrics import AbstractMetricsHook
+
+PROFILE_COLUMNS = (
+    "prepare",
+    "serialize",
+    "network",
+    "json_decode",
+    "deserialize",
+    "typed_list",
+    "retry_wait",
+    "total",
+)
+
+_local = threading.local()
+
+
+@contextlib.contextmanager
+def collecting(metrics):
+    """Attribute profiled phases run by this thread to `metrics`."""
+    if metrics is None:
+        yield
+        return
+    previous = getattr(_local, "metrics", None)
+    _local.metrics = metrics
+    try:
+        yield
+    finally:
+        _local.metrics = previous
+
+
+def profiled(phase):
+    """Add the time spent in the decorated function to the `phase` timing of
+    the operation being collected. Only the outermost call of a recursive
+    function is measured."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = getattr(_local, "metrics", None)
+            if metrics is None:
+                return func(*args, **kwargs)
+            active = getattr(_local, "active", None)
+            if active is None:
+                active = _local.active = set()
+            if phase in active:
+                return func(*args, **kwargs)
+            active.add(phase)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                metrics.add_timing(phase, time.perf_counter() - start)
+                active.discard(phase)
+
+        return wrapper
+
+    return decorator
+
+
+class Profiler(AbstractMetricsHook):
+    """Aggregate the time operations spend in each SDK phase, by operation id.
+
+    `network` is the time spent sending requests and reading responses,
+    `deserialize` the time building models from the parsed JSON and
+    `typed_list` the part of it converting list items.
+    """
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def on_request_end(self, metrics):
+        timings = metrics.timings
+        sample = {
+            "prepare": timings.get("prepare", 0.0),
+            "serialize": timings.get("serialize", 0.0),
+            "network": timings.get("ttfb", 0.0) + timings.get("transfer", 0.0),
+            "json_decode": timings.get("json_decode", 0.0),
+            "deserialize": timings.get("deserialize", 0.0),
+            "typed_list": timings.get("typed_list", 0.0),
+            "retry_wait": metrics.retry_wait,
+            "total": timings.get("total", 0.0),
+        }
+        with self._lock:
+            stats = self._stats.setdefault(
+                metrics.operation_id, dict.fromkeys(PROFILE_COLUMNS, 0.0)
+            )
+            stats["calls"] = stats.get("calls", 0) + 1
+            for column, seconds in sample.items():
+                stats[column] += seconds
+
+    def stats(self):
+        """Totals in seconds by operation id, with a `calls` count."""
+        with self._lock:
+            return {op_id: dict(stats) for op_id, stats in self._stats.items()}
+
+    def rows(self):
+        """One dict per operation id, slowest first."""
+        rows = [
+            dict(operation=op_id, **stats) for op_id, stats in self.stats().items()
+        ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def to_csv(self, file):
+        """Write the profile as CSV to a file object."""
+        writer = csv.DictWriter(file, ("operation", "calls") + PROFILE_COLUMNS)
+        writer.writeheader()
+        writer.writerows(self.rows())
+
+    def report(self, file=None):
+        """Print the profile as a table, times in milliseconds."""
+        file = file or sys.stdout
+        header = ["operation", "calls"] + list(PROFILE_COLUMNS)
+        lines = [header]
+        for row in self.rows():
+            lines.append(
+                [row["operation"], str(row["calls"])]
+                + [f"{row[column] * 1000:.1f}" for column in PROFILE_COLUMNS]
+            )
+        widths = [max(len(line[idx]) for line in lines) for idx in range(len(header))]
+        for line in lines:
+            cells = [line[0].ljust(widths[0])]
+            cells += [cell.rjust(width) for cell, width in zip(line[1:], widths[1:])]
+            print("  ".join(cells), file=file)
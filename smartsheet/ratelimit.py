@@ -0,0 +1,205 @@
+# pylint: disable=C0111,R0903,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+
+def token_key(access_token):
+    """Bucket key for an access token, which is not stored itself."""
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()[:32]
+
+
+class AbstractRateLimitStore:
+    """Storage of the rate limit state shared by every limiter using it.
+
+    Implement `transact` to keep the state in an external store, such as
+    Redis, so that limiters on several hosts share it.
+    """
+
+    def transact(self, key, update):
+        """Atomically replace the state of a bucket.
+
+        Args:
+            key (str): Bucket key.
+            update: Function called with the current state, a dict or None
+                for a new bucket, returning (new state, result). No other
+                transaction on the same key may run in between.
+
+        Returns:
+            The result returned by `update`.
+        """
+        raise NotImplementedError
+
+
+class MemoryRateLimitStore(AbstractRateLimitStore):
+    """State shared by the limiters of one process."""
+
+    def __init__(self):
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def transact(self, key, update):
+        with self._lock:
+            state, result = update(self._states.get(key))
+            self._states[key] = state
+            return result
+
+
+class SqliteRateLimitStore(AbstractRateLimitStore):
+    """State shared by the processes of one host through a SQLite file.
+
+    Each transaction holds the database's write lock, so processes update
+    the state one at a time. The connection is reopened after a fork.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        """
+        Args:
+            path (str): Database file, created if missing.
+            timeout (float): Seconds to wait for the write lock.
+        """
+        self._path = path
+        self._timeout = timeout
+        self._connection = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self._path,
+                timeout=self._timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits "
+                "(key TEXT PRIMARY KEY, state TEXT NOT NULL)"
+            )
+            self._pid = os.getpid()
+        return self._connection
+
+    def transact(self, key, update):
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT state FROM rate_limits WHERE key = ?", (key,)
+                ).fetchone()
+                state, result = update(None if row is None else json.loads(row[0]))
+                connection.execute(
+                    "INSERT OR REPLACE INTO rate_limits (key, state) VALUES (?, ?)",
+                    (key, json.dumps(state)),
+                )
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            return result
+
+
+class RateLimiter:
+    """Token bucket keeping every client of an access token under the API
+    rate limit, whatever process they run in.
+
+    Each request takes a token from the bucket of its access token, which
+    refills at `rate` tokens per second up to `capacity`, and waits when the
+    bucket is empty. When a request is rate limited anyway, the wait the
+    server asks for is recorded and every client sharing the store holds
+    its requests until then, instead of each discovering the limit on its
+    own. The state lives in `store`: in memory by default, in a
+    SqliteRateLimitStore to share it between processes.
+    """
+
+    def __init__(self, rate=5.0, capacity=None, store=None):
+        """
+        Args:
+            rate (float): Requests per second per access token. The API
+                allows 300 requests per minute.
+            capacity (float): Requests that may be sent in a burst, `rate`
+                by default.
+            store (AbstractRateLimitStore): Shared state, a new
+                MemoryRateLimitStore by default.
+        """
+        self._rate = float(rate)
+        self._capacity = float(rate if capacity is None else capacity)
+        self._store = store or MemoryRateLimitStore()
+        self._log = logging.getLogger(__name__)
+
+    def _refill(self, state, now):
+        # `updated` is in the future while the bucket is throttled
+        if state is None:
+            return {"tokens": self._capacity, "updated": now}
+        if now > state["updated"]:
+            elapsed = now - state["updated"]
+            state["tokens"] = min(
+                self._capacity, state["tokens"] + elapsed * self._rate
+            )
+            state["updated"] = now
+        return state
+
+    def acquire(self, key, max_wait=None):
+        """Take a token, sleeping until it is available.
+
+        Args:
+            key (str): Bucket key, see `token_key`.
+            max_wait (float): Longest acceptable wait in seconds. No token
+                is taken when the wait would be longer.
+
+        Returns:
+            float: Seconds waited, or None if the wait would exceed
+            `max_wait`.
+        """
+
+        def take(state):
+            now = time.time()
+            state = self._refill(state, now)
+            # tokens go negative: each waiter reserves the next free one
+            wait = state["updated"] - now
+            wait += max(0.0, 1.0 - state["tokens"]) / self._rate
+            if max_wait is not None and wait > max_wait:
+                return state, None
+            state["tokens"] -= 1.0
+            return state, wait
+
+        wait = self._store.transact(key, take)
+        if wait:
+            self._log.debug("Rate limiter: waiting %.2f seconds", wait)
+            time.sleep(wait)
+        return wait
+
+    def throttle(self, key, seconds):
+        """Hold every request of the bucket for `seconds`, after the API
+        rate limited one."""
+
+        def block(state):
+            now = time.time()
+            state = self._refill(state, now)
+            state["updated"] = max(state["updated"], now + seconds)
+            state["tokens"] = min(state["tokens"], 0.0)
+            return state, None
+
+        self._store.transact(key, block)
@@ -21,7 +21,12 @@ import logging
 import os.path
 from datetime import datetime
 
+import six
+
 from . import fresh_operation
+from .models import Error, Report, ReportRow
+from .smartsheet import error_as_exception
+from .util import bounded_map
 
 
 class Reports:
@@ -87,6 +92,60 @@ class Reports:
 
         return response
 
+    def iter_report_rows(
+        self,
+        report_id,
+        page_size=1000,
+        include=None,
+        level=None,
+        prefetch=2,
+        raw=False,
+    ):
+        """Iterate over every Row of the specified Report.
+
+        The first page is fetched right away; the following pages are
+        fetched `prefetch` at a time in the background while the rows of
+        the current page are consumed, so only a few pages are ever held in
+        memory. Columns and source sheets are kept once, from the first
+        page, on the iterator's `report` attribute.
+
+        Errors are raised as exceptions whether or not
+        `errors_as_exceptions` is set.
+
+        Args:
+            report_id (int): Report ID
+            page_size (int): The number of rows to fetch per page.
+            include (list[str]): A comma-separated list of
+                optional elements to include in the response. Valid list values:
+                attachments, discussions, format, objectValue, scope, source, sourceSheets.
+            level (int): Compatibility level of the response.
+            prefetch (int): The number of pages fetched concurrently.
+            raw (bool): Yield rows as parsed JSON dicts instead of ReportRow.
+
+        Returns:
+            ReportRowIterator
+        """
+        return ReportRowIterator(
+            self, report_id, page_size, include, level, prefetch, raw
+        )
+
+    def _get_report_page(self, report_id, page, page_size, include, level):
+        _op = fresh_operation("get_report")
+        _op["method"] = "GET"
+        _op["path"] = "/reports/" + str(report_id)
+        _op["query_params"]["pageSize"] = page_size
+        _op["query_params"]["page"] = page
+        _op["query_params"]["include"] = include
+        _op["query_params"]["level"] = level
+
+        expected = "JSONObject"
+        prepped_request = self._base.prepare_request(_op)
+        response = self._base.request(prepped_request, expected, _op)
+        if isinstance(response, Error):
+            raise error_as_exception(response)
+
+        return response.data
+
     def get_report_as_csv(self, report_id, download_path, alternate_file_name=None):
         """Get the specified Report as a CSV file.
 
@@ -149,6 +208,55 @@ class Reports:
         response.save_to_file()
         return response
 
+    def stream_report_as_csv(self, report_id):
+        """Get the specified Report as CSV without saving it.
+
+        The body is not read until the DownloadedFile is consumed with
+        `iter_content`, `save_to`, `iter_rows` or `columns`; call `close`
+        when it is not.
+
+        Args:
+            report_id (int): Report ID
+
+        Returns:
+            DownloadedFile
+        """
+        _op = fresh_operation("stream_report_as_csv")
+        _op["method"] = "GET"
+        _op["path"] = "/reports/" + str(report_id)
+        _op["header_params"]["Accept"] = "text/csv"
+        _op["stream"] = True
+
+        expected = "DownloadedFile"
+        prepped_request = self._base.prepare_request(_op)
+        response = self._base.request(prepped_request, expected, _op)
+
+        return response
+
+    def stream_report_as_excel(self, report_id):
+        """Get the specified Report as an Excel .xls document without saving it.
+
+        The body is not read until the DownloadedFile is consumed with
+        `iter_content` or `save_to`; call `close` when it is not.
+
+        Args:
+            report_id (int): Report ID
+
+        Returns:
+            DownloadedFile
+        """
+        _op = fresh_operation("stream_report_as_excel")
+        _op["method"] = "GET"
+        _op["path"] = "/reports/" + str(report_id)
+        _op["header_params"]["Accept"] = "application/vnd.ms-excel"
+        _op["stream"] = True
+
+        expected = "DownloadedFile"
+        prepped_request = self._base.prepare_request(_op)
+        response = self._base.request(prepped_request, expected, _op)
+
+        return response
+
     def get_share(self, report_id, share_id):
         """Get the specified Share.
 
@@ -379,3 +487,65 @@ class Reports:
         response = self._base.request(prepped_request, expected, _op)
 
         return response
+
+
+class ReportRowIterator:
+
+    """Rows of a Report, fetched page by page as they are iterated.
+
+    Attributes:
+        report (Report): The Report from the first page, without its rows.
+        total_row_count (int): The number of rows the iterator yields.
+    """
+
+    def __init__(self, reports, report_id, page_size, include, level, prefetch, raw):
+        if isinstance(include, six.string_types):
+            include = include.split(",")
+        include = list(include or [])
+        self._reports = reports
+        self._report_id = report_id
+        self._page_size = page_size
+        self._level = level
+        self._prefetch = max(1, prefetch)
+        self._raw = raw
+        # source sheets are only worth transferring once
+        self._page_include = ",".join(
+            item for item in include if item != "sourceSheets"
+        ) or None
+
+        first_page = reports._get_report_page(
+            report_id, 1, page_size, ",".join(include) or None, level
+        )
+        self._first_rows = first_page.pop("rows", [])
+        self.report = Report(first_page, reports._base)
+        self.total_row_count = self.report.total_row_count or 0
+
+    def __iter__(self):
+        if self._first_rows is None:
+            raise RuntimeError("ReportRowIterator can only be iterated once")
+        pages = max(1, -(-self.total_row_count // self._page_size))
+
+        # the first page is already here, requesting it through the pool
+        # starts prefetching the next ones while its rows are consumed
+        for rows in bounded_map(
+            self._fetch_rows, range(1, pages + 1), self._prefetch, self._prefetch + 1
+        ):
+            for row in rows:
+                yield self._hydrate(row)
+
+    def __len__(self):
+        return self.total_row_count
+
+    def _fetch_rows(self, page):
+        if page == 1:
+            rows, self._first_rows = self._first_rows, None
+            return rows
+        page = self._reports._get_report_page(
+            self._report_id, page, self._page_size, self._page_include, self._level
+        )
+        return page.get("rows", [])
+
+    def _hydrate(self, row):
+        if self._raw:
+            return row
+        return ReportRow(row, self._reports._base)
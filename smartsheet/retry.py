@@ -0,0 +1,259 @@
+# pylint: disable=C0111,R0903
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import collections
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+
+class RetryPolicy:
+    """Backoff settings for one class of retryable error."""
+
+    def __init__(self, base_delay=1.0, max_delay=30.0, idempotent_only=False):
+        """
+        Args:
+            base_delay (float): Shortest wait in seconds before a retry.
+            max_delay (float): Longest wait in seconds between two attempts.
+            idempotent_only (bool): Only retry requests that are safe to
+                repeat, because the server may have acted on the first one.
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.idempotent_only = idempotent_only
+
+    def next_backoff(self, previous_backoff):
+        """Decorrelated jitter: a random wait between the base delay and
+        three times the previous wait, capped at the maximum delay."""
+        upper = max(self.base_delay, previous_backoff * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+
+class RetryBudget:
+    """Limit retries to a fraction of successful requests.
+
+    A budget may be shared by every thread and client in a process. Each
+    success deposits `ratio` tokens and each retry withdraws one, so when an
+    incident makes most requests fail the fleet stops amplifying it with
+    retries instead of retrying in lock step.
+    """
+
+    def __init__(self, ratio=0.1, max_tokens=100):
+        """
+        Args:
+            ratio (float): Retries allowed per successful request.
+            max_tokens (int): Retries that can be banked, also the
+                initial balance.
+        """
+        self._ratio = ratio
+        self._max_tokens = float(max_tokens)
+        self._tokens = float(max_tokens)
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+    def record_success(self):
+        with self._lock:
+            self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_acquire(self):
+        """Withdraw one retry from the budget, False if it is exhausted."""
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class CircuitBreaker:
+    """Stop sending requests while the API is failing.
+
+    The breaker watches the outcome of the last `window` attempts. Once at
+    least `min_calls` were made and `failure_rate` of them failed with a
+    server error (system maintenance, server timeout, an unexpected error
+    or a 5xx status) or a connection error, it opens: calls fail at once
+    with `CircuitOpenError` instead of reaching the API. After
+    `reset_timeout` seconds it half-opens and lets `probes` requests
+    through; it closes when they all succeed and opens again as soon as one
+    fails. A breaker may be shared by every thread and client in a process.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    FAILURE_CODES = frozenset([4001, 4002, 4004])
+
+    def __init__(
+        self,
+        failure_rate=0.5,
+        window=20,
+        min_calls=10,
+        reset_timeout=30.0,
+        probes=1,
+        failure_codes=None,
+    ):
+        """
+        Args:
+            failure_rate (float): Share of failed attempts opening the breaker.
+            window (int): The number of recent attempts considered.
+            min_calls (int): Attempts needed before the breaker can open.
+            reset_timeout (float): Seconds the breaker stays open.
+            probes (int): Requests let through, one at a time or
+                concurrently, to test the API once it half-opens.
+            failure_codes (set[int]): API error codes counted as failures,
+                `FAILURE_CODES` by default. 5xx statuses always count.
+        """
+        self._failure_rate = failure_rate
+        self._min_calls = min_calls
+        self._reset_timeout = reset_timeout
+        self._probes = probes
+        self._failure_codes = (
+            self.FAILURE_CODES if failure_codes is None else frozenset(failure_codes)
+        )
+        self._outcomes = collections.deque(maxlen=window)
+        self._state = self.CLOSED
+        # bumped on every state change, outcomes of older attempts are stale
+        self._generation = 0
+        self._opened_at = 0.0
+        self._probing = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        with self._lock:
+            self._half_open_if_due()
+            return self._state
+
+    def retry_after(self):
+        """Seconds until the breaker half-opens, 0 unless it is open."""
+        with self._lock:
+            if self._state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self._reset_timeout - time.monotonic())
+
+    def is_failure(self, error_result):
+        """Whether an ErrorResult is a sign that the API is failing."""
+        return (
+            error_result.code in self._failure_codes
+            or (error_result.status_code or 0) >= 500
+        )
+
+    def allow(self):
+        """Reserve an attempt.
+
+        Returns:
+            A permit to pass to `record_success`, `record_failure` or, when
+            the attempt has no outcome, `release`; None if the attempt must
+            not be made. Outcomes of attempts reserved before the breaker
+            last changed state are ignored.
+        """
+        with self._lock:
+            self._half_open_if_due()
+            if self._state == self.CLOSED:
+                return (self._generation, False)
+            if self._state == self.HALF_OPEN and self._probing < self._probes:
+                self._probing += 1
+                return (self._generation, True)
+            return None
+
+    def record_success(self, permit):
+        with self._lock:
+            if not self._current(permit):
+                return
+            if permit[1]:
+                self._probing -= 1
+                self._probe_successes += 1
+                if self._probe_successes >= self._probes:
+                    self._state = self.CLOSED
+                    self._generation += 1
+                    self._outcomes.clear()
+                return
+            self._outcomes.append(False)
+
+    def record_failure(self, permit):
+        with self._lock:
+            if not self._current(permit):
+                return
+            if permit[1]:
+                self._probing -= 1
+                self._open()
+                return
+            self._outcomes.append(True)
+            if (
+                len(self._outcomes) >= self._min_calls
+                and sum(self._outcomes) >= self._failure_rate * len(self._outcomes)
+            ):
+                self._open()
+
+    def release(self, permit):
+        """Give back a permit whose attempt failed without reaching the API."""
+        with self._lock:
+            if self._current(permit) and permit[1]:
+                self._probing -= 1
+
+    def _current(self, permit):
+        return permit[0] == self._generation
+
+    def _open(self):
+        self._state = self.OPEN
+        self._generation += 1
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+    def _half_open_if_due(self):
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self._reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._generation += 1
+            self._probing = 0
+            self._probe_successes = 0
+
+
+def is_idempotent(prepped_request, operation):
+    """Whether repeating the request cannot apply its effect twice."""
+    if operation.get("idempotent") is not None:
+        return operation["idempotent"]
+    return prepped_request.method in IDEMPOTENT_METHODS
+
+
+def parse_retry_after(value):
+    """Parse a Retry-After header into seconds, None if absent or invalid."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
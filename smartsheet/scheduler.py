@@ -0,0 +1,171 @@
+# pylint: disable=C0111,R0902,R0903,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import collections
+import itertools
+import threading
+import time
+
+BATCH_OPERATIONS = frozenset(
+    ["add_rows", "update_rows", "delete_rows", "copy_rows", "move_rows"]
+)
+
+
+class PriorityClass:
+    """Share of the request slots given to one class of traffic."""
+
+    def __init__(self, weight=1.0, max_concurrency=None):
+        """
+        Args:
+            weight (float): Relative share of the slots when classes compete.
+            max_concurrency (int): Requests of the class in flight at once,
+                whatever the load of other classes. Unlimited by default.
+        """
+        self.weight = float(weight)
+        self.max_concurrency = max_concurrency
+
+
+class _Ticket:
+    def __init__(self, tag, seq):
+        self.tag = tag
+        self.seq = seq
+        self.granted = False
+
+
+class RequestScheduler:
+    """Hand out request slots to priority classes by weighted fair queuing.
+
+    At most `max_concurrency` requests are in flight. When slots are
+    contended, each class gets them in proportion to its weight, and never
+    more than its own `max_concurrency`: with the default classes an
+    interactive request waits behind at most one batch request for every
+    eight interactive ones, however many batch requests are queued.
+
+    Requests are classed by the client's `priority` block they are made in,
+    then by `operation_classes`, then `default_class`. A scheduler may be
+    shared between clients so they share the same slots.
+    """
+
+    def __init__(
+        self,
+        max_concurrency=8,
+        classes=None,
+        operation_classes=None,
+        default_class="interactive",
+    ):
+        """
+        Args:
+            max_concurrency (int): Requests in flight at once, usually the
+                client's `max_connections`.
+            classes (dict): PriorityClass by name. By default 'interactive'
+                with weight 8 and 'batch' with weight 1.
+            operation_classes (dict): Class name by operation id. By default
+                bulk row operations (`BATCH_OPERATIONS`) are 'batch'.
+            default_class (str): Class of the other requests.
+        """
+        if classes is None:
+            classes = {
+                "interactive": PriorityClass(weight=8),
+                "batch": PriorityClass(weight=1),
+            }
+        if operation_classes is None:
+            operation_classes = dict.fromkeys(BATCH_OPERATIONS, "batch")
+            if "batch" not in classes:
+                operation_classes = {}
+        unknown = (set(operation_classes.values()) | {default_class}) - set(classes)
+        if unknown:
+            raise ValueError(f"Unknown priority classes {sorted(unknown)}")
+        self._max_concurrency = max_concurrency
+        self._classes = dict(classes)
+        self._operation_classes = dict(operation_classes)
+        self._default_class = default_class
+        self._queues = {name: collections.deque() for name in classes}
+        self._last_tag = dict.fromkeys(classes, 0.0)
+        self._in_flight = dict.fromkeys(classes, 0)
+        self._running = 0
+        self._virtual_time = 0.0
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def class_for(self, operation, priority=None):
+        if priority is not None:
+            if priority not in self._classes:
+                raise ValueError(f"Unknown priority class {priority!r}")
+            return priority
+        return self._operation_classes.get(operation["id"], self._default_class)
+
+    def in_flight(self, name):
+        with self._cond:
+            return self._in_flight[name]
+
+    def acquire(self, name, deadline=None):
+        """Wait for a slot for a request of class `name`.
+
+        Args:
+            deadline (float): `time.time()` after which to stop waiting.
+
+        Returns:
+            bool: True once the slot is held, False if the deadline passed.
+        """
+        with self._cond:
+            # finish tag: one request's worth of the class's share
+            tag = max(self._virtual_time, self._last_tag[name])
+            tag += 1.0 / self._classes[name].weight
+            self._last_tag[name] = tag
+            ticket = _Ticket(tag, next(self._seq))
+            self._queues[name].append(ticket)
+            self._dispatch()
+            while not ticket.granted:
+                timeout = None
+                if deadline is not None:
+                    timeout = deadline - time.time()
+                    if timeout <= 0:
+                        self._queues[name].remove(ticket)
+                        return False
+                self._cond.wait(timeout)
+            return True
+
+    def release(self, name):
+        with self._cond:
+            self._running -= 1
+            self._in_flight[name] -= 1
+            self._dispatch()
+
+    def _dispatch(self):
+        granted = False
+        while self._running < self._max_concurrency:
+            best = None
+            for name, queue in self._queues.items():
+                cap = self._classes[name].max_concurrency
+                if not queue or (cap is not None and self._in_flight[name] >= cap):
+                    continue
+                head = queue[0]
+                if best is None or (head.tag, head.seq) < (best[1].tag, best[1].seq):
+                    best = (name, head)
+            if best is None:
+                break
+            name, ticket = best
+            self._queues[name].popleft()
+            self._virtual_time = ticket.tag
+            self._running += 1
+            self._in_flight[name] += 1
+            ticket.granted = True
+            granted = True
+        if granted:
+            self._cond.notify_all()
@@ -22,20 +22,36 @@ import ssl
 
 import certifi
 import requests
-from requests.adapters import HTTPAdapter
+from requests.adapters import BaseAdapter, HTTPAdapter
 from requests.packages.urllib3.poolmanager import PoolManager
 from requests.packages.urllib3.util import Retry
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 _TRUSTED_CERT_FILE = certifi.where()
 
+# connection-specific headers are not allowed on an HTTP/2 connection
+_HOP_BY_HOP_HEADERS = frozenset(
+    ["connection", "keep-alive", "proxy-connection", "transfer-encoding", "upgrade"]
+)
+
+
+def _create_ssl_context():
+    ctx = ssl.create_default_context()
+    ctx.options |= ssl.OP_NO_SSLv2
+    ctx.options |= ssl.OP_NO_SSLv3
+    ctx.options |= ssl.OP_NO_TLSv1
+    return ctx
+
 
 class _SSLAdapter(HTTPAdapter):
     def create_ssl_context(self):
-        ctx = ssl.create_default_context()
-        ctx.options |= ssl.OP_NO_SSLv2
-        ctx.options |= ssl.OP_NO_SSLv3
-        ctx.options |= ssl.OP_NO_TLSv1
-        return ctx
+        return _create_ssl_context()
 
     def init_poolmanager(self, connections, maxsize, block=False):
         self.poolmanager = PoolManager(
@@ -48,18 +64,151 @@ class _SSLAdapter(HTTPAdapter):
         )
 
 
-def pinned_session(pool_maxsize=8):
-    http_adapter = _SSLAdapter(
-        pool_connections=4,
-        pool_maxsize=pool_maxsize,
-        max_retries=Retry(
-            total=1, allowed_methods=Retry.DEFAULT_ALLOWED_METHODS.union(["POST"])
-        ),
-    )
+class _HTTP2RawResponse:
+    """File-like view of an httpx response, used as `requests.Response.raw`."""
+
+    def __init__(self, resp):
+        self._resp = resp
+        self._chunks = None
+        self._buffer = b""
+
+    @property
+    def http_version(self):
+        return self._resp.http_version
+
+    def stream(self, amt=2**16, decode_content=True):
+        for chunk in self._resp.iter_bytes(amt):
+            yield chunk
+
+    def read(self, amt=None, decode_content=True):
+        if self._chunks is None:
+            self._chunks = self._resp.iter_bytes()
+        if amt is None:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+        while len(self._buffer) < amt:
+            try:
+                self._buffer += next(self._chunks)
+            except StopIteration:
+                break
+        data, self._buffer = self._buffer[:amt], self._buffer[amt:]
+        return data
+
+    def close(self):
+        self._resp.close()
+
+    def release_conn(self):
+        self._resp.close()
+
+
+class _HTTP2Adapter(BaseAdapter):
+    """Transport adapter multiplexing requests over HTTP/2 connections.
+
+    Many concurrent requests share each connection, so `pool_maxsize`
+    bounds the number of TLS connections rather than in-flight requests.
+    With `http1` False, plain-text connections speak HTTP/2 with prior
+    knowledge (h2c) instead of falling back to HTTP/1.1.
+    """
+
+    def __init__(self, pool_maxsize=8, proxies=None, http1=True):
+        if httpx is None:
+            raise ImportError(
+                "HTTP/2 support requires the httpx package, "
+                "install it with: pip install 'httpx[http2]'"
+            )
+        super().__init__()
+        limits = httpx.Limits(
+            max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+        )
+        ssl_context = _create_ssl_context()
+        ssl_context.load_verify_locations(cafile=_TRUSTED_CERT_FILE)
+        transport_args = {
+            "http1": http1,
+            "http2": True,
+            "verify": ssl_context,
+            "limits": limits,
+            "retries": 1,
+        }
+        proxy = (proxies or {}).get("https")
+        if proxy:
+            transport_args["proxy"] = proxy
+        self._client = httpx.Client(transport=httpx.HTTPTransport(**transport_args))
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        headers = [
+            (name, value)
+            for name, value in request.headers.items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        ]
+        try:
+            http2_request = self._client.build_request(
+                request.method,
+                request.url,
+                headers=headers,
+                content=request.body,
+                timeout=_http2_timeout(timeout),
+            )
+            resp = self._client.send(http2_request, stream=True)
+            if not stream:
+                resp.read()
+        except httpx.TimeoutException as ex:
+            if isinstance(ex, httpx.ConnectTimeout):
+                raise requests.exceptions.ConnectTimeout(ex, request=request) from ex
+            raise requests.exceptions.ReadTimeout(ex, request=request) from ex
+        except httpx.TransportError as ex:
+            if isinstance(ex.__context__, ssl.SSLError):
+                raise requests.exceptions.SSLError(ex, request=request) from ex
+            raise requests.exceptions.ConnectionError(ex, request=request) from ex
+
+        return self.build_response(request, resp, stream)
+
+    def build_response(self, req, resp, stream):
+        response = requests.Response()
+        response.status_code = resp.status_code
+        response.headers = CaseInsensitiveDict(resp.headers.items())
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.reason = resp.reason_phrase
+        response.url = req.url
+        response.request = req
+        response.connection = self
+        response.raw = _HTTP2RawResponse(resp)
+        if not stream:
+            response._content = resp.content  # pylint: disable=W0212
+            resp.close()
+        return response
+
+    def close(self):
+        self._client.close()
+
+
+def _http2_timeout(timeout):
+    """Translate a requests-style timeout into an httpx.Timeout."""
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return httpx.Timeout(connect=connect, read=read, write=read, pool=connect)
+    return httpx.Timeout(timeout)
+
+
+def pinned_session(pool_maxsize=8, http2=False, proxies=None):
+    if http2:
+        http_adapter = _HTTP2Adapter(pool_maxsize=pool_maxsize, proxies=proxies)
+    else:
+        http_adapter = _SSLAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(
+                total=1, allowed_methods=Retry.DEFAULT_ALLOWED_METHODS.union(["POST"])
+            ),
+        )
 
     _session = requests.session()
     _session.hooks = {"response": redact_token}
     _session.mount("https://", http_adapter)
+    if proxies:
+        _session.proxies = proxies
 
     return _session
 
@@ -24,11 +24,14 @@ from datetime import datetime
 import six
 
 from . import fresh_operation
+from .csvio import fix_column_types, iter_csv, table_rows
+from .exceptions import ApiError
 from .models.column import Column
+from .models.error import Error
 from .models.row import Row
 from .models.summary_field import SummaryField
 from .types import TypedList
-from .util import deprecated
+from .util import bounded_map, deprecated, split_ids
 
 
 class Sheets:
@@ -310,6 +313,41 @@ class Sheets:
 
         return response
 
+    def delete_rows_in_batches(
+        self, sheet_id, ids, max_url_length=4000, max_workers=4
+    ):
+        """Delete any number of Rows from the specified Sheet.
+
+        The ids are split into batches short enough for the request URL and
+        the batches are deleted concurrently. Rows that do not exist are
+        ignored, so deleting the same ids again, or retrying a batch, is
+        harmless. A failed batch does not stop the others.
+
+        Args:
+            sheet_id (int): Sheet ID
+            ids (list[int]): Row IDs
+            max_url_length (int): The maximum length of a request URL.
+            max_workers (int): The number of batches deleted concurrently.
+
+        Returns:
+            BulkDeleteResult
+        """
+        # room for the base URL, path and ignoreRowsNotFound parameter
+        batches = split_ids(ids, max_url_length - 200)
+
+        def delete(batch):
+            try:
+                return batch, self.delete_rows(
+                    sheet_id, batch, ignore_rows_not_found=True
+                )
+            except ApiError as ex:
+                return batch, ex.error
+
+        result = BulkDeleteResult()
+        for batch, response in bounded_map(delete, batches, max_workers):
+            result.add(batch, response)
+        return result
+
     def delete_share(self, sheet_id, share_id):
         """Delete the specified Share.
 
@@ -433,7 +471,9 @@ class Sheets:
 
         return response
 
-    def get_row(self, sheet_id, row_id, include=None, exclude=None, level=None):
+    def get_row(
+        self, sheet_id, row_id, include=None, exclude=None, level=None, coalesce=True
+    ):
         """Get the specified Row of the specified Sheet.
 
         Args:
@@ -453,10 +493,16 @@ class Sheets:
                     0 - Backwards compatible text format
                     1 - multi-contact complex object
                     2 - multi-picklist complex object
+            coalesce (bool): Merge the call with concurrent calls for the
+                same sheet when the client has row coalescing enabled.
 
         Returns:
             Row
         """
+        coalescer = self._base.row_coalescer
+        if coalesce and coalescer is not None and coalescer.accepts(include):
+            return coalescer.get_row(sheet_id, row_id, include, exclude, level)
+
         _op = fresh_operation("get_row")
         _op["method"] = "GET"
         _op["path"] = "/sheets/" + str(sheet_id) + "/rows/" + str(row_id)
@@ -624,6 +670,55 @@ class Sheets:
         response.save_to_file()
         return response
 
+    def stream_sheet_as_csv(self, sheet_id):
+        """Get the specified Sheet as CSV without saving it.
+
+        The body is not read until the DownloadedFile is consumed with
+        `iter_content`, `save_to`, `iter_rows` or `columns`; call `close`
+        when it is not.
+
+        Args:
+            sheet_id (int): Sheet ID
+
+        Returns:
+            DownloadedFile
+        """
+        _op = fresh_operation("stream_sheet_as_csv")
+        _op["method"] = "GET"
+        _op["path"] = "/sheets/" + str(sheet_id)
+        _op["header_params"]["Accept"] = "text/csv"
+        _op["stream"] = True
+
+        expected = "DownloadedFile"
+        prepped_request = self._base.prepare_request(_op)
+        response = self._base.request(prepped_request, expected, _op)
+
+        return response
+
+    def stream_sheet_as_excel(self, sheet_id):
+        """Get the specified Sheet as an Excel .xls file without saving it.
+
+        The body is not read until the DownloadedFile is consumed with
+        `iter_content` or `save_to`; call `close` when it is not.
+
+        Args:
+            sheet_id (int): Sheet ID
+
+        Returns:
+            DownloadedFile
+        """
+        _op = fresh_operation("stream_sheet_as_excel")
+        _op["method"] = "GET"
+        _op["path"] = "/sheets/" + str(sheet_id)
+        _op["header_params"]["Accept"] = "application/vnd.ms-excel"
+        _op["stream"] = True
+
+        expected = "DownloadedFile"
+        prepped_request = self._base.prepare_request(_op)
+        response = self._base.request(prepped_request, expected, _op)
+
+        return response
+
     def get_sheet_as_pdf(
         self, sheet_id, download_path, paper_size=None, alternate_file_name=None
     ):
@@ -1687,8 +1782,59 @@ class Sheets:
             primary_column_index,
         )
 
+    def import_csv_rows(
+        self,
+        data,
+        sheet_name,
+        header=None,
+        primary_column_index=None,
+        column_types=None,
+        chunk_size=65536,
+    ):
+        """Imports a sheet from rows held in memory.
+
+        The rows are encoded as CSV while the request body is sent, so any
+        number of rows can be imported in one request with constant memory.
+        A streamed body cannot be sent twice, so the request is not retried.
+
+        Args:
+            data: Iterable of row sequences, dict of column sequences by
+                title, or pandas DataFrame.
+            sheet_name (string): destination sheet name
+            header (list[str]): column names, taken from the keys of a dict
+                or the columns of a DataFrame by default, whose columns
+                it otherwise selects and orders by name
+            primary_column_index (int): index (0 based) of primary column
+            column_types (dict): column type names (or Column objects with
+                the type and its options) by column name, applied after the
+                import as all columns are imported as text/number
+            chunk_size (int): approximate size in bytes of the body chunks
+
+        Returns:
+            Result
+        """
+        header, rows = table_rows(data, header)
+        response = self._import_sheet(
+            None,
+            "text/csv",
+            sheet_name,
+            None if header is None else 0,
+            primary_column_index,
+            data=iter_csv(rows, header, chunk_size),
+        )
+        if column_types and not isinstance(response, Error):
+            fix_column_types(self._base, response.result.id, column_types)
+
+        return response
+
     def _import_sheet(
-        self, file, file_type, sheet_name, header_row_index, primary_column_index
+        self,
+        file,
+        file_type,
+        sheet_name,
+        header_row_index,
+        primary_column_index,
+        data=None,
     ):
         """Internal function used to import sheet"""
 
@@ -1696,7 +1842,7 @@ class Sheets:
             head, tail = os.path.split(file)
             sheet_name = tail or os.path.basename(head)
 
-        _data = open(file, "rb").read()
+        _data = open(file, "rb").read() if data is None else data
         _op = fresh_operation("import_sheet_into_folder")
         _op["method"] = "POST"
         _op["path"] = "/sheets/import"
@@ -2043,3 +2189,30 @@ class Sheets:
                     page=page,
                 )
         return False
+
+
+class BulkDeleteResult:
+
+    """Aggregate result of `Sheets.delete_rows_in_batches`.
+
+    Attributes:
+        deleted_ids (list[int]): Ids of the rows that were deleted.
+        results (list[Result]): Result of every successful batch.
+        errors (list[tuple]): (ids, Error) of every failed batch.
+    """
+
+    def __init__(self):
+        self.deleted_ids = []
+        self.results = []
+        self.errors = []
+
+    @property
+    def batches(self):
+        return len(self.results) + len(self.errors)
+
+    def add(self, ids, response):
+        if isinstance(response, Error):
+            self.errors.append((ids, response))
+            return
+        self.results.append(response)
+        self.deleted_ids.extend(item.value for item in response.result or [])
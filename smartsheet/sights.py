@@ -19,6 +19,13 @@ import logging
 from datetime import datetime
 
 from . import fresh_operation
+from .exceptions import ApiError
+from .models import Error, Sheet
+from .models.cell_link_widget_content import CellLinkWidgetContent
+from .models.chart_widget_content import ChartWidgetContent
+from .models.report_widget_content import ReportWidgetContent
+from .smartsheet import error_as_exception
+from .util import bounded_map
 
 
 class Sights:
@@ -86,6 +93,76 @@ class Sights:
 
         return response
 
+    def get_sight_snapshot(
+        self, sight_id, max_workers=8, report_page_size=None, include=None
+    ):
+        """Get the specified Sight together with every sheet and report its
+        widgets display.
+
+        Sources referenced by several widgets are fetched once, concurrently.
+        Sheets only shown through metric widgets are fetched with just the
+        columns and rows of their cells, or just their summary fields.
+        Sources that cannot be fetched are listed in the snapshot's `errors`.
+
+        Args:
+            sight_id (int): Sight ID
+            max_workers (int): The number of sources fetched concurrently.
+            report_page_size (int): The number of rows fetched per report.
+            include (list[str]): optional include parameters of the Sight
+
+        Returns:
+            SightSnapshot
+        """
+        sight = self.get_sight(sight_id, include=include)
+        if isinstance(sight, Error):
+            raise error_as_exception(sight)
+
+        snapshot = SightSnapshot(sight)
+        sheets, reports = _widget_sources(sight.widgets)
+
+        def fetch(source):
+            source_type, source_id = source
+            try:
+                if source_type == "report":
+                    return source, self._base.Reports.get_report(
+                        source_id, page_size=report_page_size
+                    )
+                columns, rows, summary = sheets[source_id]
+                if summary and columns == set() and rows == set():
+                    return source, self._summary_only(source_id)
+                return source, self._base.Sheets.get_sheet(
+                    source_id,
+                    include="summary" if summary else None,
+                    column_ids=sorted(columns) if columns else None,
+                    row_ids=sorted(rows) if rows else None,
+                )
+            except ApiError as ex:
+                return source, ex.error
+
+        sources = [("sheet", sheet_id) for sheet_id in sheets]
+        sources += [("report", report_id) for report_id in reports]
+        for source, result in bounded_map(fetch, sources, max_workers):
+            if isinstance(result, Error):
+                self._log.warning(
+                    "Cannot fetch %s %s: %s",
+                    source[0],
+                    source[1],
+                    result.result.message,
+                )
+                snapshot.errors.append((source, result))
+            elif source[0] == "sheet":
+                snapshot.sheets[source[1]] = result
+            else:
+                snapshot.reports[source[1]] = result
+        return snapshot
+
+    def _summary_only(self, sheet_id):
+        """A Sheet holding only its id and summary fields."""
+        fields = self._base.Sheets.get_sheet_summary_fields(sheet_id, include_all=True)
+        if isinstance(fields, Error):
+            return fields
+        return Sheet({"id": sheet_id, "summary": {"fields": fields.data}})
+
     def update_sight(self, sight_id, sight_obj):
         """Updates the specified Sight.
 
@@ -368,3 +445,71 @@ class Sights:
         response = self._base.request(prepped_request, expected, _op)
 
         return response
+
+
+class SightSnapshot:
+
+    """A Sight with the sources of its widgets.
+
+    Attributes:
+        sight (Sight): The Sight.
+        sheets (dict): Sheets by id.
+        reports (dict): Reports by id.
+        errors (list[tuple]): ((type, id), Error) of the sources that could
+            not be fetched.
+    """
+
+    def __init__(self, sight):
+        self.sight = sight
+        self.sheets = {}
+        self.reports = {}
+        self.errors = []
+
+    def source(self, widget):
+        """The Sheet or Report a widget displays, None if it has none."""
+        contents = widget.contents
+        if isinstance(contents, (ReportWidgetContent, ChartWidgetContent)):
+            if contents.report_id is not None:
+                return self.reports.get(contents.report_id)
+        if isinstance(contents, (CellLinkWidgetContent, ChartWidgetContent)):
+            return self.sheets.get(contents.sheet_id)
+        return None
+
+
+def _widget_sources(widgets):
+    """Sheets and reports referenced by widgets.
+
+    Returns sheets as {id: [column_ids, row_ids, summary]}, where ids are
+    None when every column or row is needed and empty when only summary
+    fields are, and report ids as a set.
+    """
+    sheets = {}
+    reports = set()
+
+    def need(sheet_id, columns, rows, summary=False):
+        entry = sheets.setdefault(sheet_id, [set(), set(), False])
+        entry[0] = None if entry[0] is None or columns is None else entry[0] | columns
+        entry[1] = None if entry[1] is None or rows is None else entry[1] | rows
+        entry[2] = entry[2] or summary
+
+    for widget in widgets:
+        contents = widget.contents
+        if isinstance(contents, ReportWidgetContent):
+            if contents.report_id is not None:
+                reports.add(contents.report_id)
+        elif isinstance(contents, ChartWidgetContent):
+            if contents.report_id is not None:
+                reports.add(contents.report_id)
+            elif contents.sheet_id is not None:
+                need(contents.sheet_id, set(contents.included_column_ids) or None, None)
+        elif isinstance(contents, CellLinkWidgetContent):
+            for item in contents.cell_data:
+                sheet_id = item.sheet_id or contents.sheet_id
+                if sheet_id is None:
+                    continue
+                if item.row_id is None:
+                    # sheet summary field
+                    need(sheet_id, set(), set(), summary=True)
+                else:
+                    need(sheet_id, {item.column_id}, {item.row_id})
+    return sheets, reports
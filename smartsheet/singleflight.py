@@ -0,0 +1,92 @@
+# pylint: disable=C0111,R0903
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+from .exceptions import DeadlineExceededError
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result = None
+        self.exception = None
+
+
+class SingleFlight:
+
+    """Run a function once for concurrent calls with the same key.
+
+    The first caller runs the function while later callers with the same key
+    wait for and share its result, or its exception. A key is forgotten as
+    soon as its call completes, so nothing is cached.
+    """
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, func, deadline=None, operation_id=None):
+        """Call `func`, or wait for the call already running for `key`.
+
+        Args:
+            key: Identity of the call.
+            func: Function making the call.
+            deadline (float): Time after which a waiting caller gives up,
+                whatever the deadline of the running call.
+            operation_id (str): Operation reported when giving up.
+
+        Returns:
+            tuple: (result, shared), `shared` is True when the result was
+            handed to more than one caller.
+
+        Raises:
+            DeadlineExceededError: The deadline passed while waiting.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+        if not leader:
+            timeout = None if deadline is None else max(deadline - time.time(), 0)
+            if not call.done.wait(timeout):
+                with self._lock:
+                    call.waiters -= 1
+                raise DeadlineExceededError(operation_id, deadline)
+            if call.exception is not None:
+                raise call.exception
+            return call.result, True
+
+        try:
+            call.result = func()
+        except Exception as ex:  # pylint: disable=broad-except
+            call.exception = ex
+        finally:
+            with self._lock:
+                del self._calls[key]
+                shared = call.waiters > 0
+            call.done.set()
+        if call.exception is not None:
+            raise call.exception
+        return call.result, shared
@@ -17,6 +17,9 @@
 
 from __future__ import absolute_import
 
+import contextlib
+import copy
+import functools
 import importlib
 import inspect
 import json
@@ -26,16 +29,28 @@ import os
 import random
 import re
 import sys
+import threading
 import time
 
 import requests
 import six
 
 from . import __api_base__, __version__, models
-from .exceptions import ApiError, HttpError, UnexpectedRequestError
+from .coalesce import RowCoalescer
+from .exceptions import (ApiError, CircuitOpenError, DeadlineExceededError,
+                         HttpError, RateLimitExceededError,
+                         ServerTimeoutExceededError, SystemMaintenanceError,
+                         UnexpectedErrorShouldRetryError,
+                         UnexpectedRequestError)
+from .metrics import RequestMetrics
 from .models import Error, ErrorResult
+from .profiler import Profiler, collecting
+from .ratelimit import token_key
+from .retry import RetryPolicy, is_idempotent, parse_retry_after
 from .session import pinned_session
-from .util import is_multipart, serialize
+from .singleflight import SingleFlight
+from .util import (compress_body, default_accept_encoding, is_multipart,
+                   serialize, supported_encodings)
 
 __all__ = ("Smartsheet", "fresh_operation", "AbstractUserCalcBackoff")
 
@@ -54,7 +69,12 @@ def fresh_operation(op_id):
         "json": None,
         "id": op_id,
         "dl_path": None,
+        "stream": False,
         "auth_settings": "access_token",
+        "idempotent": None,
+        "timeout": None,
+        "deadline": None,
+        "metrics": None,
     }
 
     return operation
@@ -80,6 +100,12 @@ def setup_logging():
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
+def error_as_exception(error):
+    """Build the exception matching an Error result."""
+    the_ex = getattr(sys.modules[__name__], error.result.name)
+    return the_ex(error, str(error.result.code) + ": " + error.result.message)
+
+
 class AbstractUserCalcBackoff:
     def calc_backoff(self, previous_attempts, total_elapsed_time, error_result):
         raise NotImplementedError(
@@ -88,13 +114,38 @@ class AbstractUserCalcBackoff:
 
 
 class DefaultCalcBackoff(AbstractUserCalcBackoff):
-    def __init__(self, max_retry_time):
+    def __init__(self, max_retry_time, policies=None):
+        """
+        Args:
+            max_retry_time (int): maximum elapsed time in seconds across retries
+            policies (dict): RetryPolicy by error code, overriding the
+                policies derived from `OperationErrorResult.error_lookup`
+        """
         self._max_retry_time = max_retry_time
+        self._policies = policies or {}
+        self._state = threading.local()
+
+    def policy_for(self, error_code):
+        """Get the RetryPolicy for an API error code."""
+        if error_code in self._policies:
+            return self._policies[error_code]
+        entry = OperationErrorResult.error_lookup.get(
+            error_code, OperationErrorResult.error_lookup[0]
+        )
+        return RetryPolicy(
+            entry.get("base_delay", 1.0),
+            entry.get("max_delay", 30.0),
+            entry.get("idempotent_only", False),
+        )
 
     def calc_backoff(self, previous_attempts, total_elapsed_time, error_result):
         """
         Default back off calculator on retry.
 
+        Waits are drawn with decorrelated jitter from the error code's policy,
+        so clients failing at the same moment do not retry at the same moment,
+        and are never shorter than the server's Retry-After hint.
+
         Args:
             previous_attempts(int) : number of previous retry attempts
             total_elapsed_time(float): elapsed time in seconds
@@ -103,9 +154,19 @@ class DefaultCalcBackoff(AbstractUserCalcBackoff):
         Returns:
              (float) Back off time in seconds (any negative number will drop out of retry loop)
         """
-
-        # Use exponential backoff
-        backoff = (2**previous_attempts) + random.random()
+        policy = self.policy_for(error_result.code)
+
+        # the previous wait of this thread's retry loop seeds the next one
+        previous_backoff = policy.base_delay
+        if previous_attempts > 1:
+            previous_backoff = getattr(self._state, "backoff", policy.base_delay)
+        backoff = policy.next_backoff(previous_backoff)
+        self._state.backoff = backoff
+
+        if error_result.retry_after is not None:
+            backoff = max(
+                backoff, error_result.retry_after + random.uniform(0, policy.base_delay)
+            )
 
         if (total_elapsed_time + backoff) > self._max_retry_time:
             return -1
@@ -126,6 +187,20 @@ class Smartsheet:
         max_retry_time=30,
         proxies=None,
         api_base=__api_base__,
+        http2=False,
+        request_compression=None,
+        compression_threshold=16384,
+        accept_encoding=None,
+        retry_budget=None,
+        row_coalescing_window=None,
+        single_flight=False,
+        timeout=None,
+        operation_timeouts=None,
+        deadline=None,
+        circuit_breaker=None,
+        hedging=None,
+        scheduler=None,
+        rate_limiter=None,
     ):
         """
         Set up base client object.
@@ -144,6 +219,48 @@ class Smartsheet:
             proxies (dict): See the `requests module
                 <http://docs.python-requests.org/en/latest/user/advanced/#proxies>`_
                 for more details.
+            api_base (str): Base URL of the Smartsheet API.
+            http2 (bool): Multiplex concurrent requests over HTTP/2
+                connections. `max_connections` then bounds the number of
+                connections rather than the number of in-flight requests.
+                Requires the optional `httpx[http2]` package.
+            request_compression (str): Content coding used to compress
+                request bodies, one of 'gzip', 'deflate' or 'br' ('br'
+                requires the brotli package). Off by default.
+            compression_threshold (int): Minimum body size in bytes before
+                a request body is compressed.
+            accept_encoding (str): Accept-Encoding header sent with every
+                request. Defaults to all the content codings the installed
+                decoders support, including brotli when available.
+            retry_budget (RetryBudget): Budget limiting retries to a share
+                of successful requests. May be shared between clients to cap
+                retries across a whole process. Unlimited by default.
+            row_coalescing_window (float): Merge `Sheets.get_row` calls made
+                for the same sheet within this many seconds into one
+                `get_sheet` request. Off by default.
+            single_flight (bool): Send concurrent identical GET requests
+                once and share the response between their callers, each
+                getting its own copy of the result.
+            timeout (float or tuple): Seconds to wait for the connection
+                and then for each read of the response, or a (connect, read)
+                tuple. No timeout by default.
+            operation_timeouts (dict): `timeout` by operation id, such as
+                'get_sheet', overriding the client's.
+            deadline (float): Seconds a call may take in total, retries and
+                backoff included. Retries that would end past it are not
+                made and no wait lasts beyond it. No deadline by default.
+            circuit_breaker (CircuitBreaker): Breaker failing calls fast
+                with CircuitOpenError while the API is failing. May be
+                shared between clients. None by default.
+            hedging (HedgingPolicy): Policy sending a second copy of GET
+                requests slower than usual for their operation. May be
+                shared between clients. None by default.
+            scheduler (RequestScheduler): Scheduler queuing requests by
+                priority class, see `priority`. May be shared between
+                clients. None by default.
+            rate_limiter (RateLimiter): Token bucket pacing the requests of
+                every client sharing its store, across processes with a
+                SqliteRateLimitStore. None by default.
         """
 
         self.raise_exceptions = False
@@ -163,10 +280,32 @@ class Smartsheet:
             self._user_calc_backoff = max_retry_time
         else:
             self._user_calc_backoff = DefaultCalcBackoff(max_retry_time)
+        self._retry_budget = retry_budget
+        self._circuit_breaker = circuit_breaker
+        self._hedging = hedging
+        self._scheduler = scheduler
+        self._priority = threading.local()
+        self._rate_limiter = rate_limiter
+        self._rate_limit_key = token_key(self._access_token)
+        self._timeout = timeout
+        self._operation_timeouts = dict(operation_timeouts or {})
+        self._deadline = deadline
+        self._time_limit = threading.local()
+
+        self._session = pinned_session(
+            pool_maxsize=max_connections, http2=http2, proxies=proxies
+        )
 
-        self._session = pinned_session(pool_maxsize=max_connections)
-        if proxies:
-            self._session.proxies = proxies
+        if (
+            request_compression is not None
+            and request_compression not in supported_encodings()
+        ):
+            raise ValueError(
+                f"request_compression must be one of {supported_encodings()}"
+            )
+        self._request_compression = request_compression
+        self._compression_threshold = compression_threshold
+        self._accept_encoding = accept_encoding or default_accept_encoding()
 
         base_user_agent = "SmartsheetPythonSDK/" + __version__
         if user_agent:
@@ -186,6 +325,16 @@ class Smartsheet:
         self._assume_user = None
         self._test_scenario_name = None
         self._change_agent = None
+        self._metrics_hooks = []
+        self._single_flight = SingleFlight() if single_flight else None
+
+        # imported here as the directory module uses this one
+        from .directory import Directory
+
+        self.directory = Directory(self)
+        self.row_coalescer = None
+        if row_coalescing_window is not None:
+            self.row_coalescer = RowCoalescer(self, row_coalescing_window)
 
     def assume_user(self, email=None):
         """Assume identity of specified user.
@@ -236,6 +385,128 @@ class Smartsheet:
         """
         self._change_agent = change_agent
 
+    def add_metrics_hook(self, hook):
+        """
+        Report metrics for every operation made with this client.
+
+        Args:
+            hook (AbstractMetricsHook): Receives a RequestMetrics object when
+                each operation starts and ends.
+        """
+        self._metrics_hooks = self._metrics_hooks + [hook]
+
+    def remove_metrics_hook(self, hook):
+        """
+        Stop reporting metrics to a hook added with `add_metrics_hook`.
+
+        Args:
+            hook (AbstractMetricsHook): The hook to remove.
+        """
+        self._metrics_hooks = [item for item in self._metrics_hooks if item is not hook]
+
+    @contextlib.contextmanager
+    def profile(self, profiler=None):
+        """
+        Profile where the operations made in a `with` block spend their time.
+
+        Example:
+            with client.profile() as profiler:
+                client.Sheets.get_sheet(sheet_id)
+            profiler.report()
+
+        Args:
+            profiler (Profiler): Profiler to aggregate into, a new one by
+                default.
+
+        Returns:
+            Profiler
+        """
+        profiler = profiler or Profiler()
+        self.add_metrics_hook(profiler)
+        try:
+            yield profiler
+        finally:
+            self.remove_metrics_hook(profiler)
+
+    @contextlib.contextmanager
+    def time_limit(self, seconds):
+        """
+        Bound the total time of the calls made by this thread in a `with`
+        block, as the client `deadline` bounds each call.
+
+        Example:
+            with client.time_limit(10):
+                sheet = client.Sheets.get_sheet(sheet_id)
+                client.Sheets.update_rows(sheet_id, rows)
+
+        Args:
+            seconds (float): Time allowed for the whole block. Nested
+                limits cannot extend an enclosing one.
+        """
+        previous = getattr(self._time_limit, "deadline", None)
+        deadline = time.time() + seconds
+        if previous is not None:
+            deadline = min(deadline, previous)
+        self._time_limit.deadline = deadline
+        try:
+            yield
+        finally:
+            self._time_limit.deadline = previous
+
+    @contextlib.contextmanager
+    def priority(self, name):
+        """
+        Queue the requests made by this thread in a `with` block in the
+        given priority class of the client's scheduler.
+
+        Example:
+            with client.priority('batch'):
+                client.Sheets.add_rows(sheet_id, rows)
+
+        Args:
+            name (str): Name of a class of the RequestScheduler.
+        """
+        if self._scheduler is None:
+            raise ValueError("priority requires a client created with a scheduler")
+        self._scheduler.class_for({"id": None}, name)
+        previous = getattr(self._priority, "name", None)
+        self._priority.name = name
+        try:
+            yield
+        finally:
+            self._priority.name = previous
+
+    def _call_deadline(self, start_time):
+        """Time at which a call started at `start_time` must end, if any."""
+        deadlines = [getattr(self._time_limit, "deadline", None)]
+        if self._deadline is not None:
+            deadlines.append(start_time + self._deadline)
+        deadlines = [deadline for deadline in deadlines if deadline is not None]
+        return min(deadlines) if deadlines else None
+
+    def _timeout_for(self, operation):
+        """Timeout of one attempt, shortened to what is left before the
+        deadline."""
+        timeout = operation.get("timeout")
+        if timeout is None:
+            timeout = self._operation_timeouts.get(operation["id"], self._timeout)
+        deadline = operation.get("deadline")
+        if deadline is None:
+            return timeout
+        remaining = max(deadline - time.time(), 0.001)
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(min(part, remaining) for part in timeout)
+        return min(timeout, remaining)
+
+    def _notify_metrics_hooks(self, event, metrics):
+        for hook in self._metrics_hooks:
+            try:
+                getattr(hook, event)(metrics)
+            except Exception:  # pylint: disable=W0703
+                self._log.exception("Metrics hook %r failed on %s", hook, event)
+
     def request(self, prepped_request, expected, operation):
         """
         Make a request from the Smartsheet API.
@@ -252,18 +523,80 @@ class Smartsheet:
         Returns:
             The API operation result object.
         """
-        res = self.request_with_retry(prepped_request, operation)
-        native = res.native(expected)
+        metrics = operation.get("metrics")
+        if metrics is None and self._metrics_hooks:
+            metrics = RequestMetrics(
+                operation["id"], prepped_request.method, prepped_request.path_url
+            )
+            operation["metrics"] = metrics
+        if metrics is not None:
+            self._notify_metrics_hooks("on_request_start", metrics)
+
+        try:
+            key = self._single_flight_key(prepped_request, operation)
+            if key is None:
+                res = self.request_with_retry(prepped_request, operation)
+            else:
+                res, shared = self._single_flight.do(
+                    key,
+                    lambda: self._parsed(
+                        self.request_with_retry(prepped_request, operation)
+                    ),
+                    deadline=self._call_deadline(time.time()),
+                    operation_id=operation["id"],
+                )
+                if shared and isinstance(res, OperationResult):
+                    res = res.copy_for(operation)
+            with collecting(metrics):
+                native = res.native(expected)
+            if metrics is not None and isinstance(native, Error):
+                metrics.error_code = native.result.code
+        except Exception as ex:
+            if metrics is not None:
+                metrics.exception = type(ex).__name__
+            raise
+        finally:
+            # failed calls are measured too
+            if metrics is not None:
+                metrics.finish()
+                self._notify_metrics_hooks("on_request_end", metrics)
 
         if not self.raise_exceptions:
             return native
 
         if isinstance(native, self.models.Error):
-            the_ex = getattr(sys.modules[__name__], native.result.name)
-            raise the_ex(native, str(native.result.code) + ": " + native.result.message)
+            raise error_as_exception(native)
         else:
             return native
 
+    def _single_flight_key(self, prepped_request, operation):
+        """Key identifying identical requests, None if the request is not
+        shared."""
+        if (
+            self._single_flight is None
+            or prepped_request.method != "GET"
+            or prepped_request.body is not None
+            or operation["dl_path"]
+            or operation.get("stream")
+        ):
+            return None
+        # headers hold the identity of the caller, such as Assume-User
+        return (
+            prepped_request.method,
+            prepped_request.url,
+            tuple(sorted(prepped_request.headers.items())),
+        )
+
+    @staticmethod
+    def _parsed(result):
+        """Parse the JSON body once for all the callers sharing it."""
+        if isinstance(result, OperationResult):
+            try:
+                result.parsed = result.resp.json()
+            except ValueError:
+                pass
+        return result
+
     def _log_request(self, operation, response):
         """
         Wrapper for request/response logger
@@ -282,6 +615,8 @@ class Smartsheet:
             body_dumps = f'"<< {response.request.headers["Content-Type"]} content type suppressed >>"'
             if is_multipart(response.request):
                 body_dumps = '"<< multipart body suppressed >>"'
+            elif "Content-Encoding" in response.request.headers:
+                body_dumps = f'"<< {response.request.headers["Content-Encoding"]} encoded body suppressed >>"'
             elif "application/json" in response.request.headers["Content-Type"]:
                 body = response.request.body.decode("utf8")
                 body_dumps = json.dumps(json.loads(body), sort_keys=True)
@@ -292,7 +627,7 @@ class Smartsheet:
             content = response.content.decode("utf8")
             content_dumps = json.dumps(json.loads(content), sort_keys=True)
         if 200 <= response.status_code <= 299:
-            if operation["dl_path"] is None:
+            if operation["dl_path"] is None and not operation.get("stream"):
                 self._log.debug(
                     '{"response": {"statusCode": %d, "reason": "%s", "content": %s}}',
                     response.status_code,
@@ -325,22 +660,57 @@ class Smartsheet:
         Returns:
             Operation Result object.
         """
-        stream = False
-        if operation["dl_path"]:
-            stream = True
+        stream = bool(operation["dl_path"] or operation.get("stream"))
+        metrics = operation.get("metrics")
+        send_time = time.time()
         try:
-            res = self._session.send(prepped_request, stream=stream)
+            send = functools.partial(
+                self._session.send, stream=stream, timeout=self._timeout_for(operation)
+            )
+            if self._hedging is not None and self._hedging.applies(
+                prepped_request, operation, stream
+            ):
+                res, hedged = self._hedging.send(send, prepped_request, operation)
+                if hedged and metrics is not None:
+                    metrics.hedges += 1
+            else:
+                res = send(prepped_request)
+            if metrics is not None:
+                self._record_response(metrics, res, time.time() - send_time, stream)
             self._log_request(operation, res)
         except requests.exceptions.SSLError as rex:
             raise HttpError(rex, "SSL handshake error, old CA bundle or old OpenSSL?") from rex
+        except requests.exceptions.Timeout as rex:
+            deadline = operation.get("deadline")
+            if deadline is not None and time.time() >= deadline:
+                raise DeadlineExceededError(operation["id"], deadline) from rex
+            raise UnexpectedRequestError(rex.request, rex.response) from rex
         except requests.exceptions.RequestException as rex:
             raise UnexpectedRequestError(rex.request, rex.response) from rex
 
         if 200 <= res.status_code <= 299:
-            return OperationResult(res.text, res, self, operation)
+            # a streamed body is left unread for the caller to consume
+            return OperationResult("" if stream else res.text, res, self, operation)
         else:
             return OperationErrorResult(res.text, res)
 
+    @staticmethod
+    def _record_response(metrics, response, send_time, stream):
+        """Add the measurements of one attempt to the operation metrics."""
+        metrics.attempts += 1
+        metrics.status_code = response.status_code
+        body = response.request.body
+        if isinstance(body, (bytes, str)):
+            metrics.request_bytes = len(body)
+        # elapsed runs until the response headers have been parsed
+        ttfb = response.elapsed.total_seconds()
+        metrics.add_timing("ttfb", ttfb)
+        metrics.add_timing("transfer", max(0.0, send_time - ttfb))
+        if stream:
+            metrics.response_bytes += int(response.headers.get("Content-Length", 0))
+        else:
+            metrics.response_bytes += len(response.content)
+
     def request_with_retry(self, prepped_request, operation):
         """
         Perform the request with retry.
@@ -355,36 +725,160 @@ class Smartsheet:
         """
         attempt = 0
         start_time = time.time()
-        # Make a copy of the request as the access token will be redacted on response prior to logging
-        pre_redact_request = prepped_request.copy()
+        deadline = self._call_deadline(start_time)
+        operation["deadline"] = deadline
+        breaker = self._circuit_breaker
+        # The access token will be redacted on response prior to logging, keep it for retries
+        authorization = prepped_request.headers.get("Authorization")
         while True:
-            result = self._request(prepped_request, operation)
-            if isinstance(result, OperationErrorResult):
-                native = result.native("Error")
-                if native.result.should_retry:
-                    attempt += 1
-                    elapsed_time = time.time() - start_time
-                    backoff = self._user_calc_backoff.calc_backoff(
-                        attempt, elapsed_time, native.result
-                    )
-                    if backoff < 0:
-                        break
+            if deadline is not None and time.time() >= deadline:
+                raise DeadlineExceededError(operation["id"], deadline)
+            self._wait_for_rate_limit(operation, deadline)
+            slot = self._acquire_slot(operation, deadline)
+            permit = None
+            if breaker is not None:
+                permit = breaker.allow()
+                if permit is None:
+                    self._release_slot(slot)
+                    if attempt == 0:
+                        raise CircuitOpenError(breaker.retry_after())
                     self._log.info(
-                        "HttpError status_code=%s: Retrying in %.1f seconds",
+                        "HttpError status_code=%s: Circuit breaker open, not retrying",
                         native.result.status_code,
-                        backoff,
                     )
-                    time.sleep(backoff)
-                    # restore un-redacted request prior to retry
-                    prepped_request = pre_redact_request.copy()
-                else:
                     break
-            else:
+            try:
+                result = self._request(prepped_request, operation)
+                if permit is not None and result.resp.status_code >= 500:
+                    # counted before parsing, gateway error pages are not JSON
+                    breaker.record_failure(permit)
+                    permit = None
+                native = None
+                if isinstance(result, OperationErrorResult):
+                    native = result.native("Error")
+            except (HttpError, UnexpectedRequestError, DeadlineExceededError):
+                if permit is not None:
+                    breaker.record_failure(permit)
+                raise
+            except BaseException:
+                if permit is not None:
+                    breaker.release(permit)
+                raise
+            finally:
+                self._release_slot(slot)
+            if permit is not None:
+                if native is not None and breaker.is_failure(native.result):
+                    breaker.record_failure(permit)
+                else:
+                    breaker.record_success(permit)
+            if native is None:
+                if self._retry_budget is not None:
+                    self._retry_budget.record_success()
+                break
+
+            if native.result.code == 4003 and self._rate_limiter is not None:
+                # hold the other clients of the token too
+                self._rate_limiter.throttle(
+                    self._rate_limit_key, native.result.retry_after or 1.0
+                )
+            if not self._should_retry(native.result, prepped_request, operation):
                 break
+            attempt += 1
+            elapsed_time = time.time() - start_time
+            backoff = self._user_calc_backoff.calc_backoff(
+                attempt, elapsed_time, native.result
+            )
+            if backoff < 0:
+                break
+            if deadline is not None and time.time() + backoff >= deadline:
+                self._log.info(
+                    "HttpError status_code=%s: Deadline reached, not retrying",
+                    native.result.status_code,
+                )
+                break
+            if self._retry_budget is not None and not self._retry_budget.try_acquire():
+                self._log.info(
+                    "HttpError status_code=%s: Retry budget exhausted, not retrying",
+                    native.result.status_code,
+                )
+                break
+            metrics = operation.get("metrics")
+            if metrics is not None:
+                metrics.retry_wait += backoff
+                if native.result.code == 4003:
+                    metrics.rate_limit_wait += backoff
+            self._log.info(
+                "HttpError status_code=%s: Retrying in %.1f seconds",
+                native.result.status_code,
+                backoff,
+            )
+            time.sleep(backoff)
+            # restore un-redacted request prior to retry
+            if authorization is not None:
+                prepped_request.headers["Authorization"] = authorization
         return result
 
+    def _wait_for_rate_limit(self, operation, deadline):
+        """Take a token from the rate limiter, waiting for it if needed."""
+        if self._rate_limiter is None:
+            return
+        max_wait = None if deadline is None else deadline - time.time()
+        waited = self._rate_limiter.acquire(self._rate_limit_key, max_wait)
+        if waited is None:
+            raise DeadlineExceededError(operation["id"], deadline)
+        metrics = operation.get("metrics")
+        if metrics is not None:
+            metrics.rate_limit_wait += waited
+
+    def _acquire_slot(self, operation, deadline):
+        """Wait for the scheduler to let the request through, returning the
+        priority class holding the slot."""
+        if self._scheduler is None:
+            return None
+        name = self._scheduler.class_for(
+            operation, getattr(self._priority, "name", None)
+        )
+        start = time.time()
+        if not self._scheduler.acquire(name, deadline):
+            raise DeadlineExceededError(operation["id"], deadline)
+        metrics = operation.get("metrics")
+        if metrics is not None:
+            metrics.queue_wait += time.time() - start
+        return name
+
+    def _release_slot(self, slot):
+        if slot is not None:
+            self._scheduler.release(slot)
+
+    def _should_retry(self, error_result, prepped_request, operation):
+        """Decide whether a failed request may be sent again."""
+        if not error_result.should_retry:
+            return False
+        if prepped_request.body is not None and not isinstance(
+            prepped_request.body, (bytes, str)
+        ):
+            # a streamed body was consumed by the first attempt
+            return False
+        if isinstance(self._user_calc_backoff, DefaultCalcBackoff):
+            policy = self._user_calc_backoff.policy_for(error_result.code)
+            idempotent_only = policy.idempotent_only
+        else:
+            lookup = OperationErrorResult.error_lookup.get(error_result.code, {})
+            idempotent_only = lookup.get("idempotent_only", False)
+        if idempotent_only and not is_idempotent(prepped_request, operation):
+            # the server may have applied the request before failing
+            return False
+        return True
+
     def prepare_request(self, _op):
         """Generate a Requests prepared request object."""
+        start_time = time.time()
+        metrics = None
+        if self._metrics_hooks:
+            metrics = RequestMetrics(_op["id"], _op.get("method"))
+            metrics.start_time = start_time
+            _op["metrics"] = metrics
+
         if _op["header_params"]:
             _op["headers"].update(_op["header_params"])
 
@@ -393,7 +887,8 @@ class Smartsheet:
                 _op["path"] = _op["path"].replace("{" + key + "}", str(val))
 
         if _op["json"]:
-            _op["json"] = serialize(_op["json"])
+            with collecting(metrics):
+                _op["json"] = serialize(_op["json"])
 
         if _op["query_params"]:
             for key, val in six.iteritems(_op["query_params"]):
@@ -448,8 +943,34 @@ class Smartsheet:
             except KeyError:
                 pass
 
+        prepped_request.headers.update({"Accept-Encoding": self._accept_encoding})
+        self._compress_request(prepped_request)
+
+        if metrics is not None:
+            metrics.path = prepped_request.path_url
+            metrics.add_timing("prepare", time.time() - start_time)
+
         return prepped_request
 
+    def _compress_request(self, prepped_request):
+        """Compress the body of a prepared request above the size threshold."""
+        body = prepped_request.body
+        if (
+            self._request_compression is None
+            or not isinstance(body, (bytes, str))
+            or len(body) < self._compression_threshold
+            or is_multipart(prepped_request)
+        ):
+            return
+
+        prepped_request.body = compress_body(body, self._request_compression)
+        prepped_request.headers.update(
+            {
+                "Content-Encoding": self._request_compression,
+                "Content-Length": str(len(prepped_request.body)),
+            }
+        )
+
     def __getattr__(self, name):
         """
         Handle sub-class instantiation.
@@ -506,6 +1027,16 @@ class OperationResult:
         self.resp = resp
         self.dynamic_data_types = []
         self.operation = operation
+        # JSON body parsed ahead of native()
+        self.parsed = None
+
+    def copy_for(self, operation):
+        """A result for another caller of the same request, with its own
+        copy of the parsed body so that its models share nothing."""
+        result = OperationResult(self.op_result, self.resp, self._base, operation)
+        if self.parsed is not None:
+            result.parsed = copy.deepcopy(self.parsed)
+        return result
 
     def native(self, expected):
         """Initialize expected result object and return it.
@@ -516,40 +1047,45 @@ class OperationResult:
         Returns:
             Operation Result object or Operation Error Result object.
         """
+        metrics = self.operation.get("metrics") if self.operation else None
+        timer = time.time()
         try:
             if expected != "DownloadedFile":
-                data = self.resp.json()
+                data = self.resp.json() if self.parsed is None else self.parsed
             else:
                 filename = re.findall(
-                    'filename="(.+)";', self.resp.headers["Content-Disposition"]
+                    'filename="(.+)";', self.resp.headers.get("Content-Disposition", "")
                 )
 
                 data = {
                     "resultCode": 0,
                     "message": "SUCCESS",
                     "resp": self.resp,
-                    "filename": filename[0],
+                    "filename": filename[0] if filename else None,
                     "downloadDirectory": self.operation["dl_path"],
                 }
         except ValueError:
             return OperationErrorResult(self.op_result, self.resp)
 
+        if metrics is not None:
+            metrics.add_timing("json_decode", time.time() - timer)
+            timer = time.time()
+
         if isinstance(expected, list):
             klass = expected[0]
             dynamic_type = expected[1]
             class_ = getattr(importlib.import_module("smartsheet.models"), klass)
             obj = class_(data, dynamic_type, self._base)
-            if hasattr(obj, "request_response"):
-                obj.request_response = self.resp
-
-            return obj
-
-        class_ = getattr(importlib.import_module("smartsheet.models"), expected)
+        else:
+            class_ = getattr(importlib.import_module("smartsheet.models"), expected)
+            obj = class_(data, self._base)
 
-        obj = class_(data, self._base)
         if hasattr(obj, "request_response"):
             obj.request_response = self.resp
 
+        if metrics is not None:
+            metrics.add_timing("hydration", time.time() - timer)
+
         return obj
 
 
@@ -570,11 +1106,14 @@ class OperationErrorResult:
                 "in minutes (not seconds)."
             ),
             "should_retry": True,
+            "base_delay": 5.0,
+            "max_delay": 120.0,
         },
         4002: {
             "name": "ServerTimeoutExceededError",
             "recommendation": "Retry using exponential backoff.",
             "should_retry": True,
+            "idempotent_only": True,
         },
         4003: {
             "name": "RateLimitExceededError",
@@ -584,11 +1123,13 @@ class OperationErrorResult:
                 "requests."
             ),
             "should_retry": True,
+            "max_delay": 60.0,
         },
         4004: {
             "name": "UnexpectedErrorShouldRetryError",
             "recommendation": "Retry using exponential backoff.",
             "should_retry": True,
+            "idempotent_only": True,
         },
     }
 
@@ -637,6 +1178,9 @@ class OperationErrorResult:
                         "ref_id": error_payload["refId"],
                         "recommendation": recommendation,
                         "should_retry": should_retry,
+                        "retry_after": parse_retry_after(
+                            self.resp.headers.get("Retry-After")
+                        ),
                     }
                 ),
                 "request_response": self.resp,
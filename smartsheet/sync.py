@@ -0,0 +1,260 @@
+# pylint: disable=C0111,R0902,R0913
+# Smartsheet Python SDK.
+#
+# Copyright 2023 Smartsheet.com, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"): you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from __future__ import absolute_import
+
+import bisect
+
+import six
+
+from .models import Cell, Error, Row
+from .smartsheet import error_as_exception
+
+
+def _same(current, desired):
+    if current == desired:
+        return True
+    if current in (None, "") and desired in (None, ""):
+        return True
+    # numbers typed into text/number columns come back as numbers
+    numbers = (float,) + six.integer_types
+    if isinstance(current, numbers) != isinstance(desired, numbers):
+        try:
+            return float(current) == float(desired)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _stable_positions(positions):
+    """Indexes of a longest increasing subsequence of `positions`."""
+    tails, tail_idx = [], []
+    previous = [None] * len(positions)
+    for idx, position in enumerate(positions):
+        at = bisect.bisect_left(tails, position)
+        if at == len(tails):
+            tails.append(position)
+            tail_idx.append(idx)
+        else:
+            tails[at] = position
+            tail_idx[at] = idx
+        previous[idx] = tail_idx[at - 1] if at else None
+    stable = set()
+    idx = tail_idx[-1] if tail_idx else None
+    while idx is not None:
+        stable.add(idx)
+        idx = previous[idx]
+    return stable
+
+
+class SheetPatch:
+
+    """The changes turning a Sheet into the desired rows.
+
+    Attributes:
+        inserts (list[tuple]): (location, rows) groups of new Rows. Rows of
+            a group share their location and are added in one request.
+        updates (list[Row]): Existing rows with only their changed cells.
+        moves (list[tuple]): (location, rows) groups of existing Rows to
+            move, in the order they must be moved. Rows of a group share
+            their location, as the API requires within a request.
+        deletes (list[int]): Ids of the rows to delete.
+    """
+
+    def __init__(self):
+        self.inserts = []
+        self.updates = []
+        self.moves = []
+        self.deletes = []
+
+    @property
+    def changed_cells(self):
+        inserted = sum(len(row.cells) for _, rows in self.inserts for row in rows)
+        return inserted + sum(len(row.cells) for row in self.updates)
+
+    def __bool__(self):
+        return bool(self.inserts or self.updates or self.moves or self.deletes)
+
+    def apply(self, smartsheet_obj, sheet_id, batch_size=500):
+        """Send the changes: deletes, cell updates, moves then inserts.
+
+        Args:
+            smartsheet_obj (smartsheet.Smartsheet): Client making the requests.
+            sheet_id (int): Sheet ID
+            batch_size (int): The maximum number of rows per request.
+
+        Returns:
+            list[Result]: The result of every request made.
+        """
+        sheets = smartsheet_obj.Sheets
+        results = []
+
+        def check(result):
+            if isinstance(result, Error):
+                raise error_as_exception(result)
+            results.append(result)
+
+        if self.deletes:
+            deleted = sheets.delete_rows_in_batches(sheet_id, self.deletes)
+            for _, error in deleted.errors:
+                check(error)
+            results.extend(deleted.results)
+        for start in range(0, len(self.updates), batch_size):
+            batch = self.updates[start : start + batch_size]
+            check(sheets.update_rows(sheet_id, batch))
+        # rows are moved in order, each group next to a row already in place
+        for _, rows in self.moves:
+            for start in range(0, len(rows), batch_size):
+                check(sheets.update_rows(sheet_id, rows[start : start + batch_size]))
+        for _, rows in self.inserts:
+            for start in range(0, len(rows), batch_size):
+                check(sheets.add_rows(sheet_id, rows[start : start + batch_size]))
+        return results
+
+
+def diff_sheet(sheet, desired, key_column, order=False, delete_missing=True):
+    """Compute the smallest SheetPatch turning `sheet` into `desired`.
+
+    Rows are matched on the value of `key_column`. Only the columns present
+    in the desired rows are compared, so other columns are left untouched.
+    Rows of the sheet whose key cell is empty are never updated, moved or
+    deleted.
+
+    Args:
+        sheet (Sheet): The current sheet, with its columns and rows.
+        desired (list[dict]): The desired rows, as dicts of values by column
+            id or title.
+        key_column: Id or title of the column identifying rows.
+        order (bool): Also reorder rows to match `desired`, moving as few
+            rows as possible. Only top-level rows are moved, together with
+            their children.
+        delete_missing (bool): Delete the rows whose key is not desired, and
+            all but the first of rows sharing a key.
+
+    Returns:
+        SheetPatch
+
+    Raises:
+        ValueError: A column is not found, or a desired key is empty or
+            duplicated.
+    """
+    column_ids = {column.id for column in sheet.columns}
+    titles = {column.title: column.id for column in sheet.columns}
+
+    def column_id(key):
+        if key in column_ids:
+            return key
+        if key in titles:
+            return titles[key]
+        raise ValueError(f"Column {key!r} not found")
+
+    key_id = column_id(key_column)
+    patch = SheetPatch()
+
+    current = {}
+    for position, row in enumerate(sheet.rows):
+        values = {cell.column_id: cell.value for cell in row.cells}
+        key = values.get(key_id)
+        if key in (None, ""):
+            # rows without a key cannot be matched, leave them alone
+            continue
+        if key in current:
+            if delete_missing:
+                patch.deletes.append(row.id)
+            continue
+        current[key] = (position, row, values)
+
+    seen = set()
+    # desired rows with their matching row, None for inserts
+    matched = []
+    for values in desired:
+        values = {column_id(key): value for key, value in six.iteritems(values)}
+        key = values.get(key_id)
+        if key in (None, ""):
+            raise ValueError(f"Desired row {values!r} has no key")
+        if key in seen:
+            raise ValueError(f"Duplicate key {key!r} in desired rows")
+        seen.add(key)
+        match = current.get(key)
+        matched.append((values, match))
+        if match is None:
+            continue
+        _, row, current_values = match
+        # an empty string clears a cell, None would be left out
+        changed = [
+            Cell({"columnId": col_id, "value": "" if value is None else value})
+            for col_id, value in six.iteritems(values)
+            if not _same(current_values.get(col_id), value)
+        ]
+        if changed:
+            patch.updates.append(Row({"id": row.id, "cells": changed}))
+
+    if delete_missing:
+        patch.deletes.extend(
+            row.id for key, (_, row, _) in six.iteritems(current) if key not in seen
+        )
+
+    if not order:
+        new_rows = [_new_row(values) for values, match in matched if match is None]
+        if new_rows:
+            patch.inserts.append(({"toBottom": True}, new_rows))
+        return patch
+
+    top_level = [
+        (idx, match[0])
+        for idx, (_, match) in enumerate(matched)
+        if match is not None and match[1].parent_id is None
+    ]
+    stable = _stable_positions([position for _, position in top_level])
+    moved = {idx for pos, (idx, _) in enumerate(top_level) if pos not in stable}
+
+    anchor = None
+    group = None
+    move_group = None
+    for idx, (values, match) in enumerate(matched):
+        if match is None:
+            location = {"toTop": True} if anchor is None else {"siblingId": anchor}
+            if group is None or group[0] != location:
+                group = (location, [])
+                patch.inserts.append(group)
+            group[1].append(_new_row(values, location))
+            continue
+        row = match[1]
+        if row.parent_id is not None:
+            continue
+        if idx in moved:
+            # consecutive moved rows follow the same row, in order
+            if move_group is None:
+                location = {"toTop": True} if anchor is None else {"siblingId": anchor}
+                move_group = (location, [])
+                patch.moves.append(move_group)
+            move_group[1].append(Row(dict(move_group[0], id=row.id)))
+        else:
+            move_group = None
+        anchor = row.id
+        group = None
+    return patch
+
+
+def _new_row(values, location=None):
+    props = dict(location or {"toBottom": True})
+    props["cells"] = [
+        {"columnId": col_id, "value": value}
+        for col_id, value in six.iteritems(values)
+        if value is not None
+    ]
+    return Row(props)
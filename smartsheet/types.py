@@ -22,14 +22,79 @@ except ImportError:
     # For Python versions 2.7 and 3.3 to 3.9, import from collections
     from collections import MutableSequence
 
+import calendar
 import importlib
 import json
 import logging
+import re
 from datetime import datetime
 from enum import Enum
 
 import six
 from dateutil.parser import parse
+from dateutil.tz import tzoffset, tzutc
+
+from .profiler import profiled
+
+# the fixed ISO-8601 layout of API dates and timestamps, e.g. 2023-05-15T20:21:45Z
+_ISO_8601 = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?)?"
+    r"(Z|[+-]\d{2}:?\d{2})?$"
+)
+_UTC = tzutc()
+
+
+def _valid_fields(match):
+    """Whether the date and time of an _ISO_8601 match exist, without
+    building the datetime."""
+    year, month, day, hour, minute, second = (
+        int(field or 0) for field in match.groups()[:6]
+    )
+    return (
+        year >= 1
+        and 1 <= month <= 12
+        and 1 <= day <= calendar.monthrange(year, month)[1]
+        and hour < 24
+        and minute < 60
+        and second < 60
+    )
+
+
+def parse_timestamp(value):
+    """Parse a date or timestamp string returned by the API.
+
+    The ISO-8601 layout used by the API is parsed directly, other formats
+    fall back to dateutil's generic parser. Results compare equal to those
+    of `dateutil.parser.parse`, with UTC as `dateutil.tz.tzutc()`.
+    """
+    match = _ISO_8601.match(value)
+    if match is None:
+        return parse(value)
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    tzinfo = None
+    if offset == "Z":
+        tzinfo = _UTC
+    elif offset:
+        seconds = int(offset[1:3]) * 3600 + int(offset[-2:]) * 60
+        if offset[0] == "-":
+            seconds = -seconds
+        tzinfo = tzoffset(None, seconds) if seconds else _UTC
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour or 0),
+        int(minute or 0),
+        int(second or 0),
+        int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        tzinfo,
+    )
+
+
+def parse_epoch_millis(value):
+    """Convert a Unix epoch time in milliseconds (`numericDates`) to a UTC datetime."""
+    return datetime.fromtimestamp(value / 1000.0, tz=_UTC)
 
 
 class TypedList(MutableSequence):
@@ -61,6 +126,7 @@ class TypedList(MutableSequence):
     def insert(self, idx, value):
         self.__store.insert(idx, self.convert(value))
 
+    @profiled("typed_list")
     def convert(self, item):
         """Convert the input item to the desired object type."""
         try:
@@ -90,6 +156,7 @@ class TypedList(MutableSequence):
     def to_list(self):
         return self.__store
 
+    @profiled("typed_list")
     def load(self, value):
         if isinstance(value, list):
             self.purge()
@@ -245,29 +312,57 @@ class Boolean:
 
 
 class Timestamp:
+    """A datetime value, converted from its API representation when first read.
+
+    Most timestamps of a large payload (createdAt, modifiedAt, ...) are never
+    read, so API strings in the fixed ISO-8601 layout and epoch milliseconds
+    are kept as-is until the value is accessed, once their fields are checked.
+    Other strings are parsed immediately, so invalid values still fail on
+    assignment.
+    """
+
     def __init__(self, initial_value=None):
         self._value = None
+        self._raw = None
         if initial_value:
             self.value = initial_value
 
     @property
     def value(self):
+        if self._raw is not None:
+            raw = self._raw
+            if isinstance(raw, six.string_types):
+                self._value = parse_timestamp(raw)
+            else:
+                self._value = parse_epoch_millis(raw)
+            self._raw = None
         return self._value
 
     @value.setter
     def value(self, value):
+        self._raw = None
         if value is None:
             self._value = None
         elif isinstance(value, datetime):
             self._value = value
         elif isinstance(value, six.string_types):
-            value = parse(value)
-            self._value = value
+            self._value = None
+            match = _ISO_8601.match(value)
+            if match is not None and _valid_fields(match):
+                self._raw = value
+            else:
+                # fails here for impossible dates such as 2023-02-30
+                self._value = parse_timestamp(value)
+        elif isinstance(value, (six.integer_types, float)) and not isinstance(
+            value, bool
+        ):
+            self._value = None
+            self._raw = value
         else:
             raise ValueError(f"`{value}` invalid type for Timestamp value")
 
     def __str__(self):
-        return str(self._value)
+        return str(self.value)
 
 
 class EnumeratedValue:
@@ -17,17 +17,31 @@
 
 from __future__ import absolute_import
 
+import collections
 import functools
+import gzip
 import inspect
 import logging
 import re
 import warnings
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 
 import six
+from requests.packages.urllib3.util import make_headers
 
+from .profiler import profiled
 from .types import EnumeratedValue, TypedList
 
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
 _log = logging.getLogger(__name__)
 _primitive_types = (six.string_types, six.integer_types, float, bool)
 _list_types = (TypedList, list)
@@ -82,6 +96,7 @@ def get_child_properties(obj):
     return retval
 
 
+@profiled("serialize")
 def serialize(obj):
 
     retval = None
@@ -131,6 +146,7 @@ def serialize(obj):
     return retval
 
 
+@profiled("deserialize")
 def deserialize(obj, props):
     if isinstance(props, dict):
         for key, value in props.items():
@@ -169,6 +185,78 @@ def is_multipart(request):
     return False
 
 
+def supported_encodings():
+    """List the content codings this installation can compress and decode."""
+    encodings = ["gzip", "deflate"]
+    if brotli is not None:
+        encodings.append("br")
+    return encodings
+
+
+def default_accept_encoding():
+    """Accept-Encoding value covering every decoder urllib3 has available."""
+    return make_headers(accept_encoding=True)["accept-encoding"]
+
+
+def compress_body(body, encoding):
+    """Compress a request body with the given content coding.
+
+    Args:
+        body (bytes|str): Request body.
+        encoding (str): One of 'gzip', 'deflate' or 'br'.
+
+    Returns:
+        bytes
+    """
+    body = coerce_to_bytes(body)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "deflate":
+        return zlib.compress(body, 6)
+    if encoding == "br" and brotli is not None:
+        return brotli.compress(body, quality=5)
+    raise ValueError(f"Unsupported request compression '{encoding}'")
+
+
+def bounded_map(func, items, max_workers=8, window=None):
+    """Apply `func` to every item on a thread pool, yielding results in order.
+
+    Items are consumed lazily and at most `window` of them (twice
+    `max_workers` by default) are in flight or waiting to be yielded, so
+    memory stays flat however many items there are.
+    """
+    window = window or max_workers * 2
+    pending = collections.deque()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def split_ids(ids, max_length):
+    """Split ids into lists whose comma separated, URL encoded form is at
+    most `max_length` characters long."""
+    batch, length = [], 0
+    for item in ids:
+        # commas are encoded as %2C in query strings
+        size = len(str(item)) + (3 if batch else 0)
+        if batch and length + size > max_length:
+            yield batch
+            batch, length = [], 0
+            size = len(str(item))
+        batch.append(item)
+        length += size
+    if batch:
+        yield batch
+
+
 def deprecated(func):
     """This is a decorator which can be used to mark functions
     as deprecated. It will result in a warning being emitted
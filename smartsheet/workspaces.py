@@ -21,6 +21,8 @@ import logging
 import os.path
 
 from . import fresh_operation
+from .csvio import fix_column_types, iter_csv, table_rows
+from .models.error import Error
 from .models.folder import Folder
 
 
@@ -497,6 +499,54 @@ class Workspaces:
             primary_column_index,
         )
 
+    def import_csv_rows(
+        self,
+        workspace_id,
+        data,
+        sheet_name,
+        header=None,
+        primary_column_index=None,
+        column_types=None,
+        chunk_size=65536,
+    ):
+        """Imports a sheet from rows held in memory.
+
+        The rows are encoded as CSV while the request body is sent, so any
+        number of rows can be imported in one request with constant memory.
+        A streamed body cannot be sent twice, so the request is not retried.
+
+        Args:
+            workspace_id (int): Workspace ID
+            data: Iterable of row sequences, dict of column sequences by
+                title, or pandas DataFrame.
+            sheet_name (string): destination sheet name
+            header (list[str]): column names, taken from the keys of a dict
+                or the columns of a DataFrame by default, whose columns
+                it otherwise selects and orders by name
+            primary_column_index (int): index (0 based) of primary column
+            column_types (dict): column type names (or Column objects with
+                the type and its options) by column name, applied after the
+                import as all columns are imported as text/number
+            chunk_size (int): approximate size in bytes of the body chunks
+
+        Returns:
+            Result
+        """
+        header, rows = table_rows(data, header)
+        response = self._import_sheet(
+            workspace_id,
+            None,
+            "text/csv",
+            sheet_name,
+            None if header is None else 0,
+            primary_column_index,
+            data=iter_csv(rows, header, chunk_size),
+        )
+        if column_types and not isinstance(response, Error):
+            fix_column_types(self._base, response.result.id, column_types)
+
+        return response
+
     def _import_sheet(
         self,
         workspace_id,
@@ -505,6 +555,7 @@ class Workspaces:
         sheet_name,
         header_row_index,
         primary_column_index,
+        data=None,
     ):
         """Internal function used to import sheet"""
 
@@ -512,7 +563,7 @@ class Workspaces:
             head, tail = os.path.split(file)
             sheet_name = tail or os.path.basename(head)
 
-        _data = open(file, "rb").read()
+        _data = open(file, "rb").read() if data is None else data
         _op = fresh_operation("import_sheet_into_folder")
         _op["method"] = "POST"
         _op["path"] = "/workspaces/" + str(workspace_id) + "/sheets/import"
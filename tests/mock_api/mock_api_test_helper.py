@@ -1,4 +1,10 @@
+import json
 import os
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import smartsheet
 from smartsheet.exceptions import ApiError
 
@@ -28,3 +34,176 @@ class MockApiTestHelper(object):
 
     def is_test_scenario_error_code(self, error_code):
         return error_code == 9999
+
+
+class StubApiServer(object):
+    """Local HTTP server replaying canned responses, for transport tests.
+
+    `responses` is a list of (status, headers, payload) replayed in order, or
+    a function of (method, path) returning one, for concurrent requests.
+    """
+
+    def __init__(self, responses=None):
+        self.responses = responses if callable(responses) else list(responses or [])
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def _reply(self):
+                if self.headers.get('Transfer-Encoding') == 'chunked':
+                    body = self._read_chunked()
+                else:
+                    length = int(self.headers.get('Content-Length') or 0)
+                    body = self.rfile.read(length) if length else b''
+                server.requests.append((self.command, self.path, dict(self.headers), body))
+                if callable(server.responses):
+                    status, headers, payload = server.responses(self.command, self.path)
+                elif server.responses:
+                    status, headers, payload = server.responses.pop(0)
+                else:
+                    status, headers, payload = 200, {}, {'message': 'SUCCESS', 'resultCode': 0}
+                if not isinstance(payload, bytes):
+                    payload = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                headers = dict(headers)
+                headers.setdefault('Content-Type', 'application/json;charset=UTF-8')
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _read_chunked(self):
+                body = b''
+                while True:
+                    size = int(self.rfile.readline().split(b';')[0], 16)
+                    body += self.rfile.read(size)
+                    self.rfile.readline()
+                    if not size:
+                        return body
+
+            do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self._httpd.server_address[1])
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+class H2StubServer(object):
+    """Local plain-text HTTP/2 server (h2c, prior knowledge) answering every
+    request with `payload` after `delay` seconds, for multiplexing tests.
+
+    Records (connection number, method, path, headers) per request, the
+    number of connections opened and the most requests in flight at once.
+    """
+
+    def __init__(self, payload=None, delay=0.0):
+        self.payload = json.dumps(payload or {'message': 'SUCCESS', 'resultCode': 0}).encode('utf-8')
+        self.delay = delay
+        self.requests = []
+        self.connections = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self._closed = False
+        self._socket = socket.socket()
+        self._socket.bind(('127.0.0.1', 0))
+        self._socket.listen(16)
+        self._socket.settimeout(0.05)
+        self._thread = threading.Thread(target=self._accept, daemon=True)
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:{}'.format(self._socket.getsockname()[1])
+
+    def _accept(self):
+        while not self._closed:
+            try:
+                sock, _ = self._socket.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            with self._lock:
+                self.connections += 1
+                number = self.connections
+            threading.Thread(target=self._serve, args=(sock, number), daemon=True).start()
+
+    def _serve(self, sock, number):
+        import h2.config
+        import h2.connection
+        import h2.events
+
+        sock.settimeout(None)
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False, header_encoding='utf-8'))
+        write_lock = threading.Lock()
+        with write_lock:
+            conn.initiate_connection()
+            sock.sendall(conn.data_to_send())
+        streams = {}
+        while True:
+            try:
+                data = sock.recv(65535)
+            except OSError:
+                break
+            if not data:
+                break
+            with write_lock:
+                events = conn.receive_data(data)
+                sock.sendall(conn.data_to_send())
+            for event in events:
+                if isinstance(event, h2.events.RequestReceived):
+                    streams[event.stream_id] = dict(event.headers)
+                elif isinstance(event, h2.events.DataReceived):
+                    with write_lock:
+                        conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                        sock.sendall(conn.data_to_send())
+                elif isinstance(event, h2.events.StreamEnded):
+                    headers = streams.pop(event.stream_id)
+                    with self._lock:
+                        self.requests.append((number, headers[':method'], headers[':path'], headers))
+                    threading.Thread(target=self._respond, args=(sock, conn, write_lock, event.stream_id),
+                                     daemon=True).start()
+        sock.close()
+
+    def _respond(self, sock, conn, write_lock, stream_id):
+        with self._lock:
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self._in_flight -= 1
+        with write_lock:
+            conn.send_headers(stream_id, [(':status', '200'),
+                                          ('content-type', 'application/json;charset=UTF-8'),
+                                          ('content-length', str(len(self.payload)))])
+            conn.send_data(stream_id, self.payload, end_stream=True)
+            try:
+                sock.sendall(conn.data_to_send())
+            except OSError:
+                pass
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._closed = True
+        self._thread.join()
+        self._socket.close()
@@ -0,0 +1,67 @@
+# pylint: disable=C0103,W0232
+
+import io
+
+import smartsheet
+from smartsheet.crawler import IndexEntry
+
+from mock_api_test_helper import StubApiServer
+
+SHARES = {
+    '/sheets/1/shares': [
+        {'id': 'a', 'type': 'USER', 'userId': 100, 'email': 'Owner@example.com', 'accessLevel': 'OWNER',
+         'scope': 'ITEM'},
+        {'id': 'b', 'type': 'GROUP', 'groupId': 200, 'accessLevel': 'VIEWER', 'scope': 'WORKSPACE'},
+    ],
+    '/reports/2/shares': [
+        {'id': 'c', 'type': 'USER', 'userId': 101, 'email': 'editor@example.com', 'accessLevel': 'EDITOR',
+         'scope': 'ITEM'},
+    ],
+    '/workspaces/3/shares': [
+        {'id': 'b', 'type': 'GROUP', 'groupId': 200, 'accessLevel': 'VIEWER', 'scope': 'ITEM'},
+    ],
+}
+
+
+def shares(method, path):
+    path = path.split('?')[0]
+    if path not in SHARES:
+        return 403, {}, {'errorCode': 1004, 'message': 'Not authorized.', 'refId': 'e'}
+    return 200, {}, {'pageNumber': 1, 'totalPages': 1, 'totalCount': len(SHARES[path]), 'data': SHARES[path]}
+
+
+class TestMockAudit(object):
+    def test_audit_indexes_shares(self):
+        with StubApiServer(shares) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            objects = [('sheet', 1), ('report', 2), ('workspace', 3), ('sight', 4),
+                       IndexEntry(5, 'folder', 'skipped', 'skipped', None, None, 0)]
+            audit = smartsheet.SharingAudit(client, max_workers=3).run(objects)
+
+        assert len(server.requests) == 4
+        assert 'include=workspaceShares' in [r[1] for r in server.requests if r[1].startswith('/sheets')][0]
+        assert len(audit.records) == 4
+        assert [r.principal_id for r in audit.who_can('sheet', 1)] == [100, 200]
+        assert [r.principal_id for r in audit.who_can('sheet', 1, 'EDITOR')] == [100]
+        assert {(r.object_type, r.scope) for r in audit.what_can(200)} == {('sheet', 'WORKSPACE'),
+                                                                         ('workspace', 'ITEM')}
+        assert audit.what_can('owner@example.com')[0].access_level == 'OWNER'
+        assert [key for key, _ in audit.errors] == [('sight', 4)]
+
+        out = io.StringIO()
+        audit.to_csv(out)
+        assert out.getvalue().splitlines()[0] == 'object_type,object_id,principal_type,principal_id,email,access_level,scope'
+
+    def test_checkpoint_resumes(self, tmpdir):
+        checkpoint = str(tmpdir.join('audit.jsonl'))
+        with StubApiServer(shares) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            smartsheet.SharingAudit(client, checkpoint=checkpoint).run([('sheet', 1), ('sight', 4)])
+            resumed = smartsheet.SharingAudit(client, checkpoint=checkpoint)
+            resumed.run([('sheet', 1), ('sight', 4), ('report', 2)])
+
+        # the sheet is restored from the checkpoint, the failed sight retried
+        assert sorted(r[1].split('?')[0] for r in server.requests) == [
+            '/reports/2/shares', '/sheets/1/shares', '/sights/4/shares', '/sights/4/shares']
+        assert len(resumed.records) == 3
+        assert resumed.who_can('sheet', 1)[0].email == 'Owner@example.com'
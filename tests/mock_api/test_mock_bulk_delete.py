@@ -0,0 +1,35 @@
+# pylint: disable=C0103,W0232
+
+import smartsheet
+from six.moves.urllib.parse import parse_qs, urlparse
+from smartsheet.util import split_ids
+
+from mock_api_test_helper import StubApiServer
+
+
+def deletes(method, path):
+    ids = parse_qs(urlparse(path).query)['ids'][0].split(',')
+    if '13' in ids:
+        return 400, {}, {'errorCode': 1008, 'message': 'Unable to parse request.', 'refId': 'h'}
+    return 200, {}, {'message': 'SUCCESS', 'resultCode': 0, 'result': [int(row_id) for row_id in ids]}
+
+
+class TestMockBulkDelete(object):
+    def test_split_ids_by_length(self):
+        batches = list(split_ids([1, 22, 333, 4444, 5], 10))
+        # '1%2C22' is 6 characters, adding '%2C333' would make 12
+        assert batches == [[1, 22], [333, 4444], [5]]
+        assert list(split_ids([], 10)) == []
+
+    def test_batches_are_deleted_and_aggregated(self):
+        ids = list(range(1, 101))
+        with StubApiServer(deletes) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            result = client.Sheets.delete_rows_in_batches(1, ids, max_url_length=300, max_workers=3)
+
+        assert all(len(request[1]) <= 300 for request in server.requests)
+        assert all('ignoreRowsNotFound=True' in request[1] for request in server.requests)
+        assert result.batches == len(server.requests) > 1
+        failed = result.errors[0][0]
+        assert 13 in failed and len(result.errors) == 1
+        assert sorted(result.deleted_ids) == [row_id for row_id in ids if row_id not in failed]
@@ -0,0 +1,69 @@
+# pylint: disable=C0103,W0232
+
+import csv
+import io
+
+import pytest
+import smartsheet
+from smartsheet.exceptions import ApiError
+
+from mock_api_test_helper import StubApiServer
+
+
+def history(method, path):
+    parts = path.split('?')[0].split('/')
+    row_id, column_id = int(parts[4]), int(parts[6])
+    if row_id == 404:
+        return 404, {}, {'errorCode': 1006, 'message': 'Not Found', 'refId': 'g'}
+    entries = [
+        {'columnId': column_id, 'value': '{}-{}-{}'.format(row_id, column_id, version),
+         'modifiedAt': '2023-05-1{}T10:00:00Z'.format(version),
+         'modifiedBy': {'email': 'editor@example.com', 'name': 'Editor'}}
+        for version in range(row_id % 3)
+    ]
+    return 200, {}, {'pageNumber': 1, 'totalPages': 1, 'totalCount': len(entries), 'data': entries}
+
+
+class TestMockCellHistory(object):
+    def test_histories_are_columnar(self):
+        with StubApiServer(history) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            table = client.Cells.get_cell_histories(1, [1, 2, 3], [10, 11], max_workers=4)
+
+        assert len(server.requests) == 6
+        assert all('includeAll=True' in request[1] for request in server.requests)
+        # row 3 has no history, rows 1 and 2 have one and two entries per column
+        assert len(table) == 6
+        assert list(table.row_ids) == [1, 1, 2, 2, 2, 2]
+        assert list(table.column_ids) == [10, 11, 10, 10, 11, 11]
+        assert table.values[2:4] == ['2-10-0', '2-10-1']
+        assert table.modified_at[0].day == 10
+        assert set(table.modified_by) == {'editor@example.com'}
+        assert next(iter(table)).value == '1-10-0'
+
+    def test_stream_to_csv(self):
+        with StubApiServer(history) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            out = io.StringIO()
+            csv.writer(out).writerows(client.Cells.iter_cell_history(1, [2], [10]))
+
+        assert out.getvalue().splitlines()[0].startswith('2,10,2-10-0,2023-05-10')
+
+    def test_errors_raise(self):
+        with StubApiServer(history) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            with pytest.raises(ApiError):
+                list(client.Cells.iter_cell_history(1, [1, 404], [10]))
+
+    def test_errors_are_collected(self):
+        with StubApiServer(history) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            client.errors_as_exceptions()
+            table = client.Cells.get_cell_histories(1, [1, 404, 2], [10])
+            errors = []
+            entries = list(client.Cells.iter_cell_history(1, [404, 2], [10, 11], errors=errors))
+
+        assert list(table.row_ids) == [1, 2, 2]
+        assert [(cell, error.result.code) for cell, error in table.errors] == [((404, 10), 1006)]
+        assert len(entries) == 4
+        assert [cell for cell, _ in errors] == [(404, 10), (404, 11)]
@@ -0,0 +1,132 @@
+# pylint: disable=C0103,W0232
+
+import time
+
+import pytest
+
+import smartsheet
+from smartsheet.exceptions import CircuitOpenError
+from smartsheet.smartsheet import DefaultCalcBackoff
+
+from mock_api_test_helper import StubApiServer
+
+SHEET = (200, {}, {'id': 5, 'name': 'Plan'})
+SERVER_ERROR = (500, {}, {'errorCode': 4000, 'message': 'An unexpected error has occurred.', 'refId': 's'})
+UNEXPECTED = (500, {}, {'errorCode': 4004, 'message': 'An unexpected error has occurred.', 'refId': 'u'})
+GATEWAY_ERROR = (503, {'Content-Type': 'text/html'}, b'<html><body>Service Unavailable</body></html>')
+NOT_FOUND = (404, {}, {'errorCode': 1006, 'message': 'Not Found', 'refId': 'n'})
+
+
+def breaker():
+    return smartsheet.CircuitBreaker(failure_rate=0.5, window=4, min_calls=2, reset_timeout=0.3)
+
+
+class TestMockCircuitBreaker(object):
+    def test_opens_and_fails_fast(self):
+        circuit = breaker()
+        with StubApiServer([SERVER_ERROR, SERVER_ERROR, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, circuit_breaker=circuit)
+            client.Sheets.get_sheet(5)
+            client.Sheets.get_sheet(5)
+            assert circuit.state == circuit.OPEN
+            with pytest.raises(CircuitOpenError) as info:
+                client.Sheets.get_sheet(5)
+            assert 0 < info.value.retry_after <= 0.3
+            assert len(server.requests) == 2
+
+            time.sleep(0.3)
+            assert circuit.state == circuit.HALF_OPEN
+            assert client.Sheets.get_sheet(5).name == 'Plan'
+            assert circuit.state == circuit.CLOSED
+
+    def test_shared_between_clients(self):
+        circuit = breaker()
+        with StubApiServer([SERVER_ERROR, SERVER_ERROR]) as server:
+            clients = [smartsheet.Smartsheet(access_token='abc123', api_base=server.url, circuit_breaker=circuit)
+                       for _ in range(3)]
+            clients[0].Sheets.get_sheet(5)
+            clients[1].Sheets.get_sheet(5)
+            with pytest.raises(CircuitOpenError):
+                clients[2].Sheets.get_sheet(5)
+
+    def test_failed_probe_reopens(self):
+        circuit = breaker()
+        circuit.record_failure(circuit.allow())
+        circuit.record_failure(circuit.allow())
+        time.sleep(0.3)
+        probe = circuit.allow()
+        assert probe
+        # a single probe at a time
+        assert not circuit.allow()
+        circuit.record_failure(probe)
+        assert circuit.state == circuit.OPEN
+
+    def test_only_probes_close_the_breaker(self):
+        circuit = breaker()
+        slow = circuit.allow()
+        circuit.record_failure(circuit.allow())
+        circuit.record_failure(circuit.allow())
+        time.sleep(0.3)
+        probe = circuit.allow()
+        # an attempt admitted before the breaker opened finishes late
+        circuit.record_success(slow)
+        assert circuit.state == circuit.HALF_OPEN
+        circuit.record_success(probe)
+        assert circuit.state == circuit.CLOSED
+
+    def test_released_probe_frees_its_slot(self):
+        circuit = breaker()
+        circuit.record_failure(circuit.allow())
+        circuit.record_failure(circuit.allow())
+        time.sleep(0.3)
+        circuit.release(circuit.allow())
+        assert circuit.allow()
+
+    def test_probe_slot_released_on_unexpected_exception(self, monkeypatch):
+        circuit = breaker()
+        circuit.record_failure(circuit.allow())
+        circuit.record_failure(circuit.allow())
+        time.sleep(0.3)
+        with StubApiServer([SHEET, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, circuit_breaker=circuit)
+
+            def broken(*args):
+                raise KeyError('broken')
+
+            monkeypatch.setattr(client, '_log_request', broken)
+            with pytest.raises(KeyError):
+                client.Sheets.get_sheet(5)
+            monkeypatch.undo()
+            assert client.Sheets.get_sheet(5).name == 'Plan'
+        assert circuit.state == circuit.CLOSED
+
+    def test_unparsed_server_errors_count(self):
+        circuit = breaker()
+        with StubApiServer([GATEWAY_ERROR] * 5) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, circuit_breaker=circuit)
+            for _ in range(2):
+                with pytest.raises(ValueError):
+                    client.Sheets.get_sheet(5)
+            assert circuit.state == circuit.OPEN
+            with pytest.raises(CircuitOpenError):
+                client.Sheets.get_sheet(5)
+        assert len(server.requests) == 2
+
+    def test_client_errors_do_not_count(self):
+        circuit = breaker()
+        with StubApiServer([NOT_FOUND] * 4) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, circuit_breaker=circuit)
+            for _ in range(4):
+                client.Sheets.get_sheet(5)
+        assert circuit.state == circuit.CLOSED
+
+    def test_open_breaker_stops_retries(self):
+        circuit = smartsheet.CircuitBreaker(min_calls=1, reset_timeout=30)
+        backoff = DefaultCalcBackoff(5, policies={4004: smartsheet.RetryPolicy(0.01, 0.01, True)})
+        with StubApiServer([UNEXPECTED, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, max_retry_time=backoff,
+                                           circuit_breaker=circuit)
+            result = client.Sheets.get_sheet(5)
+
+        assert result.result.code == 4004
+        assert len(server.requests) == 1
@@ -0,0 +1,82 @@
+# pylint: disable=C0103,W0232
+
+import math
+
+import pytest
+from smartsheet.models import Report, Sheet
+
+SHEET = Sheet({
+    'id': 1,
+    'columns': [
+        {'id': 10, 'title': 'Name', 'type': 'TEXT_NUMBER', 'primary': True},
+        {'id': 11, 'title': 'Amount', 'type': 'TEXT_NUMBER'},
+        {'id': 12, 'title': 'Done', 'type': 'CHECKBOX'},
+        {'id': 13, 'title': 'Due', 'type': 'DATE'},
+        {'id': 14, 'title': 'Updated', 'type': 'DATETIME'},
+    ],
+    'rows': [
+        {'id': 100, 'cells': [
+            {'columnId': 10, 'value': 'first'},
+            {'columnId': 11, 'value': 2.5},
+            {'columnId': 12, 'value': True},
+            {'columnId': 13, 'value': '1970-01-11'},
+            {'columnId': 14, 'value': '1970-01-01T00:00:01Z'},
+        ]},
+        # sparse row, cells out of column order
+        {'id': 101, 'cells': [
+            {'columnId': 13, 'value': '1970-01-02'},
+            {'columnId': 11},
+        ]},
+        {'id': 102, 'cells': [
+            {'columnId': 10, 'value': 'third'},
+            {'columnId': 11, 'value': 4},
+            {'columnId': 12, 'value': False},
+        ]},
+    ]
+})
+
+
+class TestMockColumnar(object):
+    def test_default_dtypes(self):
+        amounts = SHEET.column_values(11)
+        assert amounts.dtype == 'float64'
+        assert list(amounts) == [2.5, None, 4.0]
+        assert math.isnan(amounts.values[1])
+        assert list(amounts.row_ids) == [100, 101, 102]
+
+        assert SHEET.column_values(10).dtype == 'object'
+        assert list(SHEET.column_values(10)) == ['first', None, 'third']
+        assert list(SHEET.column_values(12)) == [1, None, 0]
+        assert list(SHEET.column_values(13)) == [10, 1, None]
+        assert list(SHEET.column_values(14)) == [1000, None, None]
+
+    def test_explicit_dtype(self):
+        amounts = SHEET.column_values(11, dtype='int64')
+        assert list(amounts) == [2, None, 4]
+        names = SHEET.column_values(10, dtype='float64')
+        assert list(names.mask) == [1, 1, 1]
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            SHEET.column_values(99)
+        with pytest.raises(ValueError):
+            SHEET.column_values(11, dtype='complex')
+
+    def test_numpy(self):
+        numpy = pytest.importorskip('numpy')
+        due = SHEET.column_values(13, as_numpy=True)
+        assert due.values.dtype == numpy.dtype('datetime64[D]')
+        assert str(due.values[0]) == '1970-01-11'
+        assert due.mask.tolist() == [False, False, True]
+        done = SHEET.column_values(12, as_numpy=True)
+        assert done.values[~done.mask].tolist() == [True, False]
+
+    def test_report_virtual_columns(self):
+        report = Report({
+            'columns': [{'virtualId': 7, 'title': 'Amount', 'type': 'TEXT_NUMBER'}],
+            'rows': [
+                {'id': 1, 'sheetId': 5, 'cells': [{'virtualColumnId': 7, 'columnId': 70, 'value': 1}]},
+                {'id': 2, 'sheetId': 6, 'cells': [{'virtualColumnId': 7, 'columnId': 80, 'value': 2}]},
+            ]
+        })
+        assert list(report.column_values(7)) == [1.0, 2.0]
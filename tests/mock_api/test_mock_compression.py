@@ -0,0 +1,63 @@
+# pylint: disable=C0103,W0232
+
+import gzip
+import json
+import zlib
+
+import pytest
+import smartsheet
+from smartsheet.models import Row
+
+from mock_api_test_helper import StubApiServer
+
+
+def rows(count):
+    return [Row({'toBottom': True, 'cells': [{'columnId': 1, 'value': 'value ' + str(n)}]})
+            for n in range(count)]
+
+
+class TestMockCompression(object):
+    def test_large_body_is_compressed(self):
+        with StubApiServer() as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           request_compression='gzip', compression_threshold=1024)
+            response = client.Sheets.add_rows(1, rows(100))
+
+        assert response.message == 'SUCCESS'
+        _, _, headers, body = server.requests[0]
+        assert headers['Content-Encoding'] == 'gzip'
+        assert len(json.loads(gzip.decompress(body))) == 100
+
+    def test_small_body_is_not_compressed(self):
+        with StubApiServer() as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           request_compression='deflate', compression_threshold=1024)
+            client.Sheets.add_rows(1, rows(1))
+
+        _, _, headers, body = server.requests[0]
+        assert 'Content-Encoding' not in headers
+        assert len(json.loads(body)) == 1
+
+    def test_deflate(self):
+        with StubApiServer() as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           request_compression='deflate', compression_threshold=0)
+            client.Sheets.add_rows(1, rows(10))
+
+        _, _, headers, body = server.requests[0]
+        assert headers['Content-Encoding'] == 'deflate'
+        assert len(json.loads(zlib.decompress(body))) == 10
+
+    def test_unsupported_compression(self):
+        with pytest.raises(ValueError):
+            smartsheet.Smartsheet(access_token='abc123', request_compression='lzma')
+
+    def test_accept_encoding_and_decompression(self):
+        payload = gzip.compress(json.dumps({'id': 1, 'name': 'compressed'}).encode('utf-8'))
+        with StubApiServer([(200, {'Content-Encoding': 'gzip'}, payload)]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           accept_encoding='gzip')
+            sheet = client.Sheets.get_sheet(1)
+
+        assert sheet.name == 'compressed'
+        assert server.requests[0][2]['Accept-Encoding'] == 'gzip'
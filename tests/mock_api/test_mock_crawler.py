@@ -0,0 +1,72 @@
+# pylint: disable=C0103,W0232
+
+import pytest
+import smartsheet
+from smartsheet.exceptions import ApiError
+
+from mock_api_test_helper import StubApiServer
+
+NOT_FOUND = (404, {}, {'errorCode': 1006, 'message': 'Not Found', 'refId': 'd'})
+
+CONTAINERS = {
+    '/2.0/home': {
+        'sheets': [{'id': 1, 'name': 'Root sheet'}],
+        'folders': [{'id': 10, 'name': 'Home folder'}],
+        'workspaces': [{'id': 20, 'name': 'Team'}],
+    },
+    '/2.0/folders/10': {'id': 10, 'name': 'Home folder', 'reports': [{'id': 2, 'name': 'Report'}]},
+    '/2.0/workspaces/20': {
+        'id': 20,
+        'name': 'Team',
+        'folders': [{'id': 30, 'name': 'Projects'}, {'id': 31, 'name': 'Gone'}],
+        'sights': [{'id': 3, 'name': 'Dashboard'}],
+    },
+    '/2.0/folders/30': {
+        'id': 30,
+        'name': 'Projects',
+        'folders': [{'id': 40, 'name': 'Archive'}],
+        # the same sheet listed twice is indexed once
+        'sheets': [{'id': 4, 'name': 'Plan'}, {'id': 4, 'name': 'Plan'}],
+    },
+    '/2.0/folders/40': {'id': 40, 'name': 'Archive', 'sheets': [{'id': 5, 'name': 'Old plan'}]},
+}
+
+
+def containers(method, path):
+    path = path.split('?')[0]
+    if path in CONTAINERS:
+        return 200, {}, CONTAINERS[path]
+    return NOT_FOUND
+
+
+class TestMockCrawler(object):
+    def test_crawl_builds_flat_index(self):
+        with StubApiServer(containers) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url + '/2.0')
+            crawler = client.Home.crawl(max_workers=4)
+            index = {(entry.type, entry.id): entry for entry in crawler}
+
+        assert len(index) == 10
+        plan = index[('sheet', 4)]
+        assert plan.path == 'Team/Projects/Plan'
+        assert (plan.parent_id, plan.parent_type, plan.depth) == (30, 'folder', 2)
+        assert index[('sheet', 5)].path == 'Team/Projects/Archive/Old plan'
+        assert index[('sheet', 1)].parent_id is None
+        assert [entry.id for entry, _ in crawler.errors] == [31]
+
+    def test_depth_limit_and_types(self):
+        with StubApiServer(containers) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url + '/2.0')
+            entries = list(client.Home.crawl(max_depth=1, types=['sheet', 'folder']))
+
+        assert sorted((entry.type, entry.id) for entry in entries) == [
+            ('folder', 10), ('folder', 30), ('folder', 31), ('sheet', 1)]
+        assert not any('/40' in request[1] for request in server.requests)
+
+    def test_home_failure_raises(self):
+        with StubApiServer([NOT_FOUND]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            with pytest.raises(ApiError):
+                list(client.Home.crawl())
+        with pytest.raises(ValueError):
+            client.Home.crawl(types=['spreadsheet'])
@@ -0,0 +1,75 @@
+# pylint: disable=C0103,W0232
+
+import json
+from datetime import date
+
+import pytest
+import smartsheet
+from smartsheet.csvio import iter_csv, table_rows
+
+from mock_api_test_helper import StubApiServer
+
+IMPORTED = (200, {}, {'message': 'SUCCESS', 'resultCode': 0, 'result': {'id': 7, 'name': 'imported'}})
+COLUMNS = (200, {}, {'pageNumber': 1, 'totalPages': 1, 'data': [
+    {'id': 1, 'title': 'Name', 'type': 'TEXT_NUMBER', 'primary': True},
+    {'id': 2, 'title': 'Due', 'type': 'TEXT_NUMBER'},
+    {'id': 3, 'title': 'Done', 'type': 'CHECKBOX'},
+]})
+UPDATED = (200, {}, {'message': 'SUCCESS', 'resultCode': 0, 'result': {'id': 2, 'title': 'Due', 'type': 'DATE'}})
+RATE_LIMITED = (429, {'Retry-After': '0'}, {'errorCode': 4003, 'message': 'Rate limit exceeded.', 'refId': 'j'})
+
+
+class TestMockCsvImport(object):
+    def test_iter_csv_chunks(self):
+        rows = ((idx, 'row, {}'.format(idx), None) for idx in range(1000))
+        chunks = list(iter_csv(rows, ['id', 'name', 'empty'], chunk_size=1024))
+        assert len(chunks) > 5
+        assert all(len(chunk) < 1100 for chunk in chunks)
+        lines = b''.join(chunks).decode('utf-8').splitlines()
+        assert lines[:2] == ['id,name,empty', '0,"row, 0",']
+        assert len(lines) == 1001
+
+    def test_table_rows(self):
+        header, rows = table_rows({'a': [1, 2], 'b': ['x', 'y']})
+        assert header == ['a', 'b']
+        assert list(rows) == [(1, 'x'), (2, 'y')]
+        header, rows = table_rows({'a': [1, 2], 'b': ['x', 'y']}, header=['b', 'a'])
+        assert list(rows) == [('x', 1), ('y', 2)]
+        with pytest.raises(ValueError):
+            table_rows({'a': [1, 2]}, header=['a', 'c'])
+        header, rows = table_rows([(1, 2)])
+        assert header is None
+
+    def test_table_rows_dataframe_header(self):
+        pandas = pytest.importorskip('pandas')
+        frame = pandas.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+        header, rows = table_rows(frame, header=['b', 'a'])
+        assert list(rows) == [('x', 1), ('y', 2)]
+
+    def test_import_streams_rows_and_fixes_types(self):
+        rows = ((idx, date(2023, 1, 1 + idx % 28), idx % 2 == 0) for idx in range(5000))
+        with StubApiServer([IMPORTED, COLUMNS, UPDATED]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            result = client.Folders.import_csv_rows(
+                5, rows, 'imported', header=['Name', 'Due', 'Done'], primary_column_index=0,
+                column_types={'Due': 'DATE', 'Done': 'CHECKBOX'}, chunk_size=4096)
+
+        assert result.result.id == 7
+        method, path, headers, body = server.requests[0]
+        assert path.startswith('/folders/5/sheets/import?')
+        assert 'headerRowIndex=0' in path and 'sheetName=imported' in path
+        assert headers['Transfer-Encoding'] == 'chunked'
+        lines = body.decode('utf-8').splitlines()
+        assert lines[:2] == ['Name,Due,Done', '0,2023-01-01,True']
+        assert len(lines) == 5001
+        # only the column whose type differs is updated
+        assert [(request[0], request[1]) for request in server.requests[2:]] == [('PUT', '/sheets/7/columns/2')]
+        assert json.loads(server.requests[2][3]) == {'type': 'DATE'}
+
+    def test_streamed_import_is_not_retried(self):
+        with StubApiServer([RATE_LIMITED, IMPORTED]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            result = client.Sheets.import_csv_rows([(1, 2)], 'imported', header=['a', 'b'])
+
+        assert isinstance(result, smartsheet.models.Error)
+        assert len(server.requests) == 1
@@ -0,0 +1,76 @@
+# pylint: disable=C0103,W0232
+
+import time
+
+import smartsheet
+from smartsheet.directory import Directory
+
+from mock_api_test_helper import StubApiServer
+
+
+def index(items, page, page_size):
+    start = (page - 1) * page_size
+    return {'pageNumber': page, 'pageSize': page_size, 'totalCount': len(items),
+            'totalPages': -(-len(items) // page_size), 'data': items[start:start + page_size]}
+
+
+USERS = [{'id': idx, 'email': 'user{}@example.com'.format(idx)} for idx in range(1, 6)]
+GROUPS = [{'id': 50, 'name': 'Engineering'}, {'id': 51, 'name': 'Sales'}]
+MEMBERS = {50: [1, 2], 51: [2, 3]}
+
+
+def directory(method, path):
+    path, _, query = path.partition('?')
+    params = dict(param.split('=') for param in query.split('&') if param)
+    page, page_size = int(params.get('page', 1)), int(params.get('pageSize', 100))
+    if path == '/users':
+        return 200, {}, index(USERS, page, page_size)
+    if path == '/groups':
+        return 200, {}, index(GROUPS, page, page_size)
+    if path.startswith('/groups/'):
+        group_id = int(path.split('/')[2])
+        group = dict(next(group for group in GROUPS if group['id'] == group_id))
+        group['members'] = [{'id': user_id, 'email': 'user{}@example.com'.format(user_id)}
+                            for user_id in MEMBERS[group_id]]
+        return 200, {}, group
+    if path == '/users/1/alternateemails':
+        return 200, {}, index([{'id': 9, 'email': 'First.Alias@example.com', 'confirmed': True}], 1, 100)
+    if path.endswith('/alternateemails'):
+        return 200, {}, index([], 1, 100)
+    if path == '/contacts':
+        return 200, {}, index([{'id': 'c1', 'email': 'partner@example.org', 'name': 'Partner'}], page, page_size)
+    return 404, {}, {'errorCode': 1006, 'message': 'Not Found', 'refId': 'f'}
+
+
+class TestMockDirectory(object):
+    def test_lookups_after_warm_up(self):
+        with StubApiServer(directory) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            client.directory = Directory(client, page_size=2, contacts=True)
+            client.directory.warm_up()
+            calls = len(server.requests)
+
+            assert client.directory.user(3).email == 'user3@example.com'
+            assert client.directory.user_id('USER4@example.com') == 4
+            assert client.directory.user_id('first.alias@example.com') == 1
+            assert client.directory.group('engineering').id == 50
+            assert client.directory.members(51) == frozenset([2, 3])
+            assert client.directory.groups_of('user2@example.com') == frozenset([50, 51])
+            assert client.directory.contact('partner@example.org').name == 'Partner'
+            assert client.directory.user('nobody@example.com') is None
+            assert len(server.requests) == calls
+
+        # users and groups pages, groups, alternate emails and contacts
+        assert calls == 3 + 1 + 2 + 5 + 1
+
+    def test_reload_after_ttl(self):
+        with StubApiServer(directory) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            client.directory = Directory(client, ttl=0.2, alternate_emails=False)
+            assert client.directory.user(1) is not None
+            calls = len(server.requests)
+            assert client.directory.user(2) is not None
+            assert len(server.requests) == calls
+            time.sleep(0.3)
+            assert client.directory.user(2) is not None
+            assert len(server.requests) == 2 * calls
@@ -0,0 +1,88 @@
+# pylint: disable=C0103,W0232
+
+import gzip
+import io
+
+import pytest
+
+import smartsheet
+from smartsheet.columnar import csv_columns
+from smartsheet.csvio import iter_csv_rows
+
+from mock_api_test_helper import StubApiServer
+
+CSV = (
+    '﻿Name,Count,Due,Note\n'
+    'a,1,2023-01-02,"two\nlines"\n'
+    'b,,2023-01-03,x\n'
+    'c,"1,234",soon,\n'
+).encode('utf-8')
+CSV_EXPORT = (200, {'Content-Type': 'text/csv', 'Content-Disposition': 'attachment; filename="Plan.csv";'}, CSV)
+EXCEL_EXPORT = (200, {'Content-Type': 'application/vnd.ms-excel',
+                      'Content-Disposition': 'attachment; filename="Plan.xls";'}, b'\xd0\xcf\x11\xe0' * 5000)
+
+
+class TestMockExportStream(object):
+    def test_csv_rows_across_chunks(self):
+        # split inside a multi-byte character and inside a quoted newline
+        data = 'h\n"é\nx",y\n'.encode('utf-8')
+        chunks = [data[idx:idx + 1] for idx in range(len(data))]
+        assert list(iter_csv_rows(chunks)) == [['h'], ['é\nx', 'y']]
+
+    def test_stream_sheet_rows(self):
+        with StubApiServer([CSV_EXPORT]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            export = client.Sheets.stream_sheet_as_csv(5)
+            assert export.filename == 'Plan.csv'
+            assert export.download_directory is None
+            rows = list(export.iter_rows())
+
+        method, path, headers, _ = server.requests[0]
+        assert (method, path, headers['Accept']) == ('GET', '/sheets/5', 'text/csv')
+        assert rows == [
+            ['Name', 'Count', 'Due', 'Note'],
+            ['a', '1', '2023-01-02', 'two\nlines'],
+            ['b', '', '2023-01-03', 'x'],
+            ['c', '1,234', 'soon', ''],
+        ]
+
+    def test_stream_report_columns(self):
+        with StubApiServer([CSV_EXPORT]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            columns = client.Reports.stream_report_as_csv(9).columns({'Count': 'int64', 'Due': 'date'})
+
+        assert server.requests[0][1] == '/reports/9'
+        assert list(columns) == ['Name', 'Count', 'Due', 'Note']
+        assert list(columns['Name']) == ['a', 'b', 'c']
+        assert columns['Count'].values.typecode == 'q'
+        assert list(columns['Count']) == [1, None, 1234]
+        # values that cannot be parsed are masked
+        assert list(columns['Due'].mask) == [0, 0, 1]
+        assert list(columns['Note']) == ['two\nlines', 'x', None]
+        assert columns['Note'].row_ids is None
+
+    def test_csv_columns_checks_dtypes(self):
+        with pytest.raises(ValueError):
+            csv_columns([['Name']], {'Name': 'text'})
+        with pytest.raises(ValueError):
+            csv_columns([['Name']], {'Missing': 'int64'})
+
+    def test_stream_excel_to_sink(self):
+        sink = io.BytesIO()
+        with StubApiServer([EXCEL_EXPORT]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            export = client.Sheets.stream_sheet_as_excel(5)
+            with gzip.GzipFile(fileobj=sink, mode='wb') as compressed:
+                written = export.save_to(compressed, chunksize=1024)
+
+        assert written == 20000
+        assert gzip.decompress(sink.getvalue()) == EXCEL_EXPORT[2]
+        assert server.requests[0][2]['Accept'] == 'application/vnd.ms-excel'
+
+    def test_saved_export_is_streamed(self, tmpdir):
+        with StubApiServer([CSV_EXPORT]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            export = client.Sheets.get_sheet_as_csv(5, str(tmpdir))
+
+        assert tmpdir.join('Plan.csv').read_binary() == CSV
+        assert export.request_response.raw.closed
@@ -0,0 +1,107 @@
+# pylint: disable=C0103,W0232
+
+import itertools
+import threading
+import time
+
+import requests
+import smartsheet
+from smartsheet.hedging import LatencyHistory
+
+from mock_api_test_helper import StubApiServer
+
+SHEET = (200, {}, {'id': 5, 'name': 'Plan'})
+
+
+def slow_once(warm_up, seconds):
+    """Answer at once, except for the request after `warm_up` ones."""
+    counter = itertools.count()
+
+    def respond(method, path):
+        if next(counter) == warm_up:
+            time.sleep(seconds)
+        return SHEET
+    return respond
+
+
+class Hedges(smartsheet.AbstractMetricsHook):
+    def __init__(self):
+        self.hedges = []
+
+    def on_request_end(self, metrics):
+        self.hedges.append(metrics.hedges)
+
+
+class TestMockHedging(object):
+    def test_slow_request_is_hedged(self):
+        policy = smartsheet.HedgingPolicy(percentile=0.9, min_delay=0.05, min_samples=5)
+        hook = Hedges()
+        with StubApiServer(slow_once(5, 1.0)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, hedging=policy)
+            client.add_metrics_hook(hook)
+            for _ in range(5):
+                client.Sheets.get_sheet(5)
+            start = time.time()
+            sheet = client.Sheets.get_sheet(5)
+            elapsed = time.time() - start
+
+        assert sheet.name == 'Plan'
+        assert elapsed < 0.8
+        assert len(server.requests) == 7
+        assert hook.hedges == [0, 0, 0, 0, 0, 1]
+        assert all(request[2]['Authorization'] == 'Bearer abc123' for request in server.requests)
+        assert policy.budget.tokens < 10
+
+    def test_hedge_copies_request_before_it_is_redacted(self):
+        policy = smartsheet.HedgingPolicy(min_delay=0.05, min_samples=1)
+        policy.history.record('get_sheet', 0.01)
+        sent = []
+
+        def send(request):
+            sent.append((threading.current_thread().name, request.headers['Authorization']))
+            if len(sent) == 1:
+                # the response hook redacts the original request
+                request.headers['Authorization'] = '[redacted]'
+                time.sleep(0.3)
+            return request
+
+        prepped = requests.Request('GET', 'https://example.com/sheets/5',
+                                   headers={'Authorization': 'Bearer abc123'}).prepare()
+        response, hedged = policy.send(send, prepped, {'id': 'get_sheet'})
+
+        assert hedged and response.headers['Authorization'] == 'Bearer abc123'
+        assert [header for _, header in sent] == ['Bearer abc123', 'Bearer abc123']
+        # a late original never touches the caller's request
+        time.sleep(0.3)
+        assert prepped.headers['Authorization'] == 'Bearer abc123'
+        assert sent[0][0].startswith('smartsheet-request')
+        assert sent[1][0].startswith('smartsheet-hedge')
+
+    def test_budget_limits_hedges(self):
+        policy = smartsheet.HedgingPolicy(min_delay=0.05, min_samples=2, budget_ratio=0, max_budget=0)
+        with StubApiServer(slow_once(2, 0.3)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, hedging=policy)
+            for _ in range(3):
+                client.Sheets.get_sheet(5)
+
+        assert len(server.requests) == 3
+
+    def test_only_selected_operations(self):
+        policy = smartsheet.HedgingPolicy(operations=['get_row'])
+        client = smartsheet.Smartsheet(access_token='abc123', hedging=policy)
+        op = smartsheet.fresh_operation('get_sheet')
+        op['method'] = 'GET'
+        op['path'] = '/sheets/5'
+        assert not policy.applies(client.prepare_request(op), op, False)
+        op['id'] = 'get_row'
+        assert policy.applies(client.prepare_request(op), op, False)
+        assert not policy.applies(client.prepare_request(op), op, True)
+
+    def test_latency_percentile(self):
+        history = LatencyHistory(size=10)
+        for value in range(20):
+            history.record('get_sheet', value)
+        assert history.count('get_sheet') == 10
+        assert history.percentile('get_sheet', 0.5) == 15
+        assert history.percentile('get_sheet', 1.0) == 19
+        assert history.percentile('get_row', 0.5) is None
@@ -0,0 +1,85 @@
+# pylint: disable=C0103,W0232
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import smartsheet
+from smartsheet.session import _HTTP2Adapter
+
+from mock_api_test_helper import H2StubServer, StubApiServer
+
+pytest.importorskip('httpx')
+pytest.importorskip('h2')
+
+
+class TestMockHttp2(object):
+    def client_for(self, server):
+        client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, http2=True)
+        # the stub server speaks plain http, route it through the HTTP/2 adapter anyway
+        client._session.mount('http://', client._session.get_adapter('https://'))
+        return client
+
+    def test_get_sheet(self):
+        sheet = {'id': 1, 'name': 'http2 sheet', 'rows': [{'id': 2, 'rowNumber': 1}]}
+        with StubApiServer([(200, {}, sheet)]) as server:
+            client = self.client_for(server)
+            response = client.Sheets.get_sheet(1)
+
+        assert response.name == 'http2 sheet'
+        assert response.rows[0].id == 2
+        method, path, headers, _ = server.requests[0]
+        assert (method, path) == ('GET', '/sheets/1')
+        assert headers['Authorization'] == 'Bearer abc123'
+        assert response.request_response.request.headers['Authorization'] == '[redacted]'
+
+    def test_post_body(self):
+        with StubApiServer() as server:
+            client = self.client_for(server)
+            response = client.Sheets.add_rows(1, [smartsheet.models.Row({'toTop': True})])
+
+        assert response.message == 'SUCCESS'
+        assert server.requests[0][3] == b'[{"toTop": true}]'
+
+    def test_error_result(self):
+        error = {'errorCode': 1006, 'message': 'Not Found', 'refId': 'abc'}
+        with StubApiServer([(404, {}, error)]) as server:
+            client = self.client_for(server)
+            response = client.Sheets.get_sheet(1)
+
+        assert isinstance(response, smartsheet.models.Error)
+        assert response.result.code == 1006
+
+
+class TestMockHttp2Multiplexing(object):
+    def client_for(self, server, max_connections=8):
+        client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, http2=True,
+                                       max_connections=max_connections)
+        # the stub server speaks h2c, HTTP/2 without TLS negotiation
+        client._session.mount('http://', _HTTP2Adapter(pool_maxsize=max_connections, http1=False))
+        return client
+
+    def test_requests_use_http2(self):
+        with H2StubServer({'id': 1, 'name': 'http2 sheet'}) as server:
+            client = self.client_for(server)
+            response = client.Sheets.get_sheet(1)
+
+        assert response.name == 'http2 sheet'
+        assert response.request_response.raw.http_version == 'HTTP/2'
+        _, method, path, headers = server.requests[0]
+        assert (method, path) == ('GET', '/sheets/1')
+        assert headers['authorization'] == 'Bearer abc123'
+
+    def test_max_connections_bounds_connections(self):
+        with H2StubServer({'id': 1, 'name': 'http2 sheet'}, delay=0.3) as server:
+            client = self.client_for(server, max_connections=2)
+            start = time.time()
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                responses = list(executor.map(lambda _: client.Sheets.get_sheet(1), range(8)))
+            elapsed = time.time() - start
+
+        assert all(response.name == 'http2 sheet' for response in responses)
+        assert server.connections <= 2
+        # requests share the connections instead of queuing for them
+        assert server.max_in_flight > 2
+        assert elapsed < 0.3 * 8 / 2
@@ -0,0 +1,102 @@
+# pylint: disable=C0103,W0232
+
+import socket
+
+import pytest
+import smartsheet
+from smartsheet.exceptions import UnexpectedRequestError
+from smartsheet.metrics import AbstractMetricsHook
+from smartsheet.retry import RetryPolicy
+from smartsheet.smartsheet import DefaultCalcBackoff
+
+from mock_api_test_helper import StubApiServer
+
+RATE_LIMITED = (429, {'Retry-After': '0'}, {'errorCode': 4003, 'message': 'Rate limit exceeded.', 'refId': 'a'})
+SHEET = (200, {}, {'id': 1, 'name': 'measured sheet', 'rows': [{'id': n} for n in range(10)]})
+
+
+class RecordingHook(AbstractMetricsHook):
+    def __init__(self):
+        self.started = []
+        self.ended = []
+
+    def on_request_start(self, metrics):
+        self.started.append(metrics)
+
+    def on_request_end(self, metrics):
+        self.ended.append(metrics)
+
+
+class FailingHook(AbstractMetricsHook):
+    def on_request_end(self, metrics):
+        raise RuntimeError('broken hook')
+
+
+def client_for(server):
+    backoff = DefaultCalcBackoff(5, policies={4003: RetryPolicy(0.01, 0.02)})
+    return smartsheet.Smartsheet(access_token='abc123', api_base=server.url, max_retry_time=backoff)
+
+
+class TestMockMetrics(object):
+    def test_operation_metrics(self):
+        hook = RecordingHook()
+        with StubApiServer([RATE_LIMITED, SHEET]) as server:
+            client = client_for(server)
+            client.add_metrics_hook(hook)
+            client.add_metrics_hook(FailingHook())
+            sheet = client.Sheets.get_sheet(1)
+
+        assert sheet.name == 'measured sheet'
+        assert len(hook.started) == 1 and hook.ended == hook.started
+        metrics = hook.ended[0]
+        assert metrics.operation_id == 'get_sheet'
+        assert metrics.method == 'GET'
+        assert metrics.path == '/sheets/1'
+        assert metrics.status_code == 200
+        assert metrics.attempts == 2 and metrics.retries == 1
+        assert metrics.rate_limit_wait > 0
+        assert metrics.response_bytes > 0
+        assert metrics.timings['total'] >= metrics.timings['ttfb'] > 0
+        assert metrics.timings['hydration'] > 0
+
+    def test_error_code_and_removal(self):
+        hook = RecordingHook()
+        error = (404, {}, {'errorCode': 1006, 'message': 'Not Found', 'refId': 'c'})
+        with StubApiServer([error, SHEET]) as server:
+            client = client_for(server)
+            client.add_metrics_hook(hook)
+            client.Sheets.get_sheet(1)
+            client.remove_metrics_hook(hook)
+            client.Sheets.get_sheet(1)
+
+        assert len(hook.ended) == 1
+        assert hook.ended[0].error_code == 1006
+
+    def test_transport_error(self):
+        hook = RecordingHook()
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        client = smartsheet.Smartsheet(access_token='abc123', api_base='http://127.0.0.1:{}'.format(port))
+        client.add_metrics_hook(hook)
+        with pytest.raises(UnexpectedRequestError):
+            client.Sheets.get_sheet(1)
+
+        assert len(hook.started) == 1 and hook.ended == hook.started
+        metrics = hook.ended[0]
+        assert metrics.exception == 'UnexpectedRequestError'
+        assert metrics.status_code is None
+        assert metrics.end_time is not None
+
+    def test_prometheus_hook(self):
+        prometheus_client = pytest.importorskip('prometheus_client')
+        from smartsheet.metrics import PrometheusMetricsHook
+
+        registry = prometheus_client.CollectorRegistry()
+        with StubApiServer([SHEET]) as server:
+            client = client_for(server)
+            client.add_metrics_hook(PrometheusMetricsHook(registry=registry))
+            client.Sheets.get_sheet(1)
+
+        assert registry.get_sample_value(
+            'smartsheet_requests_total', {'operation': 'get_sheet', 'status_code': '200'}) == 1
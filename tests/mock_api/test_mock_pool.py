@@ -0,0 +1,83 @@
+# pylint: disable=C0103,W0232
+
+import collections
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import smartsheet
+from smartsheet.exceptions import ApiError
+
+from mock_api_test_helper import StubApiServer
+
+SHEET = (200, {}, {'id': 5, 'name': 'Plan'})
+RATE_LIMITED = (429, {'Retry-After': '0'}, {'errorCode': 4003, 'message': 'Rate limit exceeded.', 'refId': 'j'})
+
+
+def slow(method, path):
+    time.sleep(0.2)
+    return SHEET
+
+
+def tokens(server):
+    return collections.Counter(headers['Authorization'] for _, _, headers, _ in server.requests)
+
+
+def make_pool(server, count=2, **kwargs):
+    clients = [smartsheet.Smartsheet(access_token='token{}'.format(idx), api_base=server.url, max_retry_time=0)
+               for idx in range(count)]
+    return smartsheet.SmartsheetPool(clients, **kwargs)
+
+
+class TestMockPool(object):
+    def test_requests_are_spread(self):
+        with StubApiServer([SHEET] * 10) as server:
+            pool = make_pool(server, rate=100)
+            sheets = [pool.Sheets.get_sheet(5) for _ in range(10)]
+
+        assert all(sheet.name == 'Plan' for sheet in sheets)
+        assert tokens(server) == {'Bearer token0': 5, 'Bearer token1': 5}
+        assert [stats['requests'] for stats in pool.stats()] == [5, 5]
+
+    def test_least_loaded_client(self):
+        with StubApiServer(slow) as server:
+            pool = make_pool(server, count=4, rate=100)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(lambda _: pool.Sheets.get_sheet(5), range(8)))
+
+        assert set(tokens(server).values()) == {2}
+        assert all(stats['in_flight'] == 0 for stats in pool.stats())
+
+    def test_spent_budgets_wait(self):
+        with StubApiServer([SHEET] * 4) as server:
+            pool = make_pool(server, rate=5, capacity=1)
+            start = time.time()
+            for _ in range(4):
+                pool.Sheets.get_sheet(5)
+            elapsed = time.time() - start
+
+        # two requests from the bursts, then one token per client every 0.2s
+        assert 0.15 < elapsed < 0.6
+        assert tokens(server) == {'Bearer token0': 2, 'Bearer token1': 2}
+
+    def test_eligible_clients(self):
+        with StubApiServer([SHEET] * 3) as server:
+            pool = make_pool(server, rate=100,
+                             eligible=lambda client, op: op['id'] != 'get_sheet' or client._access_token == 'token1')
+            for _ in range(3):
+                pool.Sheets.get_sheet(5)
+
+        assert tokens(server) == {'Bearer token1': 3}
+
+    def test_rate_limited_client_is_skipped(self):
+        with StubApiServer([RATE_LIMITED, SHEET, SHEET]) as server:
+            pool = make_pool(server, rate=0.1, capacity=2)
+            pool.errors_as_exceptions()
+            with pytest.raises(ApiError):
+                pool.Sheets.get_sheet(5)
+            pool.Sheets.get_sheet(5)
+            pool.Sheets.get_sheet(5)
+
+        assert [stats['rate_limited'] for stats in pool.stats()] == [1, 0]
+        assert tokens(server) == {'Bearer token0': 1, 'Bearer token1': 2}
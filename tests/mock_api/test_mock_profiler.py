@@ -0,0 +1,44 @@
+# pylint: disable=C0103,W0232
+
+import io
+
+import smartsheet
+from smartsheet.models import Row
+
+from mock_api_test_helper import StubApiServer
+
+SHEET = {
+    'id': 1,
+    'name': 'profiled sheet',
+    'columns': [{'id': 10, 'title': 'Primary', 'type': 'TEXT_NUMBER'}],
+    'rows': [{'id': n, 'cells': [{'columnId': 10, 'value': n}]} for n in range(200)]
+}
+
+
+class TestMockProfiler(object):
+    def test_profile_operations(self):
+        with StubApiServer([(200, {}, SHEET), (200, {}, SHEET)]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            with client.profile() as profiler:
+                client.Sheets.get_sheet(1)
+                client.Sheets.get_sheet(1)
+                client.Sheets.add_rows(1, [Row({'toTop': True})])
+            # requests made outside the block are not profiled
+            client.Sheets.get_sheet(1)
+
+        stats = profiler.stats()
+        assert stats['get_sheet']['calls'] == 2
+        assert stats['add_rows']['calls'] == 1
+        assert stats['get_sheet']['deserialize'] > stats['get_sheet']['typed_list'] > 0
+        assert stats['add_rows']['serialize'] > 0
+        assert stats['get_sheet']['total'] >= stats['get_sheet']['network']
+
+        table = io.StringIO()
+        profiler.report(table)
+        lines = table.getvalue().splitlines()
+        assert lines[0].split()[:3] == ['operation', 'calls', 'prepare']
+        assert len(lines) == 3
+
+        exported = io.StringIO()
+        profiler.to_csv(exported)
+        assert exported.getvalue().startswith('operation,calls,prepare')
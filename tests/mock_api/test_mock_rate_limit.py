@@ -0,0 +1,71 @@
+# pylint: disable=C0103,W0232
+
+import multiprocessing
+import threading
+import time
+
+import smartsheet
+from smartsheet.ratelimit import MemoryRateLimitStore, token_key
+
+from mock_api_test_helper import StubApiServer
+
+SHEET = (200, {}, {'id': 5, 'name': 'Plan'})
+RATE_LIMITED = (429, {'Retry-After': '1'}, {'errorCode': 4003, 'message': 'Rate limit exceeded.', 'refId': 'j'})
+
+
+def take_tokens(path, count):
+    limiter = smartsheet.RateLimiter(rate=10, capacity=1, store=smartsheet.SqliteRateLimitStore(path))
+    for _ in range(count):
+        limiter.acquire('token')
+
+
+class TestMockRateLimit(object):
+    def test_bucket_paces_requests(self):
+        limiter = smartsheet.RateLimiter(rate=20, capacity=2)
+        start = time.time()
+        waits = [limiter.acquire('token') for _ in range(6)]
+        assert waits[:2] == [0, 0]
+        assert 0.15 < time.time() - start < 0.5
+        # other tokens have their own bucket
+        assert limiter.acquire('other') == 0
+
+    def test_max_wait(self):
+        limiter = smartsheet.RateLimiter(rate=1, capacity=1)
+        assert limiter.acquire('token') == 0
+        assert limiter.acquire('token', max_wait=0.1) is None
+        assert 0.5 < limiter.acquire('token', max_wait=2) <= 1
+
+    def test_sqlite_store_is_shared_between_processes(self, tmpdir):
+        path = str(tmpdir.join('limits.db'))
+        context = multiprocessing.get_context('spawn')
+        processes = [context.Process(target=take_tokens, args=(path, 5)) for _ in range(2)]
+        start = time.time()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        assert all(process.exitcode == 0 for process in processes)
+        # 10 tokens at 10 per second, only the first from the burst
+        assert time.time() - start >= 0.9
+
+    def test_rate_limit_response_holds_other_clients(self):
+        times = []
+        responses = [RATE_LIMITED, SHEET, SHEET]
+
+        def respond(method, path):
+            times.append(time.time())
+            return responses.pop(0)
+
+        limiter = smartsheet.RateLimiter(rate=100, store=MemoryRateLimitStore())
+        with StubApiServer(respond) as server:
+            clients = [smartsheet.Smartsheet(access_token='abc123', api_base=server.url, rate_limiter=limiter)
+                       for _ in range(2)]
+            first = threading.Thread(target=clients[0].Sheets.get_sheet, args=(5,))
+            first.start()
+            time.sleep(0.2)
+            assert clients[1].Sheets.get_sheet(5).name == 'Plan'
+            first.join()
+
+        assert len(times) == 3
+        assert times[1] - times[0] >= 0.95
+        assert token_key('abc123') != 'abc123'
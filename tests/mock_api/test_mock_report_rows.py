@@ -0,0 +1,66 @@
+# pylint: disable=C0103,W0232
+
+import pytest
+import smartsheet
+from smartsheet.exceptions import ApiError
+from smartsheet.models import ReportRow
+from six.moves.urllib.parse import parse_qs, urlparse
+
+from mock_api_test_helper import StubApiServer
+
+TOTAL_ROWS = 25
+
+
+def report_pages(method, path):
+    query = parse_qs(urlparse(path).query)
+    page, page_size = int(query['page'][0]), int(query['pageSize'][0])
+    first = (page - 1) * page_size
+    report = {
+        'id': 7,
+        'name': 'paged report',
+        'totalRowCount': TOTAL_ROWS,
+        'columns': [{'virtualId': 1, 'title': 'Name', 'type': 'TEXT_NUMBER'}],
+        'rows': [
+            {'id': idx, 'sheetId': 3, 'cells': [{'virtualColumnId': 1, 'value': idx}]}
+            for idx in range(first, min(first + page_size, TOTAL_ROWS))
+        ],
+    }
+    if 'sourceSheets' in query.get('include', [''])[0]:
+        report['sourceSheets'] = [{'id': 3, 'name': 'source'}]
+    return 200, {}, report
+
+
+class TestMockReportRows(object):
+    def test_iterates_every_page_in_order(self):
+        with StubApiServer(report_pages) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            rows = client.Reports.iter_report_rows(
+                7, page_size=10, include=['sourceSheets'], prefetch=3)
+            ids = [row.id for row in rows]
+
+        assert ids == list(range(TOTAL_ROWS))
+        assert len(rows) == TOTAL_ROWS
+        assert rows.report.name == 'paged report'
+        assert rows.report.source_sheets[0].name == 'source'
+        assert len(rows.report.rows) == 0
+        paths = sorted(request[1] for request in server.requests)
+        assert len(paths) == 3
+        # source sheets are only requested with the first page
+        assert sum('sourceSheets' in path for path in paths) == 1
+
+    def test_rows_are_hydrated_or_raw(self):
+        with StubApiServer(report_pages) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            row = next(iter(client.Reports.iter_report_rows(7, page_size=10)))
+            raw = next(iter(client.Reports.iter_report_rows(7, page_size=10, raw=True)))
+
+        assert isinstance(row, ReportRow)
+        assert row.cells[0].value == 0
+        assert raw['cells'][0]['value'] == 0
+
+    def test_errors_raise(self):
+        error = (404, {}, {'errorCode': 1006, 'message': 'Not Found', 'refId': 'c'})
+        with StubApiServer([error]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            with pytest.raises(ApiError):
+                client.Reports.iter_report_rows(7)
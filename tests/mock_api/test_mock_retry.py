@@ -0,0 +1,94 @@
+# pylint: disable=C0103,W0232
+
+import pytest
+import smartsheet
+from smartsheet.exceptions import RateLimitExceededError
+from smartsheet.retry import RetryBudget, RetryPolicy, parse_retry_after
+from smartsheet.smartsheet import DefaultCalcBackoff
+
+from mock_api_test_helper import StubApiServer
+
+RATE_LIMITED = (429, {'Retry-After': '0'}, {'errorCode': 4003, 'message': 'Rate limit exceeded.', 'refId': 'a'})
+UNEXPECTED = (500, {}, {'errorCode': 4004, 'message': 'Unexpected error.', 'refId': 'b'})
+SHEET = (200, {}, {'id': 1, 'name': 'retried sheet'})
+
+
+def fast_backoff(idempotent_only=True):
+    return DefaultCalcBackoff(5, policies={
+        4003: RetryPolicy(base_delay=0.01, max_delay=0.02),
+        4004: RetryPolicy(base_delay=0.01, max_delay=0.02, idempotent_only=idempotent_only)})
+
+
+class TestMockRetry(object):
+    def test_retry_after_is_honored(self):
+        with StubApiServer([RATE_LIMITED, RATE_LIMITED, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           max_retry_time=fast_backoff())
+            sheet = client.Sheets.get_sheet(1)
+
+        assert sheet.name == 'retried sheet'
+        assert len(server.requests) == 3
+        # the access token is restored after being redacted for logging
+        assert all(request[2]['Authorization'] == 'Bearer abc123' for request in server.requests)
+
+    def test_post_not_retried_on_ambiguous_error(self):
+        with StubApiServer([UNEXPECTED, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           max_retry_time=fast_backoff())
+            response = client.Sheets.add_rows(1, [smartsheet.models.Row({'toTop': True})])
+
+        assert isinstance(response, smartsheet.models.Error)
+        assert len(server.requests) == 1
+
+    def test_get_retried_on_ambiguous_error(self):
+        with StubApiServer([UNEXPECTED, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           max_retry_time=fast_backoff())
+            sheet = client.Sheets.get_sheet(1)
+
+        assert sheet.name == 'retried sheet'
+        assert len(server.requests) == 2
+
+    def test_policy_allows_post_retry(self):
+        with StubApiServer([UNEXPECTED, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           max_retry_time=fast_backoff(idempotent_only=False))
+            client.Sheets.add_rows(1, [smartsheet.models.Row({'toTop': True})])
+
+        assert len(server.requests) == 2
+
+    def test_read_only_post_retried_on_ambiguous_error(self):
+        urls = (200, {}, {'imageUrls': [{'imageId': 'abc', 'url': 'https://example.com/abc'}]})
+        with StubApiServer([UNEXPECTED, urls]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           max_retry_time=fast_backoff())
+            response = client.Images.get_image_urls([smartsheet.models.ImageUrl({'imageId': 'abc'})])
+
+        assert response.image_urls[0].url == 'https://example.com/abc'
+        assert [request[0] for request in server.requests] == ['POST', 'POST']
+
+    def test_retry_budget(self):
+        budget = RetryBudget(ratio=0.5, max_tokens=1)
+        with StubApiServer([RATE_LIMITED, RATE_LIMITED, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url,
+                                           max_retry_time=fast_backoff(), retry_budget=budget)
+            client.errors_as_exceptions()
+            with pytest.raises(RateLimitExceededError):
+                client.Sheets.get_sheet(1)
+
+        assert len(server.requests) == 2
+        assert budget.tokens == 0
+
+    def test_decorrelated_jitter_bounds(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0)
+        previous = policy.base_delay
+        for _ in range(50):
+            backoff = policy.next_backoff(previous)
+            assert 1.0 <= backoff <= min(10.0, previous * 3)
+            previous = backoff
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after('12') == 12.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('soon') is None
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
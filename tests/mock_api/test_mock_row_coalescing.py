@@ -0,0 +1,95 @@
+# pylint: disable=C0103,W0232
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import smartsheet
+from smartsheet.exceptions import DeadlineExceededError
+from six.moves.urllib.parse import parse_qs, urlparse
+
+from mock_api_test_helper import StubApiServer
+
+COLUMNS = [{'id': 1, 'title': 'Name', 'type': 'TEXT_NUMBER', 'primary': True}]
+NOT_FOUND = (404, {}, {'errorCode': 1006, 'message': 'Not Found', 'refId': 'n'})
+
+
+def sheet_rows(method, path):
+    url = urlparse(path)
+    if '/rows/' in url.path:
+        return NOT_FOUND
+    row_ids = [int(row_id) for row_id in parse_qs(url.query)['rowIds'][0].split(',')]
+    rows = [{'id': row_id, 'cells': [{'columnId': 1, 'value': 'row {}'.format(row_id)}]}
+            for row_id in row_ids if row_id < 100]
+    return 200, {}, {'id': 5, 'name': 'Sheet', 'columns': COLUMNS, 'rows': rows}
+
+
+def get_rows(client, row_ids, **kwargs):
+    with ThreadPoolExecutor(max_workers=len(row_ids)) as executor:
+        return list(executor.map(lambda row_id: client.Sheets.get_row(5, row_id, **kwargs), row_ids))
+
+
+class TestMockRowCoalescing(object):
+    def test_concurrent_get_rows_share_one_request(self):
+        with StubApiServer(sheet_rows) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, row_coalescing_window=0.5)
+            rows = get_rows(client, list(range(1, 21)), include=['columns', 'format'])
+
+        assert len(server.requests) == 1
+        query = parse_qs(urlparse(server.requests[0][1]).query)
+        assert sorted(int(row_id) for row_id in query['rowIds'][0].split(',')) == list(range(1, 21))
+        assert query['include'] == ['format']
+        assert [row.id for row in rows] == list(range(1, 21))
+        assert rows[3].cells[0].value == 'row 4'
+        assert rows[3].sheet_id == 5
+        assert rows[3].columns[0].title == 'Name'
+
+    def test_batches_are_capped(self):
+        with StubApiServer(sheet_rows) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, row_coalescing_window=0.5)
+            client.row_coalescer._max_rows = 4
+            rows = get_rows(client, list(range(1, 11)))
+
+        assert [row.id for row in rows] == list(range(1, 11))
+        assert all(len(parse_qs(urlparse(request[1]).query)['rowIds'][0].split(',')) <= 4
+                   for request in server.requests)
+        assert len(server.requests) >= 3
+
+    def test_missing_row_gets_get_row_error(self):
+        with StubApiServer(sheet_rows) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, row_coalescing_window=0.5)
+            rows = get_rows(client, [1, 100])
+
+        assert rows[0].id == 1
+        assert isinstance(rows[1], smartsheet.models.Error)
+        assert rows[1].result.code == 1006
+        assert [urlparse(request[1]).path for request in server.requests] == ['/sheets/5', '/sheets/5/rows/100']
+
+    def test_other_includes_are_not_coalesced(self):
+        with StubApiServer([(200, {}, {'id': 7})]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, row_coalescing_window=0.5)
+            row = client.Sheets.get_row(5, 7, include='rowWriterInfo')
+
+        assert row.id == 7
+        assert urlparse(server.requests[0][1]).path == '/sheets/5/rows/7'
+
+    def test_follower_keeps_its_deadline(self):
+        def slow_rows(method, path):
+            time.sleep(0.5)
+            return sheet_rows(method, path)
+
+        with StubApiServer(slow_rows) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, row_coalescing_window=0.05)
+            leader = threading.Thread(target=client.Sheets.get_row, args=(5, 1))
+            leader.start()
+            time.sleep(0.01)
+            start = time.time()
+            with pytest.raises(DeadlineExceededError):
+                with client.time_limit(0.2):
+                    client.Sheets.get_row(5, 2)
+            waited = time.time() - start
+            leader.join()
+
+        assert waited < 0.4
+        assert len(server.requests) == 1
@@ -0,0 +1,105 @@
+# pylint: disable=C0103,W0232
+
+import threading
+import time
+
+import pytest
+
+import smartsheet
+
+from mock_api_test_helper import StubApiServer
+
+
+def slow(method, path):
+    time.sleep(0.2)
+    if method == 'POST':
+        return 200, {}, {'message': 'SUCCESS', 'resultCode': 0, 'result': [{'id': 1}]}
+    return 200, {}, {'id': 7}
+
+
+def start(target, *args):
+    thread = threading.Thread(target=target, args=args)
+    thread.start()
+    return thread
+
+
+class TestMockScheduler(object):
+    def test_interactive_requests_jump_the_queue(self):
+        scheduler = smartsheet.RequestScheduler(max_concurrency=1)
+        assert scheduler.acquire('interactive')
+        order = []
+
+        def run(name):
+            scheduler.acquire(name)
+            order.append(name)
+            scheduler.release(name)
+
+        threads = []
+        for name in ['batch'] * 4 + ['interactive'] * 2:
+            threads.append(start(run, name))
+            time.sleep(0.02)
+        scheduler.release('interactive')
+        for thread in threads:
+            thread.join()
+        assert order == ['interactive', 'interactive', 'batch', 'batch', 'batch', 'batch']
+
+    def test_weighted_share(self):
+        scheduler = smartsheet.RequestScheduler(max_concurrency=1, classes={
+            'a': smartsheet.PriorityClass(weight=2), 'b': smartsheet.PriorityClass(weight=1)}, default_class='a')
+        assert scheduler.acquire('a')
+        order = []
+
+        def run(name):
+            scheduler.acquire(name)
+            order.append(name)
+            scheduler.release(name)
+
+        threads = []
+        for name in ['b'] * 3 + ['a'] * 6:
+            threads.append(start(run, name))
+            time.sleep(0.02)
+        scheduler.release('a')
+        for thread in threads:
+            thread.join()
+        # two 'a' requests for every 'b' one
+        assert order[:6].count('a') == 4
+
+    def test_class_cap_and_deadline(self):
+        scheduler = smartsheet.RequestScheduler(max_concurrency=4, classes={
+            'interactive': smartsheet.PriorityClass(weight=8),
+            'batch': smartsheet.PriorityClass(weight=1, max_concurrency=1)})
+        assert scheduler.acquire('batch')
+        assert not scheduler.acquire('batch', deadline=time.time() + 0.1)
+        assert scheduler.acquire('interactive', deadline=time.time() + 0.1)
+        assert scheduler.in_flight('batch') == 1
+        scheduler.release('batch')
+        assert scheduler.acquire('batch', deadline=time.time() + 0.1)
+
+    def test_client_requests_are_scheduled(self):
+        scheduler = smartsheet.RequestScheduler(max_concurrency=1)
+        row = smartsheet.models.Row({'toBottom': True})
+        with StubApiServer(slow) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, scheduler=scheduler)
+            threads = []
+            for _ in range(3):
+                threads.append(start(client.Sheets.add_rows, 5, [row]))
+                time.sleep(0.05)
+            threads.append(start(client.Sheets.get_row, 5, 7))
+            for thread in threads:
+                thread.join()
+
+        assert [method for method, _, _, _ in server.requests] == ['POST', 'GET', 'POST', 'POST']
+
+    def test_priority_block(self):
+        scheduler = smartsheet.RequestScheduler()
+        client = smartsheet.Smartsheet(access_token='abc123', scheduler=scheduler)
+        with pytest.raises(ValueError):
+            with client.priority('urgent'):
+                pass
+        with client.priority('batch'):
+            op = smartsheet.fresh_operation('get_row')
+            assert client._acquire_slot(op, None) == 'batch'
+            client._release_slot('batch')
+        with pytest.raises(ValueError):
+            with smartsheet.Smartsheet(access_token='abc123').priority('batch'):
+                pass
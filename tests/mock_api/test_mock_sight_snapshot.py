@@ -0,0 +1,89 @@
+# pylint: disable=C0103,W0232
+
+import pytest
+import smartsheet
+from six.moves.urllib.parse import parse_qs, urlparse
+from smartsheet.exceptions import ApiError
+
+from mock_api_test_helper import StubApiServer
+
+SIGHT = {
+    'id': 1,
+    'name': 'Dashboard',
+    'widgets': [
+        {'id': 1, 'type': 'METRIC', 'contents': {'type': 'METRIC', 'sheetId': 10, 'cellData': [
+            {'columnId': 100, 'rowId': 1000}, {'columnId': 101, 'rowId': 1001}]}},
+        {'id': 2, 'type': 'METRIC', 'contents': {'type': 'METRIC', 'sheetId': 10, 'cellData': [
+            {'columnId': 100, 'rowId': 1002}]}},
+        {'id': 3, 'type': 'GRIDGANTT', 'contents': {'type': 'GRIDGANTT', 'reportId': 20}},
+        {'id': 4, 'type': 'CHART', 'contents': {'type': 'CHART', 'reportId': 20}},
+        {'id': 5, 'type': 'CHART', 'contents': {'type': 'CHART', 'sheetId': 11, 'includedColumnIds': [110]}},
+        {'id': 6, 'type': 'GRIDGANTT', 'contents': {'type': 'GRIDGANTT', 'reportId': 21}},
+        {'id': 7, 'type': 'RICHTEXT', 'contents': {'type': 'RICHTEXT', 'htmlContent': '<p>hi</p>'}},
+    ],
+}
+
+
+SUMMARY_SIGHT = {
+    'id': 2,
+    'name': 'Summary dashboard',
+    'widgets': [
+        {'id': 1, 'type': 'METRIC', 'contents': {'type': 'METRIC', 'sheetId': 12, 'cellData': [
+            {'columnId': 120}, {'columnId': 121}]}},
+    ],
+}
+
+
+def sources(method, path):
+    path = urlparse(path).path
+    if path == '/sights/1':
+        return 200, {}, SIGHT
+    if path == '/sights/3':
+        return 200, {}, SUMMARY_SIGHT
+    if path == '/sheets/12/summary/fields':
+        fields = [{'id': 120, 'title': 'Budget', 'objectValue': 5}, {'id': 121, 'title': 'Owner'}]
+        return 200, {}, {'pageNumber': 1, 'totalPages': 1, 'totalCount': 2, 'data': fields}
+    if path in ('/sheets/10', '/sheets/11'):
+        return 200, {}, {'id': int(path.split('/')[2]), 'name': path}
+    if path == '/reports/20':
+        return 200, {}, {'id': 20, 'name': 'report'}
+    return 404, {}, {'errorCode': 1006, 'message': 'Not Found', 'refId': 'i'}
+
+
+class TestMockSightSnapshot(object):
+    def test_sources_are_fetched_once_with_filters(self):
+        with StubApiServer(sources) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            snapshot = client.Sights.get_sight_snapshot(1, max_workers=4)
+
+        requests = {urlparse(request[1]).path: parse_qs(urlparse(request[1]).query)
+                    for request in server.requests}
+        assert len(server.requests) == 5
+        assert requests['/sheets/10'] == {'columnIds': ['100,101'], 'rowIds': ['1000,1001,1002']}
+        assert requests['/sheets/11'] == {'columnIds': ['110']}
+        assert set(snapshot.sheets) == {10, 11}
+        assert snapshot.reports[20].name == 'report'
+        assert [source for source, _ in snapshot.errors] == [('report', 21)]
+
+        widgets = snapshot.sight.widgets
+        assert snapshot.source(widgets[0]).id == 10
+        assert snapshot.source(widgets[3]).id == 20
+        assert snapshot.source(widgets[6]) is None
+
+    def test_missing_sight_raises(self):
+        with StubApiServer(sources) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            with pytest.raises(ApiError):
+                client.Sights.get_sight_snapshot(2)
+
+    def test_summary_only_sheet(self):
+        with StubApiServer(sources) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            snapshot = client.Sights.get_sight_snapshot(3)
+
+        assert [urlparse(request[1]).path for request in server.requests] == [
+            '/sights/3', '/sheets/12/summary/fields']
+        sheet = snapshot.source(snapshot.sight.widgets[0])
+        assert sheet.id == 12
+        assert [field.title for field in sheet.summary.fields] == ['Budget', 'Owner']
+        assert not snapshot.errors
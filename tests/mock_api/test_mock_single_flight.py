@@ -0,0 +1,119 @@
+# pylint: disable=C0103,W0232
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import smartsheet
+from smartsheet.exceptions import DeadlineExceededError
+from smartsheet.singleflight import SingleFlight
+
+from mock_api_test_helper import StubApiServer
+
+SHEET = {'id': 5, 'name': 'Plan', 'columns': [{'id': 1, 'title': 'Name', 'type': 'TEXT_NUMBER'}],
+         'rows': [{'id': 10, 'cells': [{'columnId': 1, 'value': 'a'}]}]}
+
+
+def slow(payload, status=200):
+    def respond(method, path):
+        time.sleep(0.3)
+        return status, {}, payload
+    return respond
+
+
+def concurrently(func, count=8):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(lambda _: func(), range(count)))
+
+
+class TestMockSingleFlight(object):
+    def test_concurrent_gets_share_one_request(self):
+        with StubApiServer(slow(SHEET)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, single_flight=True)
+            sheets = concurrently(lambda: client.Sheets.get_sheet(5))
+
+        assert len(server.requests) == 1
+        assert all(sheet.rows[0].cells[0].value == 'a' for sheet in sheets)
+        # every caller owns its models
+        sheets[0].rows[0].cells[0].value = 'changed'
+        sheets[0].name = 'changed'
+        assert sheets[1].rows[0].cells[0].value == 'a'
+        assert len({id(sheet) for sheet in sheets}) == 8
+
+    def test_identities_are_not_shared(self):
+        with StubApiServer(slow(SHEET)) as server:
+            clients = [smartsheet.Smartsheet(access_token='abc123', api_base=server.url, single_flight=True)
+                       for _ in range(2)]
+            clients[1].assume_user('someone@example.com')
+            done = []
+            threads = [threading.Thread(target=lambda c=c: done.append(c.Sheets.get_sheet(5))) for c in clients]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(server.requests) == 2
+        assert len(done) == 2
+
+    def test_errors_are_shared(self):
+        error = {'errorCode': 1006, 'message': 'Not Found', 'refId': 'n'}
+        with StubApiServer(slow(error, 404)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, single_flight=True)
+            results = concurrently(lambda: client.Sheets.get_sheet(5), 4)
+
+        assert len(server.requests) == 1
+        assert all(result.result.code == 1006 for result in results)
+
+    def test_off_by_default(self):
+        with StubApiServer(slow(SHEET)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            concurrently(lambda: client.Sheets.get_sheet(5), 3)
+
+        assert len(server.requests) == 3
+
+    def test_exception_reaches_every_caller(self):
+        flight = SingleFlight()
+        started = threading.Event()
+
+        def fail():
+            started.set()
+            time.sleep(0.2)
+            raise ValueError('boom')
+
+        errors = []
+
+        def call():
+            try:
+                flight.do('key', fail)
+            except ValueError as ex:
+                errors.append(ex)
+
+        leader = threading.Thread(target=call)
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=call)
+        follower.start()
+        leader.join()
+        follower.join()
+        assert len(errors) == 2
+        with pytest.raises(ValueError):
+            flight.do('key', fail)
+
+    def test_follower_keeps_its_deadline(self):
+        with StubApiServer(slow(SHEET)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, single_flight=True)
+            leader = threading.Thread(target=client.Sheets.get_sheet, args=(5,))
+            leader.start()
+            time.sleep(0.05)
+            start = time.time()
+            with pytest.raises(DeadlineExceededError) as info:
+                with client.time_limit(0.1):
+                    client.Sheets.get_sheet(5)
+            waited = time.time() - start
+            leader.join()
+
+        assert waited < 0.25
+        assert info.value.operation_id == 'get_sheet'
+        assert len(server.requests) == 1
@@ -0,0 +1,101 @@
+# pylint: disable=C0103,W0232
+
+import json
+
+import pytest
+import smartsheet
+from smartsheet.models import Sheet
+from smartsheet.sync import diff_sheet
+
+from mock_api_test_helper import StubApiServer
+
+
+def make_sheet(rows):
+    return Sheet({
+        'id': 1,
+        'columns': [{'id': 10, 'title': 'Key', 'primary': True}, {'id': 11, 'title': 'Amount'}],
+        'rows': [
+            {'id': row_id, 'cells': [{'columnId': 10, 'value': key}, {'columnId': 11, 'value': amount}]}
+            for row_id, key, amount in rows
+        ],
+    })
+
+
+SHEET = make_sheet([(100, 'a', 1), (101, 'b', 2), (102, 'c', 3), (103, 'd', 4), (104, 'b', 9)])
+
+
+class TestMockSync(object):
+    def test_only_changed_cells_are_sent(self):
+        patch = diff_sheet(SHEET, [
+            {'Key': 'a', 'Amount': 1},
+            {'Key': 'b', 'Amount': '5'},
+            {'Key': 'c', 11: '3'},
+            {'Key': 'e', 'Amount': 7},
+        ], 'Key')
+
+        assert [(row.id, [(cell.column_id, cell.value) for cell in row.cells]) for row in patch.updates] == [
+            (101, [(11, '5')])]
+        assert sorted(patch.deletes) == [103, 104]
+        assert patch.moves == []
+        location, rows = patch.inserts[0]
+        assert location == {'toBottom': True}
+        assert [cell.value for cell in rows[0].cells] == ['e', 7]
+        assert patch.changed_cells == 3
+
+    def test_order_moves_fewest_rows(self):
+        sheet = make_sheet([(100, 'a', 1), (101, 'b', 2), (102, 'c', 3), (103, 'd', 4)])
+        patch = diff_sheet(sheet, [
+            {'Key': 'n'}, {'Key': 'a'}, {'Key': 'c'}, {'Key': 'd'}, {'Key': 'b'}, {'Key': 'x'}, {'Key': 'y'},
+        ], 10, order=True)
+
+        assert not patch.updates and not patch.deletes
+        assert [(location, [row.id for row in rows]) for location, rows in patch.moves] == [
+            ({'siblingId': 103}, [101])]
+        assert [(location, [row.cells[0].value for row in rows]) for location, rows in patch.inserts] == [
+            ({'toTop': True}, ['n']), ({'siblingId': 101}, ['x', 'y'])]
+
+    def test_apply_groups_moves_by_location(self):
+        sheet = make_sheet([(100, 'a', 1), (101, 'b', 2), (102, 'c', 3), (103, 'd', 4), (104, 'e', 5)])
+        patch = diff_sheet(sheet, [
+            {'Key': 'e'}, {'Key': 'd'}, {'Key': 'a'}, {'Key': 'c'}, {'Key': 'b'},
+        ], 10, order=True)
+
+        assert [(location, [row.id for row in rows]) for location, rows in patch.moves] == [
+            ({'toTop': True}, [104, 103]), ({'siblingId': 100}, [102])]
+        with StubApiServer() as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            patch.apply(client, 1)
+
+        bodies = [json.loads(request[3]) for request in server.requests]
+        assert bodies == [[{'toTop': True, 'id': 104}, {'toTop': True, 'id': 103}],
+                          [{'siblingId': 100, 'id': 102}]]
+        # every request uses a single location
+        assert all(len({(row.get('toTop'), row.get('siblingId')) for row in body}) == 1 for body in bodies)
+
+    def test_blank_keys_are_left_alone(self):
+        sheet = make_sheet([(100, 'a', 1), (101, None, 2), (102, '', 3), (103, None, 4)])
+        patch = diff_sheet(sheet, [{'Key': 'a', 'Amount': 1}], 'Key', order=True)
+
+        assert not patch
+        with pytest.raises(ValueError):
+            diff_sheet(sheet, [{'Key': None, 'Amount': 5}], 'Key')
+
+    def test_invalid_input(self):
+        with pytest.raises(ValueError):
+            diff_sheet(SHEET, [{'Nope': 1}], 'Key')
+        with pytest.raises(ValueError):
+            diff_sheet(SHEET, [{'Key': 'a'}, {'Key': 'a'}], 'Key')
+
+    def test_apply_batches_requests(self):
+        patch = diff_sheet(SHEET, [{'Key': 'a', 'Amount': None}, {'Key': 'b', 'Amount': 2},
+                                   {'Key': 'c', 'Amount': 3}] + [{'Key': str(idx)} for idx in range(3)], 'Key')
+        with StubApiServer() as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            results = patch.apply(client, 1, batch_size=2)
+
+        assert [(request[0], request[1].split('?')[0]) for request in server.requests] == [
+            ('DELETE', '/sheets/1/rows'), ('PUT', '/sheets/1/rows'), ('POST', '/sheets/1/rows'),
+            ('POST', '/sheets/1/rows')]
+        assert len(results) == 4
+        assert json.loads(server.requests[1][3]) == [{'id': 100, 'cells': [{'columnId': 11, 'value': ''}]}]
+        assert [len(json.loads(request[3])) for request in server.requests[2:]] == [2, 1]
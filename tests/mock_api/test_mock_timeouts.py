@@ -0,0 +1,66 @@
+# pylint: disable=C0103,W0232
+
+import time
+
+import pytest
+
+import smartsheet
+from smartsheet.exceptions import DeadlineExceededError, UnexpectedRequestError
+
+from mock_api_test_helper import StubApiServer
+
+SHEET = (200, {}, {'id': 5, 'name': 'Plan'})
+RATE_LIMITED = (429, {'Retry-After': '5'}, {'errorCode': 4003, 'message': 'Rate limit exceeded.', 'refId': 'j'})
+
+
+def slow(seconds):
+    def respond(method, path):
+        time.sleep(seconds)
+        return SHEET
+    return respond
+
+
+class TestMockTimeouts(object):
+    def test_read_timeout(self):
+        with StubApiServer(slow(1)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, timeout=(1, 0.2))
+            start = time.time()
+            with pytest.raises(UnexpectedRequestError):
+                client.Sheets.get_sheet(5)
+            assert time.time() - start < 0.9
+
+    def test_operation_timeout_overrides_client(self):
+        with StubApiServer(slow(0.5)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, timeout=0.1,
+                                           operation_timeouts={'get_sheet': 2})
+            assert client.Sheets.get_sheet(5).name == 'Plan'
+            with pytest.raises(UnexpectedRequestError):
+                client.Sheets.get_sheet_version(5)
+
+    def test_deadline_caps_retries(self):
+        with StubApiServer([RATE_LIMITED, SHEET]) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, deadline=2)
+            start = time.time()
+            result = client.Sheets.get_sheet(5)
+
+        # waiting 5 seconds for the retry would end past the deadline
+        assert time.time() - start < 1
+        assert result.result.code == 4003
+        assert len(server.requests) == 1
+
+    def test_deadline_bounds_reads(self):
+        with StubApiServer(slow(1)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url, deadline=0.3)
+            with pytest.raises(DeadlineExceededError) as info:
+                client.Sheets.get_sheet(5)
+        assert info.value.operation_id == 'get_sheet'
+
+    def test_time_limit_spans_calls(self):
+        with StubApiServer(slow(0.3)) as server:
+            client = smartsheet.Smartsheet(access_token='abc123', api_base=server.url)
+            with client.time_limit(0.5):
+                client.Sheets.get_sheet(5)
+                with pytest.raises(DeadlineExceededError):
+                    client.Sheets.get_sheet(5)
+            # the limit ends with the block
+            assert client.Sheets.get_sheet(5).name == 'Plan'
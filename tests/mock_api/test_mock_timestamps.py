@@ -0,0 +1,49 @@
+# pylint: disable=C0103,W0232
+
+from datetime import datetime
+
+import pytest
+from dateutil.parser import parse
+from dateutil.tz import tzutc
+from smartsheet.models import Row
+from smartsheet.types import Timestamp, parse_timestamp
+
+
+class TestMockTimestamps(object):
+    @pytest.mark.parametrize('value', [
+        '2023-05-15T20:21:45Z',
+        '2023-05-15T20:21:45.123Z',
+        '2023-05-15T20:21:45.1234567Z',
+        '2023-05-15T20:21:45+00:00',
+        '2023-05-15T20:21:45-07:00',
+        '2023-05-15T20:21:45+0530',
+        '2023-05-15T20:21:45',
+        '2023-05-15',
+        'May 15 2023 8:21PM',
+    ])
+    def test_matches_dateutil(self, value):
+        expected = parse(value)
+        actual = parse_timestamp(value)
+        assert actual == expected
+        assert actual.utcoffset() == expected.utcoffset()
+
+    def test_deferred_conversion(self):
+        row = Row({'id': 1, 'createdAt': '2023-05-15T20:21:45Z'})
+        assert row._created_at._raw == '2023-05-15T20:21:45Z'
+        assert row.created_at == datetime(2023, 5, 15, 20, 21, 45, tzinfo=tzutc())
+        assert row._created_at._raw is None
+
+    def test_epoch_millis(self):
+        timestamp = Timestamp(1684182105123)
+        assert timestamp.value == datetime(2023, 5, 15, 20, 21, 45, 123000, tzinfo=tzutc())
+
+    def test_invalid_values_fail_on_assignment(self):
+        with pytest.raises(ValueError):
+            Timestamp('not a date')
+        with pytest.raises(ValueError):
+            Timestamp('2023-02-30T10:00:00Z')
+        with pytest.raises(ValueError):
+            Timestamp('2023-05-15T24:00:00Z')
+        assert Timestamp('2024-02-29T10:00:00Z')._raw == '2024-02-29T10:00:00Z'
+        with pytest.raises(ValueError):
+            Timestamp(True)